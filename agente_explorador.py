@@ -1,7 +1,8 @@
-import random
 import asyncio
-from typing import List, Tuple, Set, Optional, Dict
+from typing import List, Tuple, Set, Dict
 from collections import defaultdict
+from exploration_strategies import make_strategy
+from step_trace import BACK, MOVE, START, StepTrace
 
 class AgenteExplorador:
     """
@@ -14,7 +15,8 @@ class AgenteExplorador:
     - Directional graphs
     """
 
-    def __init__(self, labirinto, imprimir_passos_no_arquivo=False, nome_arquivo='saida_labirinto.txt'):
+    def __init__(self, labirinto, imprimir_passos_no_arquivo=False, nome_arquivo='saida_labirinto.jsonl',
+                 estrategia=None, seed=None):
         self.labirinto = labirinto
         self.posicao_atual = labirinto.entrada  # Initial position
         self.vertices_visitados: Set = set()
@@ -23,29 +25,35 @@ class AgenteExplorador:
         self.caminho_percorrido: List[Tuple[int, int, float]] = []  # Now stores (from_vertex, to_vertex, weight)
         self.pilha_caminho: List[int] = []  # Stack to simulate movement and backtracking
         self.pesos_caminhos: Dict[Tuple[int, int], float] = {}  # Stores weights between vertices
+        self.vizinhos_conhecidos: Dict[int, List[Tuple[int, float]]] = {}  # Adjacents of every visited vertex
+        self.pais: Dict[int, int] = {}  # Vertex each vertex was first reached from
         self.saida_encontrada = False
         self.saida = None  # Will be defined when exit is found
         self.passo = 0  # Step counter for display
         self.imprimir_passos_no_arquivo = imprimir_passos_no_arquivo
         self.nome_arquivo = nome_arquivo
+        # How the next step is chosen: an ExplorationStrategy or a name in exploration_strategies.STRATEGIES
+        # (random, lightest, tremaux, wall, frontier); seed makes the random ones reproducible
+        self.estrategia = make_strategy(estrategia, seed)
 
-        if self.imprimir_passos_no_arquivo:
-            self.arquivo = open(self.nome_arquivo, 'w', encoding='utf-8')
-        else:
-            self.arquivo = None
+        # Compact step trace (JSONL); replay_trace.py draws any step from it afterwards
+        self.trace = StepTrace(nome_arquivo, labirinto) if imprimir_passos_no_arquivo else None
 
     async def explorar(self):
         """
         Explores the maze using an iterative DFS approach with weighted paths.
         Supports directional movement and weighted edges.
+        The strategy picks among unvisited neighbours and may replace a backtracking step by a route
+        to any vertex that still has unvisited neighbours.
         """
         self.pilha_caminho.append(self.posicao_atual)
         self.vertices_visitados.add(self.posicao_atual)
         self.movimentos += 1
         self.passo += 1
+        self.estrategia.start(self)
 
-        if self.imprimir_passos_no_arquivo:
-            self._write_step_to_file()
+        if self.trace:
+            self.trace.step(None, self.posicao_atual, 0, START)
 
         while self.pilha_caminho:
             posicao_atual = self.pilha_caminho[-1]
@@ -57,10 +65,20 @@ class AgenteExplorador:
 
             # Get available neighbors with weights
             vizinhos = await self._get_vizinhos_com_peso(posicao_atual)
+            self.vizinhos_conhecidos[posicao_atual] = vizinhos
+
+            rota = self.estrategia.route(self, posicao_atual, vizinhos)
+            if rota is not None:
+                # The strategy walks by its own rules (Trémaux), into visited vertices too
+                if not rota:
+                    self.pilha_caminho.clear()
+                    continue
+                await self._seguir_rota(rota)
+                continue
+
             vizinhos_nao_visitados = [(v, w) for v, w in vizinhos if v not in self.vertices_visitados]
 
             if vizinhos_nao_visitados:
-                # Choose next step (can implement different strategies here)
                 proximo_vertice, peso = self._escolher_proximo_passo(vizinhos_nao_visitados)
 
                 # Move to next vertex
@@ -69,36 +87,76 @@ class AgenteExplorador:
                 # Update path information
                 self.pilha_caminho.append(proximo_vertice)
                 self.vertices_visitados.add(proximo_vertice)
-                self.caminho_percorrido.append((posicao_atual, proximo_vertice, peso))
+                self.pais[proximo_vertice] = posicao_atual
                 self.pesos_caminhos[(posicao_atual, proximo_vertice)] = peso
-                self.peso_total += peso
-                self.movimentos += 1
-                self.passo += 1
-
-                if self.imprimir_passos_no_arquivo:
-                    self._write_step_to_file()
-            else:
-                # Backtrack
-                vertice_atual = self.pilha_caminho.pop()
-                if self.pilha_caminho:
-                    vertice_anterior = self.pilha_caminho[-1]
-                    await self._mover_para(vertice_anterior)
-
-                    # Update path for backtracking
-                    peso_volta = self.pesos_caminhos.get((vertice_atual, vertice_anterior),
-                                                       self.pesos_caminhos.get((vertice_anterior, vertice_atual), 1))
-                    self.caminho_percorrido.append((vertice_atual, vertice_anterior, peso_volta))
-                    self.peso_total += peso_volta
-                    self.movimentos += 1
-                    self.passo += 1
-
-                    if self.imprimir_passos_no_arquivo:
-                        self._write_step_to_file()
+                self._registrar_movimento(posicao_atual, proximo_vertice, peso, MOVE)
+                continue
+
+            rota = self.estrategia.return_route(self, posicao_atual)
+            if rota is not None:
+                # Walk the strategy's route; the DFS stack becomes the discovery path of its target
+                if not rota:
+                    self.pilha_caminho.clear()
+                    continue
+                await self._seguir_rota(rota)
+                continue
+
+            # Backtrack
+            vertice_atual = self.pilha_caminho.pop()
+            if self.pilha_caminho:
+                vertice_anterior = self.pilha_caminho[-1]
+                await self._mover_para(vertice_anterior)
+
+                # Update path for backtracking
+                peso_volta = self.pesos_caminhos.get((vertice_atual, vertice_anterior),
+                                                   self.pesos_caminhos.get((vertice_anterior, vertice_atual), 1))
+                self._registrar_movimento(vertice_atual, vertice_anterior, peso_volta, BACK)
         else:
             self._handle_no_exit_found()
 
-        if self.imprimir_passos_no_arquivo and self.arquivo:
-            self.arquivo.close()
+        if self.trace:
+            caminho, peso_caminho = self.get_menor_caminho()
+            self.trace.result(exit_found=self.saida_encontrada, path=caminho, path_weight=peso_caminho,
+                              traversed_weight=self.peso_total, moves=self.movimentos)
+            self.trace.close()
+
+    def _registrar_movimento(self, origem, destino, peso: float, tipo: str) -> None:
+        """Bookkeeping shared by every move: traveled path, totals, trace and strategy"""
+        self.caminho_percorrido.append((origem, destino, peso))
+        self.peso_total += peso
+        self.movimentos += 1
+        self.passo += 1
+        self.estrategia.record(origem, destino, peso)
+        if self.trace:
+            self.trace.step(origem, destino, peso, tipo)
+
+    async def _seguir_rota(self, rota: List) -> None:
+        """
+        Walks a strategy's route. Unvisited vertices on it are discovered as usual; afterwards the
+        DFS stack is the discovery path of the route's last vertex.
+        """
+        for origem, destino in zip(rota, rota[1:]):
+            await self._mover_para(destino)
+            peso = dict(self.vizinhos_conhecidos[origem])[destino]
+            if destino in self.vertices_visitados:
+                self._registrar_movimento(origem, destino, peso, BACK)
+                continue
+            self.vertices_visitados.add(destino)
+            self.pais[destino] = origem
+            self.pesos_caminhos[(origem, destino)] = peso
+            self._registrar_movimento(origem, destino, peso, MOVE)
+        if len(rota) == 2 and self.pais.get(rota[-1]) == rota[0] and self.pilha_caminho[-1] == rota[0]:
+            self.pilha_caminho.append(rota[-1])
+        else:
+            self.pilha_caminho = self._caminho_ate(rota[-1])
+
+    def _caminho_ate(self, vertice) -> List:
+        """Discovery path from the entrance to vertice (the DFS stack when no route was taken)"""
+        caminho = [vertice]
+        while caminho[-1] in self.pais:
+            caminho.append(self.pais[caminho[-1]])
+        caminho.reverse()
+        return caminho
 
     async def _get_vizinhos_com_peso(self, vertice: int) -> List[Tuple[int, float]]:
         """
@@ -123,24 +181,10 @@ class AgenteExplorador:
 
     def _escolher_proximo_passo(self, vizinhos: List[Tuple[int, float]]) -> Tuple[int, float]:
         """
-        Strategy for choosing next step. Can be modified to implement different strategies.
-        Currently implements random choice but considers weights.
-        """
-        return random.choice(vizinhos)
-
-    def _write_step_to_file(self):
-        """
-        Writes the current step information to file
+        Chooses the next step among the unvisited neighbours through the exploration strategy
+        (random choice unless another one was given).
         """
-        self.arquivo.write(f"\nPasso {self.passo}:\n")
-        self.arquivo.write(f"Posição atual: {self.pilha_caminho[-1]}\n")
-        self.arquivo.write(f"Peso total do caminho: {self.peso_total}\n")
-        if hasattr(self.labirinto, 'exibir_labirinto'):
-            self.labirinto.exibir_labirinto(
-                agente_posicao=self.pilha_caminho[-1],
-                caminho_percorrido=[x[0] for x in self.caminho_percorrido],
-                arquivo=self.arquivo
-            )
+        return self.estrategia.choose(self, self.pilha_caminho[-1], vizinhos)
 
     def _handle_exit_found(self):
         """
@@ -150,12 +194,10 @@ class AgenteExplorador:
         self.saida = self.pilha_caminho[-1]
         message = (
             f"Exit found!\n"
-            f"Shortest path: {self.pilha_caminho}\n"
+            f"Shortest path: {self.get_menor_caminho()[0]}\n"
             f"Total weight: {self.peso_total}\n"
             f"Moves needed: {self.movimentos}"
         )
-        if self.imprimir_passos_no_arquivo:
-            self.arquivo.write(message)
         print(message)
 
     def _handle_no_exit_found(self):
@@ -163,8 +205,6 @@ class AgenteExplorador:
         Handles the case when no exit is found
         """
         message = "Could not find exit."
-        if self.imprimir_passos_no_arquivo:
-            self.arquivo.write(message)
         print(message)
 
     def get_caminho_percorrido(self) -> List[Tuple[int, int, float]]:
@@ -176,8 +216,9 @@ class AgenteExplorador:
 
     def get_menor_caminho(self) -> Tuple[List[int], float]:
         """
-        Returns the shortest path found to the exit and its total weight.
+        Returns the path found to the exit (the discovery path of the exit) and its total weight.
         """
         if self.saida_encontrada:
-            return self.pilha_caminho.copy(), self.peso_total
+            caminho = self._caminho_ate(self.saida)
+            return caminho, sum(self.pesos_caminhos[(a, b)] for a, b in zip(caminho, caminho[1:]))
         return [], 0.0
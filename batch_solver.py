@@ -0,0 +1,86 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from maze_graph import find_entrance, load_maze_definition
+from shortest_path import exit_vertices, shortest_path_to_exit
+
+DEFAULT_OUTPUT = os.path.join("results", "batch", "solutions.jsonl")
+
+def corpus_files(directory: str) -> List[str]:
+    """Every *.json maze definition of a directory, sorted by file name (like maze_corpus.load_corpus_dir)"""
+    return [os.path.join(directory, name) for name in sorted(os.listdir(directory)) if name.endswith(".json")]
+
+def solve_file(path: str) -> Dict[str, Any]:
+    """
+    Shortest path from the entrance to any exit of one "Criar Labirinto" file, with the semantics of
+    WebSocketMazeSolver.find_shortest_path over a fully explored maze. Errors are reported in the
+    result instead of raised, so one bad file does not stop a batch.
+    """
+    result: Dict[str, Any] = {"labirinto": os.path.splitext(os.path.basename(path))[0], "file": path}
+    start = time.perf_counter()
+    try:
+        graph = load_maze_definition(path)
+        entrada = find_entrance(graph)
+        exits = exit_vertices(graph)
+        result.update(vertices=len(graph), edges=sum(len(adjacents) for _, adjacents in graph.values()),
+                      entrada=entrada, exits=sorted(exits))
+        if entrada is None:
+            result["status"] = "no_entrance"
+        else:
+            path_found, weight = shortest_path_to_exit(graph, entrada, exits)
+            result.update(status="ok" if path_found else "no_path", path=path_found, path_weight=weight)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        result.update(status="error", error=f"{type(e).__name__}: {e}")
+    result["solve_time"] = time.perf_counter() - start
+    return result
+
+def solve_files(paths: Iterable[str], workers: Optional[int] = None, chunksize: int = 1) -> Iterator[Dict[str, Any]]:
+    """
+    Results in the order of paths, as soon as each is ready. Fans out over a process pool
+    (workers defaults to the CPU count); workers=1 solves in this process.
+    """
+    if workers == 1:
+        yield from map(solve_file, paths)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(solve_file, paths, chunksize=chunksize)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline shortest exit paths for a directory of maze JSON files")
+    parser.add_argument("directory", help="Directory of 'Criar Labirinto' JSON files (vertices/arestas)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (1 = no pool)")
+    parser.add_argument("--chunksize", type=int, default=1, help="Files handed to a worker at a time")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSONL file, one result per maze")
+    args = parser.parse_args(argv)
+
+    paths = corpus_files(args.directory)
+    if not paths:
+        print(f"❌ No maze files in {args.directory}")
+        return 1
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    print(f"\n🧮 Solving {len(paths)} mazes with {args.workers} workers")
+    counts: Dict[str, int] = {}
+    vertices = 0
+    start = time.perf_counter()
+    with open(args.output, 'w', encoding='utf-8') as f:
+        for result in solve_files(paths, args.workers, args.chunksize):
+            f.write(json.dumps(result, separators=(",", ":")) + "\n")
+            f.flush()
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+            vertices += result.get("vertices", 0)
+            if result["status"] != "ok":
+                print(f"⚠️ {result['labirinto']}: {result['status']} {result.get('error', '')}")
+    elapsed = time.perf_counter() - start
+
+    print(f"\n🏁 {counts.get('ok', 0)}/{len(paths)} solved in {elapsed:.2f}s: "
+          f"{len(paths) / elapsed:.1f} mazes/s, {vertices / elapsed:,.0f} vertices/s")
+    print(f"Results saved in: {args.output}")
+    return 0 if counts.get("ok", 0) == len(paths) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+import argparse
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from grid_pathfinding import SOLVERS, GridPath
+from labirinto import Labirinto
+
+def _time(solver, labirinto, repeat: int) -> Tuple[float, GridPath]:
+    best = float('infinity')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = solver(labirinto)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def run(sizes: List[int], seed: int, braid: float, repeat: int) -> List[Dict[str, Any]]:
+    results = []
+    for size in sizes:
+        size |= 1  # Labirinto grids have odd sides
+        labirinto = Labirinto(size, size, seed=seed, braid=braid)
+        labirinto.grade.mascaras  # Computed once per grid; not part of any solve
+        print(f"\n{size}x{size} grid, {labirinto.grade.total_abertas()} open cells (best of {repeat} runs)")
+        lengths = set()
+        for name, solver in SOLVERS.items():
+            elapsed, path = _time(solver, labirinto, repeat)
+            lengths.add(len(path.caminho))
+            results.append({"size": size, "solver": name, "time": elapsed, "path_length": len(path.caminho),
+                            "expanded": path.expandidos, "examined": path.examinados})
+            print(f"  {name:<18}: {elapsed * 1000:9.1f} ms  expanded={path.expandidos:<9} "
+                  f"examined={path.examinados:<9} path={len(path.caminho)}")
+        if len(lengths) != 1:
+            raise AssertionError(f"Path lengths differ on {size}x{size}: {sorted(lengths)}")
+    return results
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark of the Labirinto grid path-finding solvers")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[101, 301, 1001])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--braid", type=float, default=0.0, help="Fraction of dead ends opened (creates loops)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    print("\n📊 Grid path-finding benchmark")
+    results = run(args.sizes, args.seed, args.braid, args.repeat)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"settings": vars(args), "results": results}, f, indent=2)
+        print(f"\nResults saved in: {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
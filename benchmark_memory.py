@@ -0,0 +1,80 @@
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, List, Tuple
+from benchmark_parser import legacy_parse_server_message
+from exploration_frontier import FrontierIndex
+from graph_store import GraphStore
+from incremental_sssp import IncrementalShortestPaths
+from local_maze_server import format_vertex_message
+from maze_corpus import generate_maze_graph
+from server_message import parse_server_message
+
+def build_messages(size: int, seed: int) -> List[str]:
+    """The messages a full exploration of a corpus maze receives, one per vertex"""
+    graph = generate_maze_graph(size, seed=seed)
+    return [format_vertex_message(vertex, tipo, adjacents) for vertex, (tipo, adjacents) in graph.items()]
+
+def _allocated(build: Callable[[], object]) -> Tuple[int, object]:
+    """Bytes still allocated by build() once it returns, and what it built (kept alive while measuring)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, built
+
+def build_dict(messages: List[str]) -> dict:
+    # What the client kept before GraphStore: vertex -> (tipo, [(destino, peso), ...])
+    graph = {}
+    for message in messages:
+        vertex, vertex_type, adjacents = legacy_parse_server_message(message)
+        graph[vertex] = (vertex_type, adjacents)
+    return graph
+
+def build_store(messages: List[str]) -> GraphStore:
+    store = GraphStore()
+    for message in messages:
+        parse_server_message(message, store)
+    return store
+
+def build_frontier(store: GraphStore) -> FrontierIndex:
+    frontier = FrontierIndex(store.destinations)
+    for vertex in store:
+        frontier.mark_visited(vertex)
+    return frontier
+
+def build_shortest_paths(store: GraphStore) -> IncrementalShortestPaths:
+    shortest_paths = IncrementalShortestPaths(next(iter(store)), store.edges)
+    for vertex in store:
+        shortest_paths.add_vertex(vertex)
+    return shortest_paths
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory per edge of the explored graph: plain dict vs GraphStore")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 40_000, 160_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print("\n📊 Explored graph memory (bytes per edge)")
+    for size in args.sizes:
+        messages = build_messages(size, args.seed)
+        dict_bytes, graph = _allocated(lambda: build_dict(messages))
+        store_bytes, store = _allocated(lambda: build_store(messages))
+        if dict(store.items()) != graph:
+            raise AssertionError("GraphStore and dict disagree")
+        del graph
+        frontier_bytes, _ = _allocated(lambda: build_frontier(store))
+        sssp_bytes, _ = _allocated(lambda: build_shortest_paths(store))
+
+        edges = store.edge_count
+        print(f"\n{len(store)} vertices, {edges} edges")
+        print(f"  dict              : {dict_bytes / edges:8.1f} B/edge")
+        print(f"  store (traced)    : {store_bytes / edges:8.1f} B/edge  ({dict_bytes / store_bytes:.1f}x)")
+        print(f"  store (nbytes)    : {store.nbytes / edges:8.1f} B/edge")
+        print(f"  frontier index    : {frontier_bytes / edges:8.1f} B/edge")
+        print(f"  shortest paths    : {sssp_bytes / edges:8.1f} B/edge")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import argparse
+import random
+import re
+import time
+from typing import Callable, List, Tuple
+from graph_store import GraphStore
+from local_maze_server import format_vertex_message
+from server_message import parse_server_message
+
+def legacy_parse_server_message(message: str) -> Tuple[int, str, List[Tuple[int, float]]]:
+    """The previous WebSocketLabirinto.parse_server_message + _remove_duplicate_edges, without the async"""
+    pattern = r"Vértice atual: (\d+), Tipo: (\d+|normal|saida|entrada), Adjacentes\(Vertice, Peso\): \[(.*?)\]"
+    match = re.match(pattern, message)
+    if not match:
+        raise ValueError(f"Invalid message format: {message}")
+    adjacents = []
+    if match.group(3):
+        adj_pattern = r"\((\d+),\s*(\d+(?:\.\d+)?)\)"
+        adjacents = [(int(v), float(w)) for v, w in re.findall(adj_pattern, match.group(3))]
+    seen = {}
+    for dest, weight in adjacents:
+        if dest not in seen or weight < seen[dest]:
+            seen[dest] = weight
+    return int(match.group(1)), match.group(2), [(dest, weight) for dest, weight in seen.items()]
+
+def build_messages(count: int, degree: int, duplicate_ratio: float, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    messages = []
+    for vertex in range(count):
+        adjacents = [(rng.randrange(count * degree), rng.randint(1, 20)) for _ in range(degree)]
+        for _ in range(int(degree * duplicate_ratio)):
+            dest, _ = rng.choice(adjacents)
+            adjacents.append((dest, rng.randint(1, 20)))
+        messages.append(format_vertex_message(vertex, "0", adjacents))
+    return messages
+
+def _rate(make_parse: Callable[[], Callable[[str], object]], messages: List[str], repeat: int) -> float:
+    """Best messages/second over repeat passes; make_parse builds a fresh parse function per pass"""
+    best = float('infinity')
+    for _ in range(repeat):
+        parse = make_parse()
+        start = time.perf_counter()
+        for message in messages:
+            parse(message)
+        best = min(best, time.perf_counter() - start)
+    return len(messages) / best
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput of the server message parser (messages/second)")
+    parser.add_argument("--degrees", type=int, nargs="+", default=[4, 100, 10_000, 100_000],
+                        help="Adjacents per message")
+    parser.add_argument("--edges", type=int, default=400_000, help="Approximate edges parsed per pass")
+    parser.add_argument("--duplicates", type=float, default=0.1, help="Extra duplicate edges per message")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"\n📊 Server message parser throughput (best of {args.repeat} runs)")
+    for degree in args.degrees:
+        messages = build_messages(max(1, args.edges // degree), degree, args.duplicates, args.seed)
+        for message in messages:
+            if legacy_parse_server_message(message) != parse_server_message(message):
+                raise AssertionError(f"Parsers disagree on: {message[:80]}...")
+
+        legacy = _rate(lambda: legacy_parse_server_message, messages, args.repeat)
+        fast = _rate(lambda: parse_server_message, messages, args.repeat)
+
+        def make_legacy_stored_parse():
+            # What the client did before GraphStore: parse, then keep the tuple in a plain dict
+            graph = {}
+            def parse(message):
+                vertex, vertex_type, adjacents = legacy_parse_server_message(message)
+                graph[vertex] = (vertex_type, adjacents)
+            return parse
+        legacy_stored = _rate(make_legacy_stored_parse, messages, args.repeat)
+
+        def make_stored_parse():
+            store = GraphStore()
+            return lambda message: parse_server_message(message, store)
+        stored = _rate(make_stored_parse, messages, args.repeat)
+
+        print(f"\n{len(messages)} messages of {degree} adjacents")
+        print(f"  legacy          : {legacy:12.0f} msg/s")
+        print(f"  scanner         : {fast:12.0f} msg/s  ({fast / legacy:.1f}x)")
+        print(f"  legacy + dict   : {legacy_stored:12.0f} msg/s")
+        print(f"  scanner + store : {stored:12.0f} msg/s  ({stored / legacy_stored:.1f}x)")
+
+if __name__ == "__main__":
+    main()
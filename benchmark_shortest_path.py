@@ -0,0 +1,87 @@
+import argparse
+import heapq
+import time
+from typing import Callable, List, Tuple
+from maze_corpus import generate_maze_graph
+from maze_graph import MazeGraph, find_entrance
+from shortest_path import dial_to_exits, dijkstra_to_exits, exit_vertices
+from vertex_type import VertexType
+
+def legacy_find_shortest_path(graph: MazeGraph, start: int) -> Tuple[List[int], float]:
+    """The previous WebSocketMazeSolver.find_shortest_path: path copies in the heap, eh_saida per pop"""
+    def eh_saida(vertex_id):
+        if vertex_id in graph:
+            vertex_type, _ = graph[vertex_id]
+            return VertexType.from_value(vertex_type) == VertexType.SAIDA
+        return False
+
+    distances = {vertex: float('infinity') for vertex in graph.keys()}
+    distances[start] = 0
+    pq = [(0, start, [start])]
+    visited = set()
+    exit_paths = []
+    min_exit_distance = float('infinity')
+
+    while pq:
+        current_distance, current_vertex, current_path = heapq.heappop(pq)
+        if current_distance > min_exit_distance:
+            continue
+        if current_vertex in visited:
+            continue
+        visited.add(current_vertex)
+        if eh_saida(current_vertex):
+            exit_paths.append((current_path, current_distance))
+            min_exit_distance = min(min_exit_distance, current_distance)
+            continue
+        _, adjacents = graph[current_vertex]
+        for next_vertex, weight in adjacents:
+            if next_vertex not in visited:
+                new_distance = current_distance + weight
+                if new_distance >= min_exit_distance:
+                    continue
+                if new_distance < distances[next_vertex]:
+                    distances[next_vertex] = new_distance
+                    heapq.heappush(pq, (new_distance, next_vertex, current_path + [next_vertex]))
+
+    if exit_paths:
+        exit_paths.sort(key=lambda x: x[1])
+        return exit_paths[0]
+    return [], 0.0
+
+def _time(function: Callable[[], Tuple[List[int], float]], repeat: int) -> Tuple[float, Tuple[List[int], float]]:
+    best = float('infinity')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmark of the exit shortest-path engines")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 250_000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--exits", type=int, default=1, help="Exits per maze (fewer exits = longer searches)")
+    args = parser.parse_args()
+
+    print("\n📊 Shortest path micro-benchmark (best of {} runs)".format(args.repeat))
+    for size in args.sizes:
+        graph = generate_maze_graph(size, seed=args.seed, num_exits=args.exits)
+        start = find_entrance(graph)
+        exits = exit_vertices(graph)
+
+        legacy_time, (_, legacy_weight) = _time(lambda: legacy_find_shortest_path(graph, start), args.repeat)
+        heap_time, (_, heap_weight) = _time(lambda: dijkstra_to_exits(graph, start, exits), args.repeat)
+        dial_time, (path, dial_weight) = _time(lambda: dial_to_exits(graph, start, exits), args.repeat)
+
+        if not legacy_weight == heap_weight == dial_weight:
+            raise AssertionError(f"Weights differ: {legacy_weight}, {heap_weight}, {dial_weight}")
+
+        print(f"\n{len(graph)} vertices, path of {len(path)} vertices, weight {dial_weight}")
+        print(f"  legacy   : {legacy_time * 1000:9.1f} ms")
+        print(f"  dijkstra : {heap_time * 1000:9.1f} ms  ({legacy_time / heap_time:.1f}x)")
+        print(f"  dial     : {dial_time * 1000:9.1f} ms  ({legacy_time / dial_time:.1f}x)")
+
+if __name__ == "__main__":
+    main()
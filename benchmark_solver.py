@@ -0,0 +1,230 @@
+import argparse
+import asyncio
+import contextlib
+import heapq
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from config import MazeConfig
+from local_maze_server import LocalMazeServer, MazeSession, local_connector, one_way_edges, walkable_graph
+from maze_corpus import DEFAULT_SIZES, build_corpus, load_corpus_dir
+from maze_graph import MazeGraph, find_entrance, find_exits
+from move_log import LogLevel
+from websocket_maze_client import WebSocketMazeSolver
+
+# Metrics compared against a baseline run (higher is worse for all of them)
+REGRESSION_METRICS = ("moves", "traversed_weight", "cpu_time", "wall_time", "optimality_ratio")
+
+class ServerThread:
+    """
+    Runs a LocalMazeServer on its own event loop in a background thread,
+    so time.thread_time() in the caller measures only the solver's CPU.
+    """
+    def __init__(self, **server_kwargs):
+        self.server_kwargs = server_kwargs
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.server: Optional[LocalMazeServer] = None
+
+    def __enter__(self) -> LocalMazeServer:
+        self.thread.start()
+        self.server = LocalMazeServer(**self.server_kwargs)
+        asyncio.run_coroutine_threadsafe(self.server.start(), self.loop).result()
+        return self.server
+
+    def __exit__(self, *exc) -> None:
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+def optimal_exit_path(graph: MazeGraph, start: int) -> Tuple[List[int], float]:
+    """Reference shortest path to any exit over the full graph (ground truth for optimality)"""
+    exits = find_exits(graph)
+    distances = {start: 0.0}
+    parents = {start: None}
+    heap = [(0.0, start)]
+    while heap:
+        distance, vertex = heapq.heappop(heap)
+        if distance > distances[vertex]:
+            continue
+        if vertex in exits:
+            path = []
+            while vertex is not None:
+                path.append(vertex)
+                vertex = parents[vertex]
+            return path[::-1], distance
+        for dest, weight in graph[vertex][1]:
+            new_distance = distance + weight
+            if new_distance < distances.get(dest, float('infinity')):
+                distances[dest] = new_distance
+                parents[dest] = vertex
+                heapq.heappush(heap, (new_distance, dest))
+    return [], 0.0
+
+async def _solve(url: str, name: str, solver_kwargs: Dict[str, Any]) -> WebSocketMazeSolver:
+    solver = WebSocketMazeSolver(MazeConfig("benchmark", name, url), visualize=False, log_level=LogLevel.SILENT,
+                                 **solver_kwargs)
+    await solver.explore()
+    return solver
+
+def run_maze(name: str,
+             graph: MazeGraph,
+             latency: float = 0.0,
+             jitter: float = 0.0,
+             timeout: Optional[float] = None,
+             solver_kwargs: Optional[Dict[str, Any]] = None,
+             in_process: bool = False,
+             one_way: float = 0.0) -> Dict[str, Any]:
+    """
+    Solves one maze against a local server and returns its metrics.
+    in_process skips the server and its sockets (LocalMazeConnection), leaving only solver time;
+    latency and jitter do not apply then. one_way refuses that fraction of two-way edges in one
+    direction while the server keeps advertising them; the optimum is then taken without them.
+    """
+    result: Dict[str, Any] = {
+        "maze": name,
+        "vertices": len(graph),
+        "edges": sum(len(adjacents) for _, adjacents in graph.values()),
+    }
+    blocked = one_way_edges(graph, one_way, seed=0)
+    _, optimal_weight = optimal_exit_path(walkable_graph(graph, blocked), find_entrance(graph))
+    result["optimal_weight"] = optimal_weight
+
+    solver_kwargs = dict(solver_kwargs or {})
+    with contextlib.ExitStack() as stack:
+        if in_process:
+            sessions: List[MazeSession] = []
+            url = "local://"
+            solver_kwargs["connect"] = local_connector(graph, sessions, blocked)
+        else:
+            server = stack.enter_context(ServerThread(graph=graph, latency=latency, jitter=jitter,
+                                                      one_way=one_way, seed=0))
+            sessions, url = server.sessions, server.url
+        solver = None
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                solver = asyncio.run(asyncio.wait_for(_solve(url, name, solver_kwargs), timeout))
+            result["status"] = "ok"
+        except asyncio.TimeoutError:
+            result["status"] = "timeout"
+        result["cpu_time"] = time.thread_time() - cpu_start
+        result["wall_time"] = time.perf_counter() - wall_start
+        session = sessions[0] if sessions else None
+
+    if solver is not None and solver.labirinto is not None:
+        labirinto = solver.labirinto
+        path, path_weight = solver.path, solver.path_weight
+        result.update({
+            "moves": labirinto.move_count,
+            "invalid_moves": labirinto.invalid_moves,
+            "traversed_weight": labirinto.total_weight,
+            "explored_vertices": len(labirinto.visited_states),
+            "path_length": len(path),
+            "path_weight": path_weight,
+            "optimality_ratio": path_weight / optimal_weight if path and optimal_weight else None,
+            "budget_exhausted": solver.budget_exhausted,
+        })
+    if session is not None:
+        result["round_trips"] = session.moves + session.invalid_moves
+    return result
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare_with_baseline(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Returns one message per metric that got worse than baseline by more than tolerance"""
+    previous = {r["maze"]: r for r in baseline.get("results", [])}
+    regressions = []
+    for current in report["results"]:
+        before = previous.get(current["maze"])
+        if not before:
+            continue
+        if before.get("status") == "ok" and current.get("status") != "ok":
+            regressions.append(f"{current['maze']}: status {current.get('status')}")
+            continue
+        for metric in REGRESSION_METRICS:
+            old, new = before.get(metric), current.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + tolerance):
+                regressions.append(f"{current['maze']}: {metric} {old:.4g} -> {new:.4g}")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="End-to-end benchmark of the WebSocket maze solver")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Vertex counts of the generated corpus")
+    parser.add_argument("--corpus", help="Directory of maze JSON files to use instead of generated mazes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="Server latency per message in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--planner", choices=WebSocketMazeSolver.PLANNERS, default="dfs",
+                        help="Exploration planner of the solver")
+    parser.add_argument("--early-stop", action="store_true",
+                        help="Stop exploring once the best exit path is proven optimal")
+    parser.add_argument("--pipeline", type=int, default=1,
+                        help="Moves in flight when walking known routes (1 = lock-step)")
+    parser.add_argument("--in-process", action="store_true",
+                        help="Solve through an in-process connection instead of a WebSocket server")
+    parser.add_argument("--move-budget", type=int, help="Stop exploring after this many moves (best path so far)")
+    parser.add_argument("--time-budget", type=float, help="Stop exploring after this many seconds (best path so far)")
+    parser.add_argument("--one-way", type=float, default=0.0,
+                        help="Fraction of two-way edges the server refuses in one direction but still advertises")
+    parser.add_argument("--timeout", type=float, default=None, help="Give up on a maze after this many seconds")
+    parser.add_argument("--output", default=os.path.join("results", "benchmarks", "solver.json"))
+    parser.add_argument("--baseline", help="Previous JSON report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed relative regression")
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus_dir(args.corpus) if args.corpus else build_corpus(args.sizes, seed=args.seed)
+
+    report: Dict[str, Any] = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "settings": {"planner": args.planner, "early_stop": args.early_stop, "pipeline": args.pipeline, "latency": args.latency, "jitter": args.jitter, "in_process": args.in_process, "seed": args.seed, "timeout": args.timeout, "move_budget": args.move_budget, "time_budget": args.time_budget, "one_way": args.one_way},
+        "results": [],
+    }
+
+    print("\n📊 Solver benchmark")
+    for name, graph in corpus:
+        result = run_maze(name, graph, args.latency, args.jitter, args.timeout,
+                          solver_kwargs={"planner": args.planner, "early_stop": args.early_stop,
+                                         "pipeline": args.pipeline, "move_budget": args.move_budget,
+                                         "time_budget": args.time_budget},
+                          in_process=args.in_process, one_way=args.one_way)
+        report["results"].append(result)
+        print(f"{name:>24}: {result['status']:>7}  moves={result.get('moves')}  "
+              f"weight={result.get('traversed_weight')}  invalid={result.get('invalid_moves')}  cpu={result['cpu_time']:.2f}s  "
+              f"wall={result['wall_time']:.2f}s  ratio={result.get('optimality_ratio')}")
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved in: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare_with_baseline(report, json.load(f), args.tolerance)
+        for message in regressions:
+            print(f"⚠️ Regression: {message}")
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import statistics
+from typing import Any, Dict, List, Optional, Tuple
+from agente_explorador import AgenteExplorador
+from exploration_strategies import STRATEGIES
+from labirinto import Labirinto
+from maze_graph import LabirintoGrafo
+
+def build_corpus(sizes: List[int], seeds: int, braid: float, peso_maximo: Optional[int]) -> List[Tuple[str, LabirintoGrafo]]:
+    """Seeded Labirinto grids seen as vertex graphs, the same mazes for every strategy"""
+    corpus = []
+    for size in sizes:
+        size |= 1
+        for seed in range(seeds):
+            labirinto = Labirinto(size, size, seed=seed, braid=braid, peso_maximo=peso_maximo)
+            corpus.append((f"grid_{size}_s{seed}", LabirintoGrafo(labirinto)))
+    return corpus
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+def describe(values: List[float]) -> Dict[str, float]:
+    return {"mean": statistics.fmean(values), "p50": percentile(values, 0.5), "p90": percentile(values, 0.9),
+            "p99": percentile(values, 0.99), "max": max(values)}
+
+def evaluate(corpus: List[Tuple[str, LabirintoGrafo]], strategies: List[str], seed: int = 0) -> Dict[str, Any]:
+    """Runs every strategy over every maze; per-strategy movimentos/peso_total statistics and per-maze runs"""
+    report: Dict[str, Any] = {}
+    for name in strategies:
+        runs = []
+        for maze, grafo in corpus:
+            agente = AgenteExplorador(grafo, estrategia=name, seed=seed)
+            with contextlib.redirect_stdout(io.StringIO()):
+                asyncio.run(agente.explorar())
+            runs.append({"maze": maze, "exit_found": agente.saida_encontrada, "movimentos": agente.movimentos,
+                         "peso_total": agente.peso_total, "path_weight": agente.get_menor_caminho()[1]})
+        report[name] = {
+            "solved": sum(run["exit_found"] for run in runs),
+            "movimentos": describe([run["movimentos"] for run in runs]),
+            "peso_total": describe([run["peso_total"] for run in runs]),
+            "runs": runs,
+        }
+    return report
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare AgenteExplorador strategies over a seeded maze corpus")
+    parser.add_argument("--strategies", nargs="+", choices=sorted(STRATEGIES), default=list(STRATEGIES))
+    parser.add_argument("--sizes", type=int, nargs="+", default=[21, 41, 81])
+    parser.add_argument("--seeds", type=int, default=20, help="Mazes per size")
+    parser.add_argument("--braid", type=float, default=0.3, help="Fraction of dead ends opened (creates loops)")
+    parser.add_argument("--peso-maximo", type=int, default=9, help="Cell weights from 1 to this (0 = unweighted)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random strategies")
+    parser.add_argument("--output", help="Also write the report (with every run) to this JSON file")
+    args = parser.parse_args(argv)
+
+    corpus = build_corpus(args.sizes, args.seeds, args.braid, args.peso_maximo or None)
+    report = evaluate(corpus, args.strategies, args.seed)
+
+    print(f"\n📊 Exploration strategies over {len(corpus)} mazes")
+    print(f"{'strategy':>10}  {'solved':>7}  {'moves mean':>10} {'p90':>7} {'p99':>7}  "
+          f"{'weight mean':>11} {'p90':>8} {'p99':>8}")
+    for name, result in sorted(report.items(), key=lambda item: item[1]["peso_total"]["mean"]):
+        moves, weight = result["movimentos"], result["peso_total"]
+        print(f"{name:>10}  {result['solved']:>3}/{len(corpus):<3}  {moves['mean']:>10.1f} {moves['p90']:>7.0f} "
+              f"{moves['p99']:>7.0f}  {weight['mean']:>11.1f} {weight['p90']:>8.0f} {weight['p99']:>8.0f}")
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"settings": vars(args), "strategies": report}, f, indent=2)
+        print(f"\nResults saved in: {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,95 @@
+import heapq
+from typing import Dict
+
+class ExitPathBound:
+    """
+    Branch-and-bound over the explored graph.
+    Once an exit is known, the best exit path found so far is an upper bound. Any shorter path has to
+    leave the explored region through an edge (u, x) from a visited vertex to an open one, so
+    dist(start, u) + w(u, x) is a lower bound for everything behind that edge. Edges whose bound can't
+    beat the best exit path are pruned, and exploration can stop as soon as none is left.
+    """
+    def __init__(self, labirinto, start: int, refresh_ratio: float = 0.1):
+        self.labirinto = labirinto
+        self.start = start
+        self.refresh_ratio = refresh_ratio  # Recompute after the known graph grows by this fraction
+        self.distances: Dict[int, float] = {}
+        self.upper_bound = float('infinity')
+        self.lower_bound = 0.0
+        self.refreshes = 0
+        self._known_exits = 0
+        self._visited_at_refresh = 0
+
+    @property
+    def _dirty(self) -> bool:
+        return len(self.labirinto.frontier.visited) != self._visited_at_refresh
+
+    def _stale(self) -> bool:
+        if len(self.labirinto.exits) != self._known_exits:
+            return True
+        grown = len(self.labirinto.frontier.visited) - self._visited_at_refresh
+        return grown > max(16, self._visited_at_refresh * self.refresh_ratio)
+
+    def refresh(self) -> bool:
+        """Recomputes distances and bounds. Returns False when nothing changed since the last refresh."""
+        if not self.labirinto.exits or (not self._dirty and len(self.labirinto.exits) == self._known_exits):
+            return False
+
+        graph = self.labirinto.visited_states
+        frontier = self.labirinto.frontier
+        shortest_paths = getattr(self.labirinto, "shortest_paths", None)
+        if shortest_paths is not None and shortest_paths.source == self.start:
+            # Kept up to date on every move; only the frontier scan below is left to do
+            distances = shortest_paths.distances
+        else:
+            distances = self._dijkstra(graph, frontier)
+
+        self.distances = distances
+        self.upper_bound = min((distances.get(e, float('infinity')) for e in self.labirinto.exits),
+                               default=float('infinity'))
+        self.lower_bound = float('infinity')
+        for vertex in frontier.frontier:
+            if vertex not in distances:
+                continue
+            for dest, weight in graph.edges(vertex):
+                if dest not in frontier.visited:
+                    self.lower_bound = min(self.lower_bound, distances[vertex] + weight)
+
+        self.refreshes += 1
+        self._known_exits = len(self.labirinto.exits)
+        self._visited_at_refresh = len(frontier.visited)
+        return True
+
+    def invalidate(self) -> None:
+        """Forces a refresh on the next proven(); needed when an edge is dropped and distances grow"""
+        self._visited_at_refresh = -1
+
+    def _dijkstra(self, graph, frontier) -> Dict[int, float]:
+        distances: Dict[int, float] = {self.start: 0.0}
+        heap = [(0.0, self.start)]
+        while heap:
+            distance, vertex = heapq.heappop(heap)
+            if distance > distances[vertex]:
+                continue
+            for dest, weight in graph.edges(vertex):
+                new_distance = distance + weight
+                if dest in frontier.visited and new_distance < distances.get(dest, float('infinity')):
+                    distances[dest] = new_distance
+                    heapq.heappush(heap, (new_distance, dest))
+        return distances
+
+    def is_promising(self, vertex: int, dest: int, weight: float) -> bool:
+        """Whether moving from a visited vertex into an open one could still lead to a shorter exit path"""
+        distance = self.distances.get(vertex)
+        if distance is None:
+            # Not reached by the last refresh (or no exit known yet): nothing to prune with
+            return True
+        return distance + weight < self.upper_bound
+
+    def proven(self) -> bool:
+        """True when no open edge can produce an exit path shorter than the best known one"""
+        if not self.labirinto.exits:
+            return False
+        if self._stale():
+            self.refresh()
+        return not self._dirty and self.lower_bound >= self.upper_bound
@@ -0,0 +1,44 @@
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+# Bump when the snapshot layout changes; checkpoints with another version are ignored
+CHECKPOINT_VERSION = 1
+
+def default_checkpoint_path(labirinto_id: str) -> str:
+    """Next to the other per-maze outputs in ./results/maze_{id}/"""
+    return os.path.join(".", "results", f"maze_{labirinto_id}", "checkpoint.json")
+
+def save_checkpoint(path: str, grupo_id: str, labirinto_id: str, snapshot: Dict[str, Any]) -> None:
+    """Writes a WebSocketLabirinto snapshot atomically: a crash mid-write leaves the previous checkpoint"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    checkpoint = {
+        "version": CHECKPOINT_VERSION,
+        "grupo_id": str(grupo_id),
+        "labirinto_id": str(labirinto_id),
+        "saved_at": time.time(),
+        "state": snapshot,
+    }
+    temporary = f"{path}.tmp"
+    with open(temporary, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f, separators=(",", ":"))
+    os.replace(temporary, path)
+
+def load_checkpoint(path: str, grupo_id: str, labirinto_id: str) -> Optional[Dict[str, Any]]:
+    """The snapshot saved for this maze, or None if there is no usable checkpoint"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (checkpoint.get("version") != CHECKPOINT_VERSION or checkpoint.get("grupo_id") != str(grupo_id)
+            or checkpoint.get("labirinto_id") != str(labirinto_id)):
+        return None
+    return checkpoint["state"]
+
+def remove_checkpoint(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,98 @@
+from collections import defaultdict, deque
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# vertex -> destinations of a visited vertex's edges, e.g. GraphStore.destinations
+DestinationReader = Callable[[int], Iterable[int]]
+
+class FrontierIndex:
+    """
+    Live index of the explored part of the maze.
+    Keeps the set of visited vertices that still have unvisited adjacents (refused edges dropped),
+    updated incrementally every time a move reveals a vertex, so finding the next target never
+    rescans the whole known graph. Edges are read through destinations (the graph store) instead
+    of being copied here, so visits and refused edges must be recorded in the store first.
+    """
+    def __init__(self, destinations: DestinationReader):
+        self.destinations = destinations
+        self.visited: Set[int] = set()
+        self.frontier: Set[int] = set()
+        self._open_count: Dict[int, int] = {}  # visited vertex -> number of open adjacents
+        self._advertised_by: Dict[int, List[int]] = defaultdict(list)  # open vertex -> visited vertices listing it
+
+    def mark_visited(self, vertex: int) -> None:
+        """Records a vertex reached by a move, once the store holds the adjacents the server reported"""
+        if vertex in self.visited:
+            return
+        self.visited.add(vertex)
+        self._close(vertex)
+
+        open_count = 0
+        for dest in self.destinations(vertex):
+            if dest not in self.visited:
+                open_count += 1
+                self._advertised_by[dest].append(vertex)
+        self._open_count[vertex] = open_count
+        if open_count:
+            self.frontier.add(vertex)
+
+    def mark_rejected(self, origin: int, dest: int) -> None:
+        """
+        Records an advertised edge the server refused to walk. Only that edge is dropped: dest stays
+        open from any other visited vertex that lists it, and routes stop using origin -> dest.
+        """
+        advertisers = self._advertised_by.get(dest)
+        if advertisers is not None and origin in advertisers:
+            advertisers.remove(origin)
+            if not advertisers:
+                del self._advertised_by[dest]
+            self._open_count[origin] -= 1
+            if not self._open_count[origin]:
+                self.frontier.discard(origin)
+
+    def _close(self, vertex: int) -> None:
+        # vertex stopped being a target: update every frontier vertex that was waiting on it
+        for origin in self._advertised_by.pop(vertex, ()):
+            self._open_count[origin] -= 1
+            if not self._open_count[origin]:
+                self.frontier.discard(origin)
+
+    def open_adjacents(self, vertex: int) -> List[int]:
+        """Adjacents of a visited vertex that are still worth moving into, in server order"""
+        if vertex not in self.frontier:
+            return []
+        return [dest for dest in self.destinations(vertex) if dest not in self.visited]
+
+    def nearest(self, start: int, accept: Optional[Callable[[int], bool]] = None) -> Tuple[Optional[int], List[int]]:
+        """
+        Nearest frontier vertex (in hops over known edges) and the route to it, starting at start.
+        BFS with parent pointers that stops at the first frontier vertex, so the cost is bounded by
+        the part of the graph closer than the target. accept can reject frontier vertices.
+        """
+        if not self.frontier or start not in self.visited:
+            return None, []
+        if start in self.frontier and (accept is None or accept(start)):
+            return start, [start]
+
+        parents: Dict[int, Optional[int]] = {start: None}
+        queue = deque([start])
+        while queue:
+            vertex = queue.popleft()
+            for dest in self.destinations(vertex):
+                if dest in parents or dest not in self.visited:
+                    continue
+                parents[dest] = vertex
+                if dest in self.frontier and (accept is None or accept(dest)):
+                    return dest, self._route(parents, dest)
+                queue.append(dest)
+
+        return None, []
+
+    @staticmethod
+    def _route(parents: Dict[int, Optional[int]], target: int) -> List[int]:
+        route = []
+        vertex: Optional[int] = target
+        while vertex is not None:
+            route.append(vertex)
+            vertex = parents[vertex]
+        route.reverse()
+        return route
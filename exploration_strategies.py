@@ -0,0 +1,210 @@
+import heapq
+import random
+from typing import Dict, List, Optional, Tuple
+
+# (vertex, weight) candidates offered to a strategy: the unvisited neighbours of the current vertex
+Candidate = Tuple[object, float]
+
+class ExplorationStrategy:
+    """
+    How AgenteExplorador picks its next step.
+    choose() picks among the unvisited neighbours of the current vertex; return_route() decides where to
+    go once there are none (None = step back along the DFS stack); record() sees every move made.
+    A strategy that walks by its own rules instead of the agent's DFS overrides route().
+    """
+    name = "base"
+
+    def start(self, agente) -> None:
+        """Called once before the exploration starts"""
+
+    def choose(self, agente, vertice, candidatos: List[Candidate]) -> Candidate:
+        raise NotImplementedError
+
+    def record(self, origem, destino, peso: float) -> None:
+        """Called after every move, forward or back"""
+
+    def return_route(self, agente, vertice) -> Optional[List]:
+        """Route [vertice, ..., target] to a vertex with unvisited neighbours, or None to backtrack one step"""
+        return None
+
+    def route(self, agente, vertice, vizinhos: List[Candidate]) -> Optional[List]:
+        """
+        Takes over the whole step: route [vertice, ..., target] over any neighbours, visited or not,
+        [] to stop exploring, or None to leave it to choose()/return_route() (the default).
+        """
+        return None
+
+class RandomStrategy(ExplorationStrategy):
+    """The original behaviour: uniformly random unvisited neighbour"""
+    name = "random"
+
+    def __init__(self, seed: Optional[int] = None):
+        self.random = random.Random(seed) if seed is not None else random
+
+    def choose(self, agente, vertice, candidatos: List[Candidate]) -> Candidate:
+        return self.random.choice(candidatos)
+
+class LightestEdgeStrategy(ExplorationStrategy):
+    """Cheapest edge first (the first one in adjacency order on ties)"""
+    name = "lightest"
+
+    def choose(self, agente, vertice, candidatos: List[Candidate]) -> Candidate:
+        return min(candidatos, key=lambda candidato: candidato[1])
+
+class TremauxStrategy(ExplorationStrategy):
+    """
+    Trémaux's rule, which needs no visited set, only marks on passages (walked edges, either direction):
+    every passage gets a mark each time it is walked and a passage marked twice is closed. Arriving at
+    an already entered vertex through a fresh passage, it turns back along that passage; otherwise it
+    takes an unmarked passage (at random) if there is one, else returns along the passage the vertex
+    was first entered through. Unlike the DFS strategies it does walk into visited vertices, which
+    costs moves but makes it terminate on any maze walked passage by passage.
+    """
+    name = "tremaux"
+
+    def __init__(self, seed: Optional[int] = None):
+        self.random = random.Random(seed)
+        self.marks: Dict[Tuple, int] = {}
+        self.entrada: Dict = {}  # Vertex -> neighbour it was first entered from
+        self.ultimo: Optional[Tuple] = None  # Last move (origem, destino)
+        self.revisita = False  # Whether the last move entered an already entered vertex
+
+    def start(self, agente) -> None:
+        self.marks.clear()
+        self.entrada = {agente.posicao_atual: None}
+        self.ultimo = None
+        self.revisita = False
+
+    @staticmethod
+    def _passage(a, b) -> Tuple:
+        return (a, b) if repr(a) <= repr(b) else (b, a)
+
+    def choose(self, agente, vertice, candidatos: List[Candidate]) -> Candidate:
+        return self.random.choice(candidatos)
+
+    def route(self, agente, vertice, vizinhos: List[Candidate]) -> Optional[List]:
+        marks = self.marks
+        abertas = {v for v, _ in vizinhos if marks.get(self._passage(vertice, v), 0) < 2}
+        veio_de = self.ultimo[0] if self.ultimo and self.ultimo[1] == vertice else None
+        if self.revisita and veio_de in abertas and marks[self._passage(veio_de, vertice)] == 1:
+            return [vertice, veio_de]
+
+        livres = [v for v in abertas if not marks.get(self._passage(vertice, v), 0)]
+        if livres:
+            # Sorted so the seeded choice doesn't depend on set order
+            return [vertice, self.random.choice(sorted(livres, key=repr))]
+        volta = self.entrada.get(vertice)
+        if volta in abertas:
+            return [vertice, volta]
+        return []  # Every passage here is closed: back at the entrance, the maze is exhausted
+
+    def record(self, origem, destino, peso: float) -> None:
+        passage = self._passage(origem, destino)
+        self.marks[passage] = self.marks.get(passage, 0) + 1
+        self.revisita = destino in self.entrada
+        if not self.revisita:
+            self.entrada[destino] = origem
+        self.ultimo = (origem, destino)
+
+class WallFollowerStrategy(ExplorationStrategy):
+    """
+    Wall following for grid mazes: relative to the direction of the last move, turn to the hand side
+    first, then straight, then the other side. Needs cell coordinates: vertices that are (x, y) cells
+    (Labirinto) or ids of a grid with a known width (LabirintoGrafo); otherwise the first candidate wins.
+    """
+    name = "wall"
+
+    def __init__(self, hand: str = "left"):
+        if hand not in ("left", "right"):
+            raise ValueError("hand must be 'left' or 'right'")
+        self.hand = hand
+        self.heading: Optional[Tuple[int, int]] = None
+        self.largura: Optional[int] = None
+
+    def start(self, agente) -> None:
+        grade = getattr(agente.labirinto, "labirinto", None)
+        self.largura = getattr(grade, "largura", None)
+        self.heading = (0, -1)
+
+    def _cell(self, vertice) -> Optional[Tuple[int, int]]:
+        if isinstance(vertice, tuple):
+            return vertice
+        if self.largura:
+            return vertice % self.largura, vertice // self.largura
+        return None
+
+    def _direction(self, origem, destino) -> Optional[Tuple[int, int]]:
+        a, b = self._cell(origem), self._cell(destino)
+        if a is None or b is None:
+            return None
+        return b[0] - a[0], b[1] - a[1]
+
+    def choose(self, agente, vertice, candidatos: List[Candidate]) -> Candidate:
+        dx, dy = self.heading or (0, -1)
+        # Screen coordinates (y grows downwards): left of (dx, dy) is (dy, -dx)
+        side = (dy, -dx) if self.hand == "left" else (-dy, dx)
+        preference = [side, (dx, dy), (-side[0], -side[1]), (-dx, -dy)]
+
+        def rank(candidato: Candidate) -> int:
+            direction = self._direction(vertice, candidato[0])
+            return preference.index(direction) if direction in preference else len(preference)
+        return min(candidatos, key=rank)
+
+    def record(self, origem, destino, peso: float) -> None:
+        direction = self._direction(origem, destino)
+        if direction is not None:
+            self.heading = direction
+
+class FrontierGreedyStrategy(ExplorationStrategy):
+    """
+    Greedy on the distance to the frontier: takes the lightest unvisited neighbour, and at dead ends
+    walks the cheapest known route to the nearest vertex that still has unvisited neighbours instead of
+    unwinding the DFS stack one step at a time, which on mazes with loops is often much shorter.
+    """
+    name = "frontier"
+
+    def choose(self, agente, vertice, candidatos: List[Candidate]) -> Candidate:
+        return min(candidatos, key=lambda candidato: candidato[1])
+
+    def return_route(self, agente, vertice) -> Optional[List]:
+        known = agente.vizinhos_conhecidos
+        visited = agente.vertices_visitados
+        distances = {vertice: 0.0}
+        parents: Dict = {}
+        heap = [(0.0, 0, vertice)]
+        counter = 1
+        while heap:
+            distance, _, current = heapq.heappop(heap)
+            if distance > distances[current]:
+                continue
+            if current != vertice and any(v not in visited for v, _ in known.get(current, ())):
+                route = [current]
+                while route[-1] in parents:
+                    route.append(parents[route[-1]])
+                return route[::-1]
+            for dest, weight in known.get(current, ()):
+                if dest not in visited:
+                    continue
+                new_distance = distance + weight
+                if new_distance < distances.get(dest, float('infinity')):
+                    distances[dest] = new_distance
+                    parents[dest] = current
+                    heapq.heappush(heap, (new_distance, counter, dest))
+                    counter += 1
+        return []
+
+STRATEGIES = {
+    strategy.name: strategy
+    for strategy in (RandomStrategy, LightestEdgeStrategy, TremauxStrategy, WallFollowerStrategy,
+                     FrontierGreedyStrategy)
+}
+
+def make_strategy(strategy, seed: Optional[int] = None) -> ExplorationStrategy:
+    """Strategy instance from an instance, a name in STRATEGIES or None (random)"""
+    if isinstance(strategy, ExplorationStrategy):
+        return strategy
+    name = strategy or RandomStrategy.name
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown exploration strategy: {name}")
+    cls = STRATEGIES[name]
+    return cls(seed) if cls in (RandomStrategy, TremauxStrategy) else cls()
@@ -0,0 +1,126 @@
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+# (cost from current, open vertex, visited vertex it is entered from, weight of that entry edge)
+Candidate = Tuple[float, int, int, float]
+
+class WeightedFrontierPlanner:
+    """
+    Weight-aware exploration planner.
+    Goes deeper through the lightest unvisited adjacent while there is one. At a dead end, instead of
+    backtracking by hop count, it runs a Dijkstra over the known graph to the cheapest open vertices
+    (unvisited, over edges the server hasn't refused). With lookahead, it orders the `candidates` cheapest of them as a short
+    tour and commits to the first leg of the cheapest tour, so nearby branches are finished before
+    crossing the maze. An ExitPathBound, when given, prunes open vertices that can't improve the best exit path.
+    """
+    def __init__(self, labirinto, candidates: int = 2, lookahead: bool = True, bound=None):
+        self.labirinto = labirinto
+        self.bound = bound
+        self.candidates = max(1, candidates)
+        self.lookahead = lookahead
+
+    def _search(self, source: int, limit: int = 1, targets: Optional[set] = None
+                ) -> Tuple[Dict[int, float], Dict[int, Optional[int]], Dict[int, Tuple[float, int, float]]]:
+        """
+        Dijkstra from source over visited vertices.
+        Stops once the `limit` cheapest open vertices are final or, when targets is given,
+        once every vertex in targets is settled.
+        """
+        graph = self.labirinto.visited_states
+        frontier = self.labirinto.frontier
+        distances: Dict[int, float] = {source: 0.0}
+        parents: Dict[int, Optional[int]] = {source: None}
+        open_vertices: Dict[int, Tuple[float, int, float]] = {}  # open vertex -> (cost, entered from, weight)
+        bound = float('infinity')
+        pending = set(targets) if targets else None
+        heap = [(0.0, source)]
+
+        while heap:
+            distance, vertex = heapq.heappop(heap)
+            if distance > distances[vertex]:
+                continue
+            if pending is not None:
+                pending.discard(vertex)
+                if not pending:
+                    break
+            elif distance >= bound:
+                break
+
+            for dest, weight in graph.edges(vertex):
+                new_distance = distance + weight
+                if dest in frontier.visited:
+                    if new_distance < distances.get(dest, float('infinity')):
+                        distances[dest] = new_distance
+                        parents[dest] = vertex
+                        heapq.heappush(heap, (new_distance, dest))
+                elif self.bound is None or self.bound.is_promising(vertex, dest, weight):
+                    if dest not in open_vertices or new_distance < open_vertices[dest][0]:
+                        open_vertices[dest] = (new_distance, vertex, weight)
+                        if pending is None and len(open_vertices) >= limit:
+                            bound = heapq.nsmallest(limit, (entry[0] for entry in open_vertices.values()))[-1]
+
+        return distances, parents, open_vertices
+
+    def _tour_cost(self, start: Candidate, others: List[Candidate], legs: Dict[Tuple[int, int], float]) -> float:
+        """Cost of a nearest-neighbour tour that begins at start and visits every other candidate"""
+        total = start[0]
+        position = start
+        remaining = list(others)
+        while remaining:
+            leg, nearest = min((legs[(position[1], candidate[1])], candidate) for candidate in remaining)
+            total += leg
+            position = nearest
+            remaining.remove(nearest)
+        return total
+
+    def _leg_costs(self, candidates: List[Candidate]) -> Dict[Tuple[int, int], float]:
+        """
+        Estimated cost of exploring one candidate right after another: the known distance between the
+        vertices they are entered from, plus the edge into the second one.
+        """
+        legs: Dict[Tuple[int, int], float] = {}
+        entries = {via for _, _, via, _ in candidates}
+        for _, vertex, via, _ in candidates:
+            distances, _, _ = self._search(via, targets=entries)
+            for _, other, other_via, entry_weight in candidates:
+                if other != vertex:
+                    legs[(vertex, other)] = distances.get(other_via, float('infinity')) + entry_weight
+        return legs
+
+    def next_route(self, current: int) -> List[int]:
+        """
+        Route from current to the next vertex to explore (the last vertex of the route is unvisited).
+        Returns an empty list when there is nothing left to explore.
+        """
+        # Keep going deeper while the current vertex has open adjacents, taking the lightest edge:
+        # every other branch here has to be returned to anyway
+        open_here = set(self.labirinto.frontier.open_adjacents(current))
+        if self.bound is not None:
+            open_here = {dest for dest, weight in self.labirinto.visited_states.edges(current)
+                         if dest in open_here and self.bound.is_promising(current, dest, weight)}
+        if open_here:
+            _, target = min((weight, dest) for dest, weight in self.labirinto.visited_states.edges(current)
+                            if dest in open_here)
+            return [current, target]
+
+        limit = self.candidates if self.lookahead else 1
+        distances, parents, open_vertices = self._search(current, limit)
+        if not open_vertices:
+            return []
+
+        candidates = sorted((cost, vertex, via, weight)
+                            for vertex, (cost, via, weight) in open_vertices.items())[:limit]
+        chosen = candidates[0]
+        if len(candidates) > 1:
+            legs = self._leg_costs(candidates)
+            chosen = min(candidates,
+                         key=lambda c: (self._tour_cost(c, [o for o in candidates if o is not c], legs), c[0]))
+
+        _, target, via, _ = chosen
+        route = [target]
+        vertex: Optional[int] = via
+        while vertex is not None:
+            route.append(vertex)
+            vertex = parents[vertex]
+        route.reverse()
+        return route
@@ -0,0 +1,228 @@
+from array import array
+from collections.abc import Mapping
+from typing import Collection, Dict, Iterator, List, Optional, Tuple
+from vertex_type import VertexType
+
+# Small-int type codes
+TYPE_CODES = {VertexType.NORMAL: 0, VertexType.ENTRADA: 1, VertexType.SAIDA: 2}
+TYPE_NAMES = [VertexType.NORMAL.value, VertexType.ENTRADA.value, VertexType.SAIDA.value]
+
+# Vertex ids below this are indexed through a flat array, larger ones through a dict
+DENSE_ID_LIMIT = 1 << 24
+
+_TYPE_CODE_CACHE: Dict[str, int] = {}
+
+def _type_code(vertex_type) -> int:
+    code = _TYPE_CODE_CACHE.get(vertex_type)
+    if code is None:
+        code = _TYPE_CODE_CACHE[vertex_type] = TYPE_CODES[VertexType.from_value(vertex_type)]
+    return code
+
+class VertexIndex:
+    """
+    Vertex id -> dense index. Server ids are small consecutive integers, so they live in a flat
+    array('i') (-1 = absent); ids that are negative or huge fall back to a dict.
+    """
+    def __init__(self, dense: Optional[array] = None, sparse: Optional[Dict[int, int]] = None):
+        self.dense = dense if dense is not None else array('i')
+        self.sparse = sparse if sparse is not None else {}
+
+    def get(self, vertex_id: int) -> Optional[int]:
+        if 0 <= vertex_id < len(self.dense):
+            index = self.dense[vertex_id]
+            return index if index >= 0 else None
+        return self.sparse.get(vertex_id)
+
+    def set(self, vertex_id: int, index: int) -> None:
+        if 0 <= vertex_id < DENSE_ID_LIMIT:
+            if vertex_id >= len(self.dense):
+                grow = max(vertex_id + 1 - len(self.dense), len(self.dense) // 8, 64)
+                self.dense.extend(array('i', [-1]) * grow)
+            self.dense[vertex_id] = index
+        else:
+            self.sparse[vertex_id] = index
+
+    def copy(self) -> "VertexIndex":
+        return VertexIndex(array('i', self.dense), dict(self.sparse))
+
+class GraphStore(Mapping):
+    """
+    Compact, append-as-you-discover store for the explored maze graph.
+    Visited vertices get a dense index, in visit order; adjacency is kept in flat `array`s (destination
+    id + weight per edge) and vertex types as small-int codes. Destinations are kept as ids rather than
+    dense indices so recording a vertex never has to intern its adjacents.
+    Behaves like the Dict[int, Tuple[str, List[Tuple[int, float]]]] it replaces: store[v] = (tipo, adjacents)
+    records a visited vertex and store[v] returns the same tuple, so existing readers keep working.
+    """
+    def __init__(self):
+        self._index = VertexIndex()
+        self._ids = array('q')        # dense index -> vertex id
+        self._types = bytearray()     # dense index -> type code
+        self._offsets = array('i')    # dense index -> first edge
+        self._degrees = array('i')    # dense index -> number of edges
+        self._targets = array('q')    # edge -> destination vertex id
+        self._weights = array('d')    # edge -> weight
+
+    def add_vertex(self, vertex_id: int, vertex_type, adjacents: List[Tuple[int, float]]) -> None:
+        """Records a visited vertex with the adjacency the server reported for it"""
+        if adjacents:
+            dests, weights = zip(*adjacents)
+            self.add_edges(vertex_id, vertex_type, dests, weights)
+        else:
+            self.add_edges(vertex_id, vertex_type, (), ())
+
+    def add_edges(self, vertex_id: int, vertex_type, dests: Collection[int], weights: Collection[float]) -> None:
+        """
+        add_vertex with the adjacency as parallel dests/weights (e.g. the keys and values of the
+        parser's dict), appended to the flat arrays without building a tuple per edge.
+        """
+        code = _TYPE_CODE_CACHE.get(vertex_type)
+        if code is None:
+            code = _type_code(vertex_type)
+        vertex_index = self._index
+        dense = vertex_index.dense
+        in_dense = 0 <= vertex_id < len(dense)
+        index = dense[vertex_id] if in_dense else vertex_index.sparse.get(vertex_id, -1)
+        targets = self._targets
+        if index < 0:
+            # First visit, the common case: append the vertex with its edge range in one go
+            ids = self._ids
+            index = len(ids)
+            if in_dense:
+                dense[vertex_id] = index
+            else:
+                vertex_index.set(vertex_id, index)
+            ids.append(vertex_id)
+            self._types.append(code)
+            self._offsets.append(len(targets))
+            self._degrees.append(len(dests))
+            targets.extend(dests)
+            self._weights.extend(weights)
+            return
+
+        # Revisits report the same vertex; only rewrite it if it actually changed
+        start, degree = self._offsets[index], len(dests)
+        end = start + self._degrees[index]
+        if (self._types[index] == code and targets[start:end] == array('q', dests)
+                and self._weights[start:end] == array('d', weights)):
+            return
+
+        self._types[index] = code
+        if degree <= self._degrees[index]:
+            # Rewrites (an edge the server refused dropped) shrink the adjacency: reuse its range
+            targets[start:start + degree] = array('q', dests)
+            self._weights[start:start + degree] = array('d', weights)
+        else:
+            self._offsets[index] = len(targets)
+            targets.extend(dests)
+            self._weights.extend(weights)
+        self._degrees[index] = degree
+
+    def __setitem__(self, vertex_id: int, state: Tuple[str, List[Tuple[int, float]]]) -> None:
+        self.add_vertex(vertex_id, state[0], state[1])
+
+    def _adjacents(self, index: int) -> List[Tuple[int, float]]:
+        start = self._offsets[index]
+        end = start + self._degrees[index]
+        return list(zip(self._targets[start:end], self._weights[start:end]))
+
+    def __getitem__(self, vertex_id: int) -> Tuple[str, List[Tuple[int, float]]]:
+        index = self._index.get(vertex_id)
+        if index is None:
+            raise KeyError(vertex_id)
+        return TYPE_NAMES[self._types[index]], self._adjacents(index)
+
+    def edges(self, vertex_id: int) -> Iterator[Tuple[int, float]]:
+        """
+        (dest, weight) pairs of a vertex read straight from the flat arrays, without building the list
+        store[v] returns; for the solvers' inner loops. Only the two array slices are allocated.
+        """
+        dense = self._index.dense
+        index = dense[vertex_id] if 0 <= vertex_id < len(dense) else self._index.sparse.get(vertex_id, -1)
+        if index < 0:
+            raise KeyError(vertex_id)
+        start = self._offsets[index]
+        end = start + self._degrees[index]
+        return zip(self._targets[start:end], self._weights[start:end])
+
+    def destinations(self, vertex_id: int) -> array:
+        """Destination ids of a vertex's edges, as one array slice; for readers that ignore weights"""
+        dense = self._index.dense
+        index = dense[vertex_id] if 0 <= vertex_id < len(dense) else self._index.sparse.get(vertex_id, -1)
+        if index < 0:
+            raise KeyError(vertex_id)
+        start = self._offsets[index]
+        return self._targets[start:start + self._degrees[index]]
+
+    def __contains__(self, vertex_id) -> bool:
+        return self._index.get(vertex_id) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Edges currently reachable from some vertex (not the slots left behind by rewrites)"""
+        return sum(self._degrees)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the flat arrays"""
+        arrays = (self._index.dense, self._ids, self._offsets, self._degrees, self._targets, self._weights)
+        return sum(a.itemsize * len(a) for a in arrays) + len(self._types)
+
+    def freeze(self) -> "FrozenGraph":
+        """Read-only snapshot for the solvers; copies the flat arrays, so it costs no per-edge Python work"""
+        return FrozenGraph(self._index.copy(), array('q', self._ids), bytes(self._types), array('i', self._offsets),
+                           array('i', self._degrees), array('q', self._targets), array('d', self._weights))
+
+class FrozenGraph(Mapping):
+    """
+    Immutable CSR-style view of a GraphStore: edges of dense vertex i are
+    targets/weights[starts[i]:starts[i] + degrees[i]], targets holding destination vertex ids.
+    Exposes read-only memoryviews for array-level solvers and the same mapping interface as GraphStore.
+    """
+    def __init__(self, index: VertexIndex, ids: array, types: bytes, starts: array, degrees: array,
+                 targets: array, weights: array):
+        self.index = index
+        self.ids = memoryview(ids).toreadonly()
+        self.types = types
+        self.starts = memoryview(starts).toreadonly()
+        self.degrees = memoryview(degrees).toreadonly()
+        self.targets = memoryview(targets).toreadonly()
+        self.weights = memoryview(weights).toreadonly()
+        # Slicing the arrays themselves is cheaper than going through the memoryviews
+        self._ids, self._starts, self._degrees, self._targets, self._weights = ids, starts, degrees, targets, weights
+
+    def dense_index(self, vertex_id: int) -> Optional[int]:
+        return self.index.get(vertex_id)
+
+    def __getitem__(self, vertex_id: int) -> Tuple[str, List[Tuple[int, float]]]:
+        index = self.index.get(vertex_id)
+        if index is None:
+            raise KeyError(vertex_id)
+        start = self._starts[index]
+        end = start + self._degrees[index]
+        return TYPE_NAMES[self.types[index]], list(zip(self._targets[start:end], self._weights[start:end]))
+
+    def edges(self, vertex_id: int) -> Iterator[Tuple[int, float]]:
+        """Same as GraphStore.edges"""
+        dense = self.index.dense
+        index = dense[vertex_id] if 0 <= vertex_id < len(dense) else self.index.sparse.get(vertex_id, -1)
+        if index < 0:
+            raise KeyError(vertex_id)
+        start = self._starts[index]
+        end = start + self._degrees[index]
+        return zip(self._targets[start:end], self._weights[start:end])
+
+    def __contains__(self, vertex_id) -> bool:
+        return self.index.get(vertex_id) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
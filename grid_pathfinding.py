@@ -0,0 +1,230 @@
+import heapq
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from maze_grid import ABERTA, DIRECOES_POR_MASCARA
+
+Cell = Tuple[int, int]
+
+class GridPath(NamedTuple):
+    caminho: List[Cell]  # (x, y) cells from entrada to saida, as exibir_labirinto(menor_caminho=...) expects
+    custo: float         # Sum of the cost of entering every cell after the first (Labirinto.peso)
+    expandidos: int      # Nodes taken from the open list / queue
+    examinados: int      # Cells looked at, including those scanned while jumping (JPS)
+
+NO_PATH = GridPath([], 0.0, 0, 0)
+
+def _endpoints(labirinto, inicio: Optional[Cell], fim: Optional[Cell]) -> Tuple[int, int, int]:
+    largura = labirinto.largura
+    x0, y0 = inicio if inicio is not None else labirinto.entrada
+    x1, y1 = fim if fim is not None else labirinto.saida
+    return largura, y0 * largura + x0, y1 * largura + x1
+
+def _offsets(largura: int) -> List[Tuple[int, ...]]:
+    """Index offsets of the open neighbours for every neighbour mask, in obter_vizinhos order"""
+    return [tuple(dy * largura + dx for dx, dy in direcoes) for direcoes in DIRECOES_POR_MASCARA]
+
+def _cells(indices: List[int], largura: int) -> List[Cell]:
+    return [(i % largura, i // largura) for i in indices]
+
+def _cost(labirinto, indices: List[int]) -> float:
+    pesos = labirinto.pesos
+    if pesos is None:
+        return float(len(indices) - 1)
+    return float(sum(pesos[i] for i in indices[1:]))
+
+def _walk_back(parents: Dict[int, int], target: int) -> List[int]:
+    path = [target]
+    while path[-1] in parents:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
+
+def astar(labirinto, inicio: Optional[Cell] = None, fim: Optional[Cell] = None) -> GridPath:
+    """
+    A* with the Manhattan heuristic over the Labirinto grid, honouring cell weights (every weight is
+    at least 1, so the heuristic stays admissible). Ties go to the deeper node, which on mazes with
+    many equal-f nodes keeps the search close to a single corridor.
+    """
+    largura, start, goal = _endpoints(labirinto, inicio, fim)
+    mascaras = labirinto.grade.mascaras
+    offsets = _offsets(largura)
+    pesos = labirinto.pesos
+    gx, gy = goal % largura, goal // largura
+
+    distances = {start: 0}
+    parents: Dict[int, int] = {}
+    heap = [(abs(start % largura - gx) + abs(start // largura - gy), 0, start)]
+    expanded = examined = 0
+    while heap:
+        _, negative_g, vertex = heapq.heappop(heap)
+        g = -negative_g
+        if g > distances[vertex]:
+            continue
+        expanded += 1
+        if vertex == goal:
+            path = _walk_back(parents, goal)
+            return GridPath(_cells(path, largura), float(g), expanded, examined)
+        for offset in offsets[mascaras[vertex]]:
+            neighbour = vertex + offset
+            examined += 1
+            new_g = g + (pesos[neighbour] if pesos is not None else 1)
+            if new_g < distances.get(neighbour, new_g + 1):
+                distances[neighbour] = new_g
+                parents[neighbour] = vertex
+                h = abs(neighbour % largura - gx) + abs(neighbour // largura - gy)
+                heapq.heappush(heap, (new_g + h, -new_g, neighbour))
+    return NO_PATH
+
+def bidirectional_bfs(labirinto, inicio: Optional[Cell] = None, fim: Optional[Cell] = None) -> GridPath:
+    """
+    Breadth-first search from both ends, always growing the smaller frontier by one whole layer.
+    Finds the path with the fewest moves; cell weights are ignored by the search but counted in custo.
+    """
+    largura, start, goal = _endpoints(labirinto, inicio, fim)
+    if start == goal:
+        return GridPath(_cells([start], largura), 0.0, 0, 0)
+    mascaras = labirinto.grade.mascaras
+    offsets = _offsets(largura)
+
+    parents = ({start: -1}, {goal: -1})
+    depths: Tuple[Dict[int, int], Dict[int, int]] = ({start: 0}, {goal: 0})
+    frontiers = ([start], [goal])
+    expanded = examined = 0
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        mine, other = parents[side], parents[1 - side]
+        depth = depths[1 - side]
+        next_layer = []
+        meeting = None
+        best = None
+        for vertex in frontiers[side]:
+            expanded += 1
+            for offset in offsets[mascaras[vertex]]:
+                neighbour = vertex + offset
+                examined += 1
+                if neighbour in other:
+                    # The other side may have reached it in an earlier layer: keep the shortest meeting
+                    length = depth.get(neighbour, 0)
+                    if best is None or length < best:
+                        best, meeting = length, (vertex, neighbour)
+                if neighbour in mine:
+                    continue
+                mine[neighbour] = vertex
+                depths[side][neighbour] = depths[side][vertex] + 1
+                next_layer.append(neighbour)
+        if meeting is not None:
+            near, far = meeting
+            if side == 1:
+                near, far = far, near
+            forward, backward = parents
+            path = []
+            vertex = near
+            while vertex != -1:
+                path.append(vertex)
+                vertex = forward[vertex]
+            path.reverse()
+            vertex = far
+            while vertex != -1:
+                path.append(vertex)
+                vertex = backward[vertex]
+            return GridPath(_cells(path, largura), _cost(labirinto, path), expanded, examined)
+        frontiers = (next_layer, frontiers[1]) if side == 0 else (frontiers[0], next_layer)
+    return NO_PATH
+
+def jump_point_search(labirinto, inicio: Optional[Cell] = None, fim: Optional[Cell] = None) -> GridPath:
+    """
+    Jump Point Search for 4-connected grids. Canonical paths take vertical moves before horizontal
+    ones: a horizontal jump runs until the goal, a wall, or a cell with a forced vertical neighbour
+    (open above or below while the cell behind it is closed); a vertical jump stops at cells from which
+    a horizontal jump finds something. Only jump points enter the open list, which A* orders by the
+    Manhattan distance. Like bidirectional_bfs, it minimises moves and ignores cell weights.
+    """
+    largura, start, goal = _endpoints(labirinto, inicio, fim)
+    celulas = labirinto.grade.celulas
+    total = len(celulas)
+    gx, gy = goal % largura, goal // largura
+    examined = 0
+
+    def open_cell(index: int) -> bool:
+        return 0 <= index < total and celulas[index] == ABERTA
+
+    def jump_horizontal(index: int, dx: int) -> Optional[int]:
+        nonlocal examined
+        while True:
+            x = index % largura + dx
+            if not 0 <= x < largura or celulas[index + dx] != ABERTA:
+                return None
+            index += dx
+            examined += 1
+            if index == goal:
+                return index
+            behind = index - dx
+            for dy in (-largura, largura):
+                if open_cell(index + dy) and not open_cell(behind + dy):
+                    return index
+
+    def jump_vertical(index: int, dy: int) -> Optional[int]:
+        nonlocal examined
+        while True:
+            if not open_cell(index + dy):
+                return None
+            index += dy
+            examined += 1
+            if index == goal:
+                return index
+            if jump_horizontal(index, 1) is not None or jump_horizontal(index, -1) is not None:
+                return index
+
+    def successors(index: int, direction: Optional[int]) -> List[Tuple[int, int]]:
+        """(jump point, step) pairs reachable from index when it was entered moving by direction"""
+        if direction is None:
+            steps = (-1, 1, -largura, largura)
+        elif direction in (1, -1):
+            # Horizontal: keep going, plus the forced vertical neighbours
+            behind = index - direction
+            steps = [direction] + [dy for dy in (-largura, largura)
+                                   if open_cell(index + dy) and not open_cell(behind + dy)]
+        else:
+            # Vertical: keep going or turn horizontally
+            steps = (direction, -1, 1)
+        found = []
+        for step in steps:
+            point = jump_horizontal(index, step) if step in (1, -1) else jump_vertical(index, step)
+            if point is not None:
+                found.append((point, step))
+        return found
+
+    distances = {start: 0}
+    parents: Dict[int, int] = {}
+    heap = [(abs(start % largura - gx) + abs(start // largura - gy), 0, start, None)]
+    expanded = 0
+    while heap:
+        _, negative_g, vertex, direction = heapq.heappop(heap)
+        g = -negative_g
+        if g > distances[vertex]:
+            continue
+        expanded += 1
+        if vertex == goal:
+            path = _fill(_walk_back(parents, goal), largura)
+            return GridPath(_cells(path, largura), _cost(labirinto, path), expanded, examined)
+        for point, step in successors(vertex, direction):
+            new_g = g + abs(point - vertex) // abs(step)
+            if new_g < distances.get(point, new_g + 1):
+                distances[point] = new_g
+                parents[point] = vertex
+                h = abs(point % largura - gx) + abs(point // largura - gy)
+                heapq.heappush(heap, (new_g + h, -new_g, point, step))
+    return NO_PATH
+
+def _fill(jump_points: List[int], largura: int) -> List[int]:
+    """Every cell between consecutive jump points (always on the same row or column)"""
+    path = jump_points[:1]
+    for a, b in zip(jump_points, jump_points[1:]):
+        step = (1 if b > a else -1) * (1 if a // largura == b // largura else largura)
+        path.extend(range(a + step, b + step, step))
+    return path
+
+SOLVERS = {
+    "astar": astar,
+    "bidirectional_bfs": bidirectional_bfs,
+    "jps": jump_point_search,
+}
@@ -0,0 +1,178 @@
+import heapq
+from array import array
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# vertex -> (dest, weight) pairs of a visited vertex, e.g. GraphStore.edges
+EdgeReader = Callable[[int], Iterable[Tuple[int, float]]]
+
+class IncrementalShortestPaths:
+    """
+    Live shortest-path tree from the vertex the exploration started at, over every edge seen so far.
+    A visit only adds edges, so it can only lower distances: it relaxes the new vertex's edges and
+    propagates the improvements with a Dijkstra limited to the vertices whose distance actually dropped,
+    instead of recomputing from scratch. A refused edge (remove_edge) raises distances, but only in the
+    subtree below it, which is recomputed. Unvisited adjacents get tentative distances too, so an exit
+    path (or the distance to any frontier vertex) is known at every step.
+    Edges are read through edges (the graph store) rather than copied, so visits and refused edges
+    must be recorded in the store first.
+    """
+    def __init__(self, source: int, edges: EdgeReader):
+        self.source = source
+        self.edges = edges
+        self.visited: Set[int] = set()
+        self.distances: Dict[int, float] = {source: 0.0}
+        self.parents: Dict[int, int] = {}
+        # Reverse edges, only needed to re-seed a subtree after remove_edge, so built on its first call:
+        # a linked list per destination over flat arrays (head entry, then origin and next entry per edge)
+        self._incoming_head: Optional[Dict[int, int]] = None
+        self._incoming_origin = array('q')
+        self._incoming_next = array('i')
+        self.exits: Set[int] = set()
+        self.best_exit: Optional[int] = None
+        self.best_cost = float('infinity')
+        self.relaxations = 0  # Distance decreases, i.e. the work done so far
+
+    def add_vertex(self, vertex: int, is_exit: bool = False) -> None:
+        """Records a visited vertex, once the store holds its outgoing edges; visiting it again changes nothing"""
+        if is_exit:
+            self.add_exit(vertex)
+        if vertex in self.visited:
+            return
+        self.visited.add(vertex)
+        if self._incoming_head is not None:
+            self._link_incoming(vertex)
+        distance = self.distances.get(vertex)
+        if distance is None:
+            # Not reachable from the source yet; an edge into it later propagates through these
+            return
+        self._propagate([(distance, vertex)])
+
+    def add_exit(self, vertex: int) -> None:
+        if vertex in self.exits:
+            return
+        self.exits.add(vertex)
+        self._offer(vertex, self.distances.get(vertex, float('infinity')))
+
+    def remove_edge(self, origin: int, dest: int) -> None:
+        """
+        Drops an edge the server refused to walk. Distances can only grow, and only below dest in the
+        tree: that subtree loses its distances, which are re-seeded from the edges entering it from
+        outside and propagated again, so the rest of the tree is left untouched.
+        """
+        if origin not in self.visited:
+            return
+        if self._incoming_head is None:
+            # Built from the store, which no longer holds origin -> dest
+            self._incoming_head = {}
+            for vertex in self.visited:
+                self._link_incoming(vertex)
+        else:
+            self._unlink_incoming(origin, dest)
+        if self.parents.get(dest) != origin:
+            return
+
+        distances, parents, visited, edges = self.distances, self.parents, self.visited, self.edges
+        affected = {dest}
+        stack = [dest]
+        while stack:
+            vertex = stack.pop()
+            if vertex not in visited:
+                continue
+            for child, _ in edges(vertex):
+                if child not in affected and parents.get(child) == vertex:
+                    affected.add(child)
+                    stack.append(child)
+        for vertex in affected:
+            del distances[vertex]
+            del parents[vertex]
+
+        heap = []
+        for vertex in affected:
+            for entry_origin in self._incoming(vertex):
+                distance = distances.get(entry_origin)
+                if distance is None:
+                    continue
+                for entry_dest, weight in edges(entry_origin):
+                    if entry_dest == vertex and distance + weight < distances.get(vertex, float('infinity')):
+                        distances[vertex] = distance + weight
+                        parents[vertex] = entry_origin
+            if vertex in distances and vertex in visited:
+                heap.append((distances[vertex], vertex))
+        heapq.heapify(heap)
+        self._propagate(heap)
+
+        if self.best_exit in affected:
+            self.best_exit, self.best_cost = None, float('infinity')
+            for vertex in self.exits:
+                self._offer(vertex, distances.get(vertex, float('infinity')))
+
+    def _link_incoming(self, origin: int) -> None:
+        head, origins, following = self._incoming_head, self._incoming_origin, self._incoming_next
+        for dest, _ in self.edges(origin):
+            following.append(head.get(dest, -1))
+            head[dest] = len(origins)
+            origins.append(origin)
+
+    def _unlink_incoming(self, origin: int, dest: int) -> None:
+        # The entry's slot is left unused, like the slots of rewritten adjacencies in GraphStore
+        origins, following = self._incoming_origin, self._incoming_next
+        previous, entry = -1, self._incoming_head.get(dest, -1)
+        while entry >= 0 and origins[entry] != origin:
+            previous, entry = entry, following[entry]
+        if entry < 0:
+            return
+        if previous >= 0:
+            following[previous] = following[entry]
+        elif following[entry] >= 0:
+            self._incoming_head[dest] = following[entry]
+        else:
+            del self._incoming_head[dest]
+
+    def _incoming(self, dest: int) -> Iterator[int]:
+        """Visited origins of the edges into dest"""
+        origins, following = self._incoming_origin, self._incoming_next
+        entry = self._incoming_head.get(dest, -1)
+        while entry >= 0:
+            yield origins[entry]
+            entry = following[entry]
+
+    def _propagate(self, heap: List[Tuple[float, int]]) -> None:
+        """Dijkstra from the vertices in heap, touching only the vertices whose distance drops"""
+        distances, parents, edges, visited, exits = self.distances, self.parents, self.edges, self.visited, self.exits
+        infinity = float('infinity')
+        relaxations = 0
+        while heap:
+            distance, vertex = heapq.heappop(heap)
+            if distance > distances[vertex]:
+                continue
+            for dest, weight in edges(vertex):
+                new_distance = distance + weight
+                if new_distance < distances.get(dest, infinity):
+                    distances[dest] = new_distance
+                    parents[dest] = vertex
+                    relaxations += 1
+                    if dest in exits:
+                        self._offer(dest, new_distance)
+                    if dest in visited:
+                        heapq.heappush(heap, (new_distance, dest))
+        self.relaxations += relaxations
+
+    def _offer(self, vertex: int, cost: float) -> None:
+        if cost < self.best_cost:
+            self.best_exit, self.best_cost = vertex, cost
+
+    def path_to(self, vertex: int) -> List[int]:
+        """Current shortest path from the source to vertex ([] if it is not reachable yet)"""
+        if vertex not in self.distances:
+            return []
+        path = [vertex]
+        while path[-1] in self.parents:
+            path.append(self.parents[path[-1]])
+        path.reverse()
+        return path
+
+    def best_path(self) -> Tuple[List[int], float]:
+        """Best exit path known so far and its weight, ([], 0.0) while no exit is reachable"""
+        if self.best_exit is None or self.best_cost == float('infinity'):
+            return [], 0.0
+        return self.path_to(self.best_exit), self.best_cost
@@ -1,74 +1,144 @@
 import random
+from maze_grid import MazeGrid
 from colorama import Fore, Style, init
 
 class Labirinto:
     """
     Classe que representa o labirinto como uma grade bidimensional.
+
+    - seed: semente do gerador (mesma semente, mesmo labirinto)
+    - braid: fração (0 a 1) dos becos sem saída que ganham uma passagem extra, criando ciclos
+    - peso_maximo: se informado, cada célula recebe um peso aleatório entre 1 e peso_maximo
+      (custo para entrar nela); sem ele, todos os passos custam 1
+
+    A grade fica em um MazeGrid (um byte por célula); matriz[y][x] continua funcionando, pois cada
+    linha é uma memoryview sobre ele. Quem alterar matriz diretamente deve chamar grade.invalidar().
     """
 
-    def __init__(self, largura, altura):
+    def __init__(self, largura, altura, seed=None, braid=0.0, peso_maximo=None):
         self.largura = largura
         self.altura = altura
-        self.matriz = [[1 for _ in range(largura)] for _ in range(altura)]
+        self.random = random.Random(seed)
         self.gerar_labirinto()
+        if braid:
+            self.trancar_becos(braid)
+        self.pesos = self.gerar_pesos(peso_maximo) if peso_maximo else None
         self.entrada = self.definir_entrada()
         self.saida = self.definir_saida()
 
+    @classmethod
+    def de_grade(cls, largura, altura, celulas, entrada, saida, pesos=None):
+        """Labirinto a partir de uma grade já gerada (por exemplo, lida de um trace), sem sortear nada"""
+        labirinto = cls.__new__(cls)
+        labirinto.largura = largura
+        labirinto.altura = altura
+        labirinto.random = random.Random()
+        labirinto.grade = MazeGrid(largura, altura, bytearray(celulas))
+        labirinto.matriz = labirinto.grade.linhas
+        labirinto.pesos = bytes(pesos) if pesos is not None else None
+        labirinto.entrada = tuple(entrada)
+        labirinto.saida = tuple(saida)
+        return labirinto
+
     def gerar_labirinto(self):
         """
-        Gera um labirinto aleatório utilizando o algoritmo de recursão com backtracking.
+        Gera um labirinto aleatório com backtracking (busca em profundidade aleatória).
+        Usa uma pilha explícita sobre uma grade linear (índice = y * largura + x), então não há limite
+        de recursão: grades de 4001x4001 são geradas em segundos.
         """
-        def dentro_do_labirinto(x, y):
-            return 0 <= x < self.largura and 0 <= y < self.altura
-
-        def carve_passages(x, y):
-            direcoes = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-            random.shuffle(direcoes)
-            for dx, dy in direcoes:
-                nx, ny = x + dx * 2, y + dy * 2
-                if dentro_do_labirinto(nx, ny) and self.matriz[ny][nx] == 1:
-                    self.matriz[ny - dy][nx - dx] = 0
-                    self.matriz[ny][nx] = 0
-                    carve_passages(nx, ny)
+        largura, altura = self.largura, self.altura
+        celulas = bytearray(b'\x01') * (largura * altura)
+        sorteio = self.random.random
+        # Salto de duas células (de sala em sala) em cada direção; a parede fica no meio do caminho
+        norte, sul = -2 * largura, 2 * largura
+        limite_sul = largura * altura - 2 * largura
 
         # Inicia em uma posição aleatória
-        start_x = random.randrange(1, self.largura, 2)
-        start_y = random.randrange(1, self.altura, 2)
-        self.matriz[start_y][start_x] = 0
-        carve_passages(start_x, start_y)
+        start_x = self.random.randrange(1, largura, 2)
+        start_y = self.random.randrange(1, altura, 2)
+        inicio = start_y * largura + start_x
+        celulas[inicio] = 0
+        pilha = [inicio]
+        while pilha:
+            atual = pilha[-1]
+            x = atual % largura
+            opcoes = []
+            if atual + norte >= 0 and celulas[atual + norte]:
+                opcoes.append(norte)
+            if x + 2 < largura and celulas[atual + 2]:
+                opcoes.append(2)
+            if atual < limite_sul and celulas[atual + sul]:
+                opcoes.append(sul)
+            if x >= 2 and celulas[atual - 2]:
+                opcoes.append(-2)
+            if not opcoes:
+                pilha.pop()
+                continue
+            passo = opcoes[int(sorteio() * len(opcoes))]
+            celulas[atual + passo // 2] = 0
+            celulas[atual + passo] = 0
+            pilha.append(atual + passo)
+
+        self.grade = MazeGrid(largura, altura, celulas)
+        self.matriz = self.grade.linhas
+
+    def trancar_becos(self, fracao):
+        """
+        Remove uma fração dos becos sem saída abrindo uma parede para uma sala vizinha,
+        o que cria ciclos (labirinto "braided") e vários caminhos até a saída.
+        """
+        largura, altura, celulas = self.largura, self.altura, self.grade.celulas
+        for indice in self.grade.becos_sem_saida():
+            if self.random.random() >= fracao:
+                continue
+            y, x = divmod(indice, largura)
+            # Só paredes com outra sala do outro lado
+            paredes = [(dx, dy) for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                       if 0 < x + 2 * dx < largura - 1 and 0 < y + 2 * dy < altura - 1
+                       and celulas[indice + dy * largura + dx] == 1]
+            if paredes:
+                dx, dy = self.random.choice(paredes)
+                celulas[indice + dy * largura + dx] = 0
+        self.grade.invalidar()
+
+    def gerar_pesos(self, peso_maximo):
+        """Peso aleatório de 1 a peso_maximo por célula, numa grade linear de bytes"""
+        if not 1 <= peso_maximo <= 255:
+            raise ValueError("peso_maximo deve estar entre 1 e 255")
+        tabela = bytes(1 + b % peso_maximo for b in range(256))
+        return self.random.randbytes(self.largura * self.altura).translate(tabela)
+
+    def peso(self, posicao):
+        """Custo para entrar na posição (x, y); 1 quando o labirinto não tem pesos"""
+        if self.pesos is None:
+            return 1
+        x, y = posicao
+        return self.pesos[y * self.largura + x]
 
     def definir_entrada(self):
         """
         Define uma posição aleatória como entrada (em uma célula vazia).
         """
-        while True:
-            x = random.randrange(1, self.largura, 2)
-            y = random.randrange(1, self.altura, 2)
-            if self.matriz[y][x] == 0:
-                return (x, y)
+        return self.grade.sortear_aberta(self.random, passo=2)
 
     def definir_saida(self):
         """
         Define uma posição aleatória como saída (em uma célula vazia diferente da entrada).
         """
-        while True:
-            x = random.randrange(1, self.largura, 2)
-            y = random.randrange(1, self.altura, 2)
-            if self.matriz[y][x] == 0 and (x, y) != self.entrada:
-                return (x, y)
+        return self.grade.sortear_aberta(self.random, passo=2, excluir=[self.entrada])
 
     def obter_vizinhos(self, x, y):
         """
         Retorna uma lista de vizinhos acessíveis a partir da posição (x, y).
         """
-        vizinhos = []
-        direcoes = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        for dx, dy in direcoes:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < self.largura and 0 <= ny < self.altura:
-                if self.matriz[ny][nx] == 0:
-                    vizinhos.append((nx, ny))
-        return vizinhos
+        return [(x + dx, y + dy) for dx, dy in self.grade.vizinhos(x, y)]
+
+    def obter_vizinhos_com_peso(self, posicao):
+        """
+        Vizinhos acessíveis a partir de posicao, com o peso para entrar em cada um.
+        """
+        x, y = posicao
+        return [(vizinho, self.peso(vizinho)) for vizinho in self.obter_vizinhos(x, y)]
 
     def eh_saida(self, posicao):
         """
@@ -0,0 +1,326 @@
+import asyncio
+import json
+import random
+from http import HTTPStatus
+import re
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+import websockets
+from maze_graph import MazeGraph, find_entrance, load_maze_definition, graph_from_labirinto
+
+COMMAND_PATTERN = re.compile(r"^\s*ir:\s*(\d+)\s*$")
+INVALID_COMMAND = "Comando inválido"
+INVALID_VERTEX = "Vértice inválido"
+
+def format_weight(weight: float) -> str:
+    """Formats weights the way the course server does (integers without decimals)"""
+    return str(int(weight)) if float(weight).is_integer() else str(weight)
+
+def format_vertex_message(vertex_id: int, vertex_type: str, adjacents: List[Tuple[int, float]]) -> str:
+    """Builds a 'Vértice atual: ..., Tipo: ..., Adjacentes(Vertice, Peso): [...]' message"""
+    adjacentes = ", ".join(f"({dest}, {format_weight(weight)})" for dest, weight in adjacents)
+    return f"Vértice atual: {vertex_id}, Tipo: {vertex_type}, Adjacentes(Vertice, Peso): [{adjacentes}]"
+
+def one_way_edges(graph: MazeGraph, fraction: float, seed: Optional[int] = None) -> Set[Tuple[int, int]]:
+    """
+    Directions to refuse while still advertising them: for a fraction of the two-way edges, one
+    direction picked at random. Edges of a BFS tree from the entrance stay two-way, so every vertex
+    can still be reached and left, and the maze stays solvable.
+    """
+    if fraction <= 0:
+        return set()
+    rng = random.Random(seed)
+    edges = {vertex: {dest for dest, _ in adjacents} for vertex, (_, adjacents) in graph.items()}
+    start = find_entrance(graph)
+    tree: Set[Tuple[int, int]] = set()
+    seen = {start}
+    queue = deque([start] if start is not None else [])
+    while queue:
+        vertex = queue.popleft()
+        for dest in edges[vertex]:
+            if dest not in seen and vertex in edges.get(dest, ()):
+                seen.add(dest)
+                tree.add((min(vertex, dest), max(vertex, dest)))
+                queue.append(dest)
+
+    pairs = sorted({(min(a, b), max(a, b)) for a, dests in edges.items() for b in dests
+                    if a in edges.get(b, ())} - tree)
+    blocked = set()
+    for a, b in rng.sample(pairs, round(len(pairs) * min(fraction, 1.0))):
+        blocked.add((a, b) if rng.random() < 0.5 else (b, a))
+    return blocked
+
+def walkable_graph(graph: MazeGraph, blocked: Set[Tuple[int, int]]) -> MazeGraph:
+    """graph without the blocked edges: what a client can actually walk"""
+    if not blocked:
+        return graph
+    return {vertex: (tipo, [(dest, weight) for dest, weight in adjacents if (vertex, dest) not in blocked])
+            for vertex, (tipo, adjacents) in graph.items()}
+
+class MazeSession:
+    """
+    Protocol state of a single client walking a maze graph.
+    Independent of the transport, so it can be driven by a socket or directly in-process.
+    Moves along blocked edges are refused even though the origin advertises them, like a directed
+    maze whose messages list edges the server won't let through.
+    """
+    def __init__(self, graph: MazeGraph, start: Optional[int] = None, blocked: Optional[Set[Tuple[int, int]]] = None):
+        self.graph = graph
+        self.blocked = blocked or set()
+        self.current_vertex = start if start is not None else find_entrance(graph)
+        if self.current_vertex is None:
+            raise ValueError("Maze has no entrance vertex")
+        self.moves = 0
+        self.invalid_moves = 0
+        self.total_weight = 0.0
+
+    def current_message(self) -> str:
+        vertex_type, adjacents = self.graph[self.current_vertex]
+        return format_vertex_message(self.current_vertex, vertex_type, adjacents)
+
+    def handle(self, message: str) -> str:
+        """Applies one command and returns the server response"""
+        match = COMMAND_PATTERN.match(message)
+        if not match:
+            self.invalid_moves += 1
+            return INVALID_COMMAND
+
+        target = int(match.group(1))
+        _, adjacents = self.graph[self.current_vertex]
+        weight = next((w for dest, w in adjacents if dest == target), None)
+        if weight is None or target not in self.graph or (self.current_vertex, target) in self.blocked:
+            self.invalid_moves += 1
+            return INVALID_VERTEX
+
+        self.current_vertex = target
+        self.moves += 1
+        self.total_weight += weight
+        return self.current_message()
+
+class LocalMazeConnection:
+    """
+    In-process stand-in for a client WebSocket connected to one maze.
+    Has the send/recv/close interface the solver uses, answering through a MazeSession without any
+    socket, so exploration, planners and benchmarks run on a local Labirinto exactly as against the server.
+    """
+    def __init__(self, graph: MazeGraph, start: Optional[int] = None, blocked: Optional[Set[Tuple[int, int]]] = None):
+        self.session = MazeSession(graph, start, blocked)
+        self._responses: "asyncio.Queue[str]" = asyncio.Queue()
+        self._responses.put_nowait(self.session.current_message())
+        self.closed = False
+
+    async def send(self, message: str) -> None:
+        if self.closed:
+            raise websockets.exceptions.ConnectionClosedOK(None, None)
+        self._responses.put_nowait(self.session.handle(message))
+
+    async def recv(self) -> str:
+        if self.closed:
+            raise websockets.exceptions.ConnectionClosedOK(None, None)
+        return await self._responses.get()
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def __aenter__(self) -> "LocalMazeConnection":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+def local_connector(graph: MazeGraph, sessions: Optional[List[MazeSession]] = None,
+                    blocked: Optional[Set[Tuple[int, int]]] = None):
+    """
+    Replacement for websockets.connect that opens a LocalMazeConnection over graph whatever the URL.
+    Each connection (reconnects included) starts a new session, appended to sessions when given.
+    """
+    def connect(url: str) -> LocalMazeConnection:
+        connection = LocalMazeConnection(graph, blocked=blocked)
+        if sessions is not None:
+            sessions.append(connection.session)
+        return connection
+    return connect
+
+class LocalMazeServer:
+    """
+    In-process stand-in for the course WebSocket server.
+    Serves ws://host:port/ws/{grupo_id}/{labirinto_id}, answering 'ir: N' commands over a maze graph.
+    Every response is delayed by latency +/- jitter seconds (responses keep their order),
+    so solver changes can be measured at realistic round-trip times.
+    Plain HTTP GET /labirintos and /labirintos/{grupo_id} list the served mazes, like the course API.
+    With one_way, that fraction of the two-way edges of each maze is refused in one direction while
+    still being advertised (see one_way_edges).
+    """
+    def __init__(self,
+                 graph: Optional[MazeGraph] = None,
+                 mazes: Optional[Dict[str, MazeGraph]] = None,
+                 latency: float = 0.0,
+                 jitter: float = 0.0,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 seed: Optional[int] = None,
+                 drop_after: Optional[int] = None,
+                 max_drops: int = 1,
+                 one_way: float = 0.0):
+        if graph is None and not mazes:
+            raise ValueError("LocalMazeServer needs a graph or a mapping of mazes")
+        self.graph = graph
+        self.mazes: Dict[str, MazeGraph] = dict(mazes or {})
+        self.latency = latency
+        self.jitter = jitter
+        self.host = host
+        self.port = port
+        self.random = random.Random(seed)
+        self.sessions: List[MazeSession] = []
+        # Fault injection: close a connection after drop_after commands, at most max_drops times
+        self.drop_after = drop_after
+        self.max_drops = max_drops
+        self.drops = 0
+        self.one_way = one_way
+        self.seed = seed
+        self._blocked: Dict[int, Set[Tuple[int, int]]] = {}  # id(graph) -> refused directions
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        """Base URL in the same form as MAZE_WEBSOCKET_URL"""
+        return f"ws://{self.host}:{self.port}/ws/"
+
+    def add_maze(self, labirinto_id, graph: MazeGraph) -> None:
+        self.mazes[str(labirinto_id)] = graph
+
+    def graph_for_path(self, path: str) -> Optional[MazeGraph]:
+        """Picks the maze for a /ws/{grupo_id}/{labirinto_id} request path"""
+        labirinto_id = path.rstrip("/").rsplit("/", 1)[-1]
+        return self.mazes.get(labirinto_id, self.graph)
+
+    def blocked_for(self, graph: MazeGraph) -> Set[Tuple[int, int]]:
+        """Directions refused in graph, picked once per maze"""
+        blocked = self._blocked.get(id(graph))
+        if blocked is None:
+            blocked = self._blocked[id(graph)] = one_way_edges(graph, self.one_way, self.seed)
+        return blocked
+
+    def _delay(self) -> float:
+        if self.jitter:
+            return max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+        return self.latency
+
+    def maze_listing(self) -> List[Dict[str, object]]:
+        """Body of GET /labirintos/{grupo_id}: every maze registered with add_maze (any group sees all)"""
+        return [{"labirintoId": int(maze_id) if maze_id.isdigit() else maze_id, "vertices": len(graph)}
+                for maze_id, graph in self.mazes.items()]
+
+    async def _process_request(self, path: str, request_headers):
+        # Answers the listing endpoints over HTTP; anything else goes on to the WebSocket handshake
+        parts = path.split("?", 1)[0].strip("/").split("/")
+        if parts[0] != "labirintos" or len(parts) > 2:
+            return None
+        body = json.dumps(self.maze_listing()).encode("utf-8")
+        return HTTPStatus.OK, [("Content-Type", "application/json")], body
+
+    async def start(self) -> "LocalMazeServer":
+        self._server = await websockets.serve(self._handler, self.host, self.port,
+                                              process_request=self._process_request)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "LocalMazeServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def _handler(self, websocket) -> None:
+        graph = self.graph_for_path(websocket.path)
+        if graph is None:
+            await websocket.close(code=1008, reason="Labirinto não encontrado")
+            return
+
+        session = MazeSession(graph, blocked=self.blocked_for(graph))
+        self.sessions.append(session)
+        loop = asyncio.get_running_loop()
+        outgoing: asyncio.Queue = asyncio.Queue()
+        last_delivery = 0.0
+
+        def schedule(response: str) -> None:
+            # Each message travels independently, but never overtakes the previous one
+            nonlocal last_delivery
+            last_delivery = max(loop.time() + self._delay(), last_delivery)
+            outgoing.put_nowait((last_delivery, response))
+
+        async def sender() -> None:
+            while True:
+                deliver_at, response = await outgoing.get()
+                wait = deliver_at - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                await websocket.send(response)
+
+        sender_task = asyncio.create_task(sender())
+        try:
+            schedule(session.current_message())
+            commands = 0
+            async for message in websocket:
+                schedule(session.handle(message))
+                commands += 1
+                if self.drop_after is not None and commands >= self.drop_after and self.drops < self.max_drops:
+                    self.drops += 1
+                    await websocket.close(code=1011, reason="Simulated connection drop")
+                    break
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            sender_task.cancel()
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local stand-in for the maze WebSocket server")
+    parser.add_argument("--maze", help="Maze JSON in the 'Criar Labirinto' format")
+    parser.add_argument("--corpus", help="Directory of maze JSON files, each served under its file name")
+    parser.add_argument("--largura", type=int, default=21, help="Grid width when no --maze is given")
+    parser.add_argument("--altura", type=int, default=21, help="Grid height when no --maze is given")
+    parser.add_argument("--latency", type=float, default=0.0, help="Per-message latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Latency jitter in seconds")
+    parser.add_argument("--drop-after", type=int, help="Drop each connection after this many commands")
+    parser.add_argument("--max-drops", type=int, default=1, help="How many connections --drop-after may drop")
+    parser.add_argument("--one-way", type=float, default=0.0,
+                        help="Fraction of two-way edges refused in one direction but still advertised")
+    parser.add_argument("--seed", type=int, help="Seed for --one-way and the jitter")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    corpus = {}
+    if args.corpus:
+        from maze_corpus import load_corpus_dir
+        corpus = dict(load_corpus_dir(args.corpus))
+        maze_graph = None
+    elif args.maze:
+        maze_graph = load_maze_definition(args.maze)
+    else:
+        from labirinto import Labirinto
+        maze_graph = graph_from_labirinto(Labirinto(args.largura, args.altura))
+
+    async def main():
+        async with LocalMazeServer(maze_graph, mazes=corpus, latency=args.latency, jitter=args.jitter,
+                                   host=args.host, port=args.port, drop_after=args.drop_after,
+                                   max_drops=args.max_drops, one_way=args.one_way, seed=args.seed) as server:
+            print(f"🌐 Local maze server listening on {server.url}<grupo_id>/<labirinto_id>")
+            if corpus:
+                print(f"📍 {len(corpus)} mazes: {', '.join(corpus)}, latency {args.latency}s ± {args.jitter}s")
+            else:
+                print(f"📍 {len(maze_graph)} vertices, latency {args.latency}s ± {args.jitter}s")
+            await asyncio.Future()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -1,5 +1,7 @@
 from labirinto import Labirinto
 from agente_explorador import AgenteExplorador
+from maze_graph import LabirintoGrafo
+import asyncio
 import random
 
 def main():
@@ -13,21 +15,26 @@ def main():
     labirinto = Labirinto(largura, altura)
     labirinto.exibir_labirinto()
 
+    # O agente explora os mesmos vértices e pesos que o solver WebSocket receberia do servidor
+    grafo = LabirintoGrafo(labirinto)
+
     # Cria o agente, com a flag para imprimir ou não os passos no arquivo
-    agente = AgenteExplorador(labirinto, imprimir_passos_no_arquivo=True)  # Ajuste aqui a flag
-    agente.explorar()
+    agente = AgenteExplorador(grafo, imprimir_passos_no_arquivo=True)  # Ajuste aqui a flag
+    asyncio.run(agente.explorar())
 
-      # Após a exploração, imprime o labirinto final no console com cores
+    # Após a exploração, imprime o labirinto final no console com cores
+    menor_caminho, _ = agente.get_menor_caminho()
     print("\nLabirinto com o caminho percorrido em azul e o menor caminho em vermelho:")
-    labirinto.exibir_labirinto(
-        caminho_percorrido=agente.get_caminho_percorrido(),
-        menor_caminho=agente.get_menor_caminho()
+    grafo.exibir_labirinto(
+        caminho_percorrido=[destino for _, destino, _ in agente.get_caminho_percorrido()] + [grafo.entrada],
+        menor_caminho=menor_caminho
     )
 
     print(f"\nTotal de movimentos realizados: {agente.movimentos}")
 
     if agente.imprimir_passos_no_arquivo:
-        print("Exploração detalhada foi escrita no arquivo 'saida_labirinto.txt'.")
+        print(f"Os passos da exploração foram gravados em '{agente.nome_arquivo}' "
+              f"(veja com: python replay_trace.py {agente.nome_arquivo} --step N).")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,145 @@
+import json
+import os
+import re
+import time
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
+from maze_graph import MazeGraph
+from vertex_type import VertexType
+
+# Bump when the file layout changes; entries with another version are ignored and removed
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.path.join(".", "results", "cache")
+
+class CachedMaze(NamedTuple):
+    grupo_id: str
+    labirinto_id: str
+    graph: MazeGraph
+    entrada: Optional[int]
+    exits: Set[int]
+    saved_at: float
+    rejected: Set[Tuple[int, int]]  # Advertised edges the server refused, left out of graph
+
+def _safe_name(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", str(value)) or "_"
+
+def matches_initial_state(cached: CachedMaze, vertex: int, vertex_type: str,
+                          adjacents: Iterable[Tuple[int, float]]) -> bool:
+    """Whether the server's initial message agrees with what the cache knows about that vertex"""
+    state = cached.graph.get(vertex)
+    if state is None:
+        return False
+    tipo, known_adjacents = state
+    if VertexType.from_value(tipo) != VertexType.from_value(vertex_type):
+        return False
+    return sorted(known_adjacents) == sorted((dest, float(weight)) for dest, weight in adjacents
+                                             if (vertex, dest) not in cached.rejected)
+
+class MazeCache:
+    """
+    On-disk cache of explored maze graphs, one JSON file per (grupo_id, labirinto_id).
+    Entries carry a version stamp; save() evicts entries older than max_age seconds and then the
+    oldest ones until the directory fits in max_bytes.
+    """
+    def __init__(self,
+                 directory: str = DEFAULT_CACHE_DIR,
+                 max_age: Optional[float] = 7 * 24 * 3600,
+                 max_bytes: Optional[int] = 256 * 1024 * 1024):
+        self.directory = directory
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+
+    def path_for(self, grupo_id: str, labirinto_id: str) -> str:
+        return os.path.join(self.directory, _safe_name(grupo_id), f"{_safe_name(labirinto_id)}.json")
+
+    def load(self, grupo_id: str, labirinto_id: str) -> Optional[CachedMaze]:
+        """The cached maze, or None when missing, expired, unreadable or from another cache version"""
+        path = self.path_for(grupo_id, labirinto_id)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self.invalidate(grupo_id, labirinto_id)
+            return None
+
+        saved_at = entry.get("saved_at", 0.0)
+        if entry.get("version") != CACHE_VERSION or self._expired(saved_at):
+            self.invalidate(grupo_id, labirinto_id)
+            return None
+
+        graph: MazeGraph = {int(v): (tipo, [(int(d), float(w)) for d, w in adjacents])
+                            for v, tipo, adjacents in entry["vertices"]}
+        return CachedMaze(str(grupo_id), str(labirinto_id), graph, entry.get("entrada"),
+                          set(entry.get("exits", [])), saved_at,
+                          {(origin, dest) for origin, dest in entry["rejected"]})
+
+    def save(self,
+             grupo_id: str,
+             labirinto_id: str,
+             graph: Mapping[int, Tuple[str, List[Tuple[int, float]]]],
+             entrada: Optional[int],
+             exits: Iterable[int],
+             rejected: Iterable[Tuple[int, int]] = ()) -> str:
+        """Writes an entry atomically (temporary file + rename) and applies eviction"""
+        entry: Dict[str, Any] = {
+            "version": CACHE_VERSION,
+            "grupo_id": str(grupo_id),
+            "labirinto_id": str(labirinto_id),
+            "saved_at": time.time(),
+            "entrada": entrada,
+            "exits": sorted(exits),
+            "rejected": sorted([origin, dest] for origin, dest in rejected),
+            "vertices": [[v, tipo, [[d, w] for d, w in adjacents]] for v, (tipo, adjacents) in graph.items()],
+        }
+        path = self.path_for(grupo_id, labirinto_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, separators=(",", ":"))
+        os.replace(temporary, path)
+        self.evict(keep=path)
+        return path
+
+    def invalidate(self, grupo_id: str, labirinto_id: str) -> None:
+        try:
+            os.remove(self.path_for(grupo_id, labirinto_id))
+        except FileNotFoundError:
+            pass
+
+    def _expired(self, saved_at: float) -> bool:
+        return self.max_age is not None and time.time() - saved_at > self.max_age
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) of every cache file"""
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".json"):
+                    path = os.path.join(root, name)
+                    stat = os.stat(path)
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self, keep: Optional[str] = None) -> List[str]:
+        """Removes expired entries, then the least recently written until the size limit holds"""
+        removed = []
+        entries = sorted(self._entries())
+        now = time.time()
+        if self.max_age is not None:
+            for entry in [e for e in entries if now - e[0] > self.max_age and e[2] != keep]:
+                os.remove(entry[2])
+                removed.append(entry[2])
+                entries.remove(entry)
+        if self.max_bytes is not None:
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                os.remove(path)
+                removed.append(path)
+                total -= size
+        return removed
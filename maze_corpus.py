@@ -0,0 +1,91 @@
+import math
+import os
+import random
+from typing import List, Optional, Tuple
+from maze_graph import MazeGraph, load_maze_definition
+from vertex_type import VertexType
+
+DEFAULT_SIZES = [256, 1024, 4096, 16384, 65536, 102400]
+
+def generate_maze_graph(n_vertices: int,
+                        seed: Optional[int] = None,
+                        extra_edge_ratio: float = 0.1,
+                        max_weight: int = 20,
+                        num_exits: int = 2) -> MazeGraph:
+    """
+    Generates a maze-like graph in the same shape the course server uses.
+    Vertices are laid out on a square grid (id = y * side + x) and connected by a random
+    spanning tree plus extra_edge_ratio loops. Every passage is a pair of directed edges
+    with independent weights in [1, max_weight]. Vertex 0 is the entrance.
+    """
+    rng = random.Random(seed)
+    side = max(2, math.isqrt(n_vertices - 1) + 1)
+    total = side * side
+
+    adjacency: List[dict] = [{} for _ in range(total)]
+
+    def connect(a: int, b: int) -> None:
+        adjacency[a][b] = float(rng.randint(1, max_weight))
+        adjacency[b][a] = float(rng.randint(1, max_weight))
+
+    def neighbours(v: int) -> List[int]:
+        x, y = v % side, v // side
+        result = []
+        if x > 0: result.append(v - 1)
+        if x < side - 1: result.append(v + 1)
+        if y > 0: result.append(v - side)
+        if y < side - 1: result.append(v + side)
+        return result
+
+    # Randomized DFS spanning tree with an explicit stack
+    visited = bytearray(total)
+    visited[0] = 1
+    stack = [0]
+    while stack:
+        v = stack[-1]
+        candidates = [n for n in neighbours(v) if not visited[n]]
+        if not candidates:
+            stack.pop()
+            continue
+        n = rng.choice(candidates)
+        visited[n] = 1
+        connect(v, n)
+        stack.append(n)
+
+    # Braid: extra passages create loops, so there is more than one route to an exit
+    for _ in range(int(total * extra_edge_ratio)):
+        v = rng.randrange(total)
+        n = rng.choice(neighbours(v))
+        if n not in adjacency[v]:
+            connect(v, n)
+
+    exits = set(rng.sample(range(1, total), min(num_exits, total - 1)))
+    graph: MazeGraph = {}
+    for v in range(total):
+        if v == 0:
+            tipo = VertexType.ENTRADA.value
+        elif v in exits:
+            tipo = VertexType.SAIDA.value
+        else:
+            tipo = VertexType.NORMAL.value
+        # Shuffled so adjacency order does not leak the order the spanning tree was carved in
+        adjacents = list(adjacency[v].items())
+        rng.shuffle(adjacents)
+        graph[v] = (tipo, adjacents)
+    return graph
+
+def build_corpus(sizes: List[int] = None, seed: int = 0, **kwargs) -> List[Tuple[str, MazeGraph]]:
+    """Generates one maze per size, named after its vertex count and seed"""
+    corpus = []
+    for index, size in enumerate(sizes or DEFAULT_SIZES):
+        graph = generate_maze_graph(size, seed=seed + index, **kwargs)
+        corpus.append((f"grid_{len(graph)}_s{seed + index}", graph))
+    return corpus
+
+def load_corpus_dir(directory: str) -> List[Tuple[str, MazeGraph]]:
+    """Loads every *.json maze definition of a directory, sorted by file name"""
+    corpus = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".json"):
+            corpus.append((os.path.splitext(name)[0], load_maze_definition(os.path.join(directory, name))))
+    return corpus
@@ -0,0 +1,167 @@
+import json
+import re
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+from vertex_type import VertexType
+
+# Same shape as WebSocketLabirinto.visited_states: vertex -> (tipo, [(destino, peso), ...])
+MazeGraph = Dict[int, Tuple[str, List[Tuple[int, float]]]]
+
+def load_maze_definition(source: Union[str, Dict[str, Any]]) -> MazeGraph:
+    """
+    Loads a maze in the "Criar Labirinto" format ({"vertices": [...], "arestas": [...]}).
+    Accepts a file path or an already decoded dict. Edges are directed (origemId -> destinoId).
+    """
+    if isinstance(source, str):
+        with open(source, 'r', encoding='utf-8') as f:
+            definition = json.load(f)
+    else:
+        definition = source
+
+    graph: MazeGraph = {}
+    for vertice in definition.get("vertices", []):
+        tipo = VertexType.from_value(vertice.get("tipo", 0)).value
+        graph[int(vertice["id"])] = (tipo, [])
+
+    for aresta in definition.get("arestas", []):
+        origem = int(aresta["origemId"])
+        destino = int(aresta["destinoId"])
+        if origem not in graph or destino not in graph:
+            raise ValueError(f"Edge references unknown vertex: {origem} -> {destino}")
+        graph[origem][1].append((destino, float(aresta["peso"])))
+
+    return graph
+
+def maze_definition_from_graph(graph: MazeGraph, labirinto_id: Optional[int] = None) -> Dict[str, Any]:
+    """Converts a graph back to the "Criar Labirinto" JSON format"""
+    vertices = []
+    arestas = []
+    for vertex_id in sorted(graph.keys()):
+        tipo, adjacents = graph[vertex_id]
+        vertice = {"id": vertex_id, "tipo": int(tipo)}
+        if labirinto_id is not None:
+            vertice["labirintoId"] = labirinto_id
+        vertices.append(vertice)
+        for dest, weight in adjacents:
+            aresta = {"origemId": vertex_id, "destinoId": dest,
+                      "peso": int(weight) if float(weight).is_integer() else weight}
+            if labirinto_id is not None:
+                aresta["labirintoId"] = labirinto_id
+            arestas.append(aresta)
+    return {"vertices": vertices, "arestas": arestas}
+
+def save_maze_definition(graph: MazeGraph, path: str, labirinto_id: Optional[int] = None) -> None:
+    """Writes a graph to disk in the "Criar Labirinto" JSON format"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(maze_definition_from_graph(graph, labirinto_id), f)
+
+def posicao_para_vertice(labirinto, posicao: Tuple[int, int]) -> int:
+    """Maps a (x, y) cell of a Labirinto grid to its vertex id"""
+    x, y = posicao
+    return y * labirinto.largura + x
+
+def vertice_para_posicao(labirinto, vertice: int) -> Tuple[int, int]:
+    """Maps a vertex id back to its (x, y) cell in a Labirinto grid"""
+    return vertice % labirinto.largura, vertice // labirinto.largura
+
+def graph_from_labirinto(labirinto) -> MazeGraph:
+    """
+    Builds a graph from a Labirinto grid. Every open cell becomes a vertex
+    (id = y * largura + x) connected to its open neighbours; the weight of an edge is the cost of
+    entering its destination cell (1 unless the Labirinto was generated with peso_maximo).
+    Adjacency comes straight from the grid's precomputed neighbour masks.
+    """
+    grade = getattr(labirinto, "grade", None)
+    if grade is None:
+        return _graph_from_matriz(labirinto)
+
+    from maze_grid import DIRECOES_POR_MASCARA
+    largura = labirinto.largura
+    pesos = labirinto.pesos
+    mascaras = grade.mascaras
+    # Neighbour vertex offsets for every mask value, in obter_vizinhos order
+    deslocamentos = [tuple(dy * largura + dx for dx, dy in direcoes) for direcoes in DIRECOES_POR_MASCARA]
+    entrada = posicao_para_vertice(labirinto, labirinto.entrada)
+    saida = posicao_para_vertice(labirinto, labirinto.saida)
+
+    graph: MazeGraph = {}
+    normal = VertexType.NORMAL.value
+    for vertex_id in _open_cells(grade.celulas):
+        vizinhos = [vertex_id + offset for offset in deslocamentos[mascaras[vertex_id]]]
+        if pesos is None:
+            adjacents = [(dest, 1.0) for dest in vizinhos]
+        else:
+            adjacents = [(dest, float(pesos[dest])) for dest in vizinhos]
+        graph[vertex_id] = (normal, adjacents)
+
+    graph[entrada] = (VertexType.ENTRADA.value, graph[entrada][1])
+    graph[saida] = (VertexType.SAIDA.value, graph[saida][1])
+    return graph
+
+class LabirintoGrafo:
+    """
+    A Labirinto seen through vertex ids, with the adjacency of graph_from_labirinto computed once.
+    Gives AgenteExplorador the same vertices and weights the WebSocket solver gets from the server
+    (locally through local_maze_server.local_connector), while drawing on the original grid.
+    """
+    def __init__(self, labirinto):
+        self.labirinto = labirinto
+        self.grafo = graph_from_labirinto(labirinto)
+        self.entrada = posicao_para_vertice(labirinto, labirinto.entrada)
+        self.saida = posicao_para_vertice(labirinto, labirinto.saida)
+
+    def obter_vizinhos_com_peso(self, vertice: int) -> List[Tuple[int, float]]:
+        return self.grafo[vertice][1]
+
+    def obter_vizinhos(self, vertice: int, _=None) -> List[int]:
+        return [dest for dest, _ in self.grafo[vertice][1]]
+
+    def eh_saida(self, vertice: int) -> bool:
+        return vertice == self.saida
+
+    def posicoes(self, vertices) -> List[Tuple[int, int]]:
+        return [vertice_para_posicao(self.labirinto, v) for v in vertices]
+
+    def exibir_labirinto(self, caminho_percorrido=None, menor_caminho=None, agente_posicao=None, arquivo=None):
+        """Labirinto.exibir_labirinto with vertex ids in place of (x, y) cells"""
+        self.labirinto.exibir_labirinto(
+            caminho_percorrido=self.posicoes(caminho_percorrido or []),
+            menor_caminho=self.posicoes(menor_caminho or []),
+            agente_posicao=vertice_para_posicao(self.labirinto, agente_posicao) if agente_posicao is not None else None,
+            arquivo=arquivo)
+
+def _open_cells(celulas) -> Iterator[int]:
+    return (match.start() for match in re.finditer(b"\x00", celulas))
+
+def _graph_from_matriz(labirinto) -> MazeGraph:
+    """graph_from_labirinto for grids that only expose matriz and obter_vizinhos"""
+    graph: MazeGraph = {}
+    entrada = posicao_para_vertice(labirinto, labirinto.entrada)
+    saida = posicao_para_vertice(labirinto, labirinto.saida)
+
+    for y in range(labirinto.altura):
+        for x in range(labirinto.largura):
+            if labirinto.matriz[y][x] != 0:
+                continue
+            vertex_id = y * labirinto.largura + x
+            if vertex_id == entrada:
+                tipo = VertexType.ENTRADA.value
+            elif vertex_id == saida:
+                tipo = VertexType.SAIDA.value
+            else:
+                tipo = VertexType.NORMAL.value
+            adjacents = [(posicao_para_vertice(labirinto, vizinho), float(labirinto.peso(vizinho)))
+                         for vizinho in labirinto.obter_vizinhos(x, y)]
+            graph[vertex_id] = (tipo, adjacents)
+
+    return graph
+
+def find_entrance(graph: MazeGraph) -> Optional[int]:
+    """Returns the entrance vertex of a graph, if any"""
+    for vertex_id, (tipo, _) in graph.items():
+        if tipo == VertexType.ENTRADA.value:
+            return vertex_id
+    return None
+
+def find_exits(graph: MazeGraph) -> Set[int]:
+    """Returns every exit vertex of a graph"""
+    return {vertex_id for vertex_id, (tipo, _) in graph.items() if tipo == VertexType.SAIDA.value}
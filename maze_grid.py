@@ -0,0 +1,131 @@
+import random
+import re
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable, List, Optional, Tuple
+
+# Valores de parede e célula aberta, os mesmos de Labirinto.matriz
+PAREDE = 1
+ABERTA = 0
+
+# Bits da máscara de vizinhos: quais dos 4 vizinhos de uma célula estão abertos
+OESTE, LESTE, NORTE, SUL = 1, 2, 4, 8
+DIRECOES_POR_BIT = ((OESTE, (-1, 0)), (LESTE, (1, 0)), (NORTE, (0, -1)), (SUL, (0, 1)))
+
+# máscara -> ((dx, dy), ...) na ordem que Labirinto.obter_vizinhos sempre usou (O, L, N, S)
+DIRECOES_POR_MASCARA = tuple(tuple(d for bit, d in DIRECOES_POR_BIT if mask & bit) for mask in range(16))
+_POPCOUNT = bytes(bin(mask).count("1") for mask in range(256))
+_ABERTA_PARA_UM = bytes(1 if b == ABERTA else 0 for b in range(256))
+_BECO = bytes(1 if b == 1 else 0 for b in range(256))
+
+class MazeGrid:
+    """
+    Grade de um Labirinto em um único bytearray (1 byte por célula, índice = y * largura + x).
+    As máscaras de vizinhos abertos (4 bits por célula) são calculadas de uma vez com operações
+    de inteiros grandes, uma faixa de 8 bits por célula, então contagens, becos sem saída e
+    sorteios não percorrem a grade em Python. Ocupa ~1 byte por célula (2 com as máscaras),
+    contra ~8 bytes por célula de uma lista de listas de ints.
+    """
+    def __init__(self, largura: int, altura: int, celulas: Optional[bytearray] = None):
+        self.largura = largura
+        self.altura = altura
+        self.celulas = celulas if celulas is not None else bytearray([PAREDE]) * (largura * altura)
+        if len(self.celulas) != largura * altura:
+            raise ValueError("celulas must have largura * altura bytes")
+        view = memoryview(self.celulas)
+        # As linhas compartilham memória com celulas: linhas[y][x] lê e escreve na própria grade
+        self.linhas: List[memoryview] = [view[y * largura:(y + 1) * largura] for y in range(altura)]
+        self._mascaras: Optional[bytes] = None
+
+    def invalidar(self) -> None:
+        """Deve ser chamado depois de alterar células, para que as máscaras sejam recalculadas"""
+        self._mascaras = None
+
+    @property
+    def mascaras(self) -> bytes:
+        """Máscara de vizinhos abertos por célula (OESTE | LESTE | NORTE | SUL; 0 nas paredes)"""
+        if self._mascaras is None:
+            self._mascaras = self._calcular_mascaras()
+        return self._mascaras
+
+    def _calcular_mascaras(self) -> bytes:
+        largura, total = self.largura, len(self.celulas)
+        bits = 8 * total
+        abertas = int.from_bytes(self.celulas.translate(_ABERTA_PARA_UM), "little")
+        # Colunas que têm vizinho a oeste/leste (sem passar de uma linha para a seguinte)
+        tem_oeste = int.from_bytes((b"\x00" + b"\x01" * (largura - 1)) * self.altura, "little")
+        tem_leste = int.from_bytes((b"\x01" * (largura - 1) + b"\x00") * self.altura, "little")
+        limite = (1 << bits) - 1
+
+        oeste = (abertas << 8) & tem_oeste
+        leste = (abertas >> 8) & tem_leste
+        norte = (abertas << (8 * largura)) & limite
+        sul = abertas >> (8 * largura)
+        mascaras = oeste | (leste << 1) | (norte << 2) | (sul << 3)
+        # Só células abertas têm máscara: cada faixa de abertas vale 0 ou 1, então * 0xFF não gera vai-um
+        mascaras &= abertas * 0xFF
+        return mascaras.to_bytes(total, "little")
+
+    def vizinhos(self, x: int, y: int) -> Tuple[Tuple[int, int], ...]:
+        """Direções (dx, dy) abertas a partir de uma célula"""
+        return DIRECOES_POR_MASCARA[self.mascaras[y * self.largura + x]]
+
+    def contagem_vizinhos(self) -> bytes:
+        """Número de vizinhos abertos de cada célula (0 nas paredes)"""
+        return self.mascaras.translate(_POPCOUNT)
+
+    def total_abertas(self) -> int:
+        return self.celulas.count(ABERTA)
+
+    def becos_sem_saida(self) -> List[int]:
+        """Índices das células abertas com exatamente um vizinho aberto"""
+        becos = self.contagem_vizinhos().translate(_BECO)
+        return [m.start() for m in re.finditer(b"\x01", becos)]
+
+    def sortear_aberta(self,
+                       rng: random.Random,
+                       passo: int = 1,
+                       excluir: Iterable[Tuple[int, int]] = ()) -> Tuple[int, int]:
+        """
+        Célula aberta (x, y) sorteada uniformemente: sorteia a posição entre as células abertas e a
+        localiza pelas contagens de cada linha, em vez de sortear coordenadas até achar uma aberta.
+        passo=2 restringe o sorteio às salas (x e y ímpares). Células em excluir nunca são devolvidas.
+        """
+        excluir = set(excluir)
+        linhas = range(1, self.altura, passo) if passo > 1 else range(self.altura)
+        acumulado = list(accumulate(self._abertas_na_linha(y, passo) for y in linhas))
+        total = acumulado[-1] if acumulado else 0
+        if total - sum(1 for celula in excluir if self._sorteavel(celula, passo)) <= 0:
+            raise ValueError("No open cell to choose from")
+
+        while True:
+            # Células excluídas são poucas (a entrada, ao sortear a saída), então basta sortear de novo
+            alvo = rng.randrange(total)
+            posicao = bisect_right(acumulado, alvo)
+            y = linhas[posicao]
+            x = self._n_esima_aberta(y, alvo - (acumulado[posicao - 1] if posicao else 0), passo)
+            if (x, y) not in excluir:
+                return x, y
+
+    def _inicio_linha(self, y: int, passo: int) -> int:
+        return y * self.largura + (1 if passo > 1 else 0)
+
+    def _abertas_na_linha(self, y: int, passo: int) -> int:
+        return self.celulas[self._inicio_linha(y, passo):(y + 1) * self.largura:passo].count(ABERTA)
+
+    def _n_esima_aberta(self, y: int, n: int, passo: int) -> int:
+        linha = self.celulas[self._inicio_linha(y, passo):(y + 1) * self.largura:passo]
+        indice = linha.find(ABERTA)
+        for _ in range(n):
+            indice = linha.find(ABERTA, indice + 1)
+        return (1 if passo > 1 else 0) + indice * passo
+
+    def _sorteavel(self, celula: Tuple[int, int], passo: int) -> bool:
+        x, y = celula
+        if not (0 <= x < self.largura and 0 <= y < self.altura) or self.celulas[y * self.largura + x] != ABERTA:
+            return False
+        return passo == 1 or (x % passo == 1 and y % passo == 1)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.celulas) + (len(self._mascaras) if self._mascaras is not None else 0)
@@ -0,0 +1,198 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+import urllib.parse
+import urllib.request
+from typing import Any, Dict, Iterable, List, Optional
+from dotenv import load_dotenv
+from config import MazeConfig
+from maze_cache import MazeCache
+from move_log import LogLevel
+from solver_metrics import SolverProfiler
+from websocket_maze_client import WebSocketMazeSolver
+
+# One profile for the whole run: cProfile and tracemalloc can't be split between concurrent solvers
+PROFILE_DIR = os.path.join("results", "runner")
+
+def parse_maze_ids(values: Iterable[str]) -> List[str]:
+    """Expands '1', '3-7' and '1,2' style arguments into maze ids, keeping their order"""
+    ids: List[str] = []
+    for value in values:
+        for part in str(value).split(","):
+            part = part.strip()
+            if not part:
+                continue
+            first, sep, last = part.partition("-")
+            if sep and first.isdigit() and last.isdigit():
+                ids.extend(str(i) for i in range(int(first), int(last) + 1))
+            else:
+                ids.append(part)
+    return list(dict.fromkeys(ids))
+
+def api_url_from_websocket(websocket_url: str) -> str:
+    """http(s)://host:port of the API behind a ws(s)://host:port/ws/ URL"""
+    parsed = urllib.parse.urlparse(websocket_url)
+    scheme = "https" if parsed.scheme == "wss" else "http"
+    return f"{scheme}://{parsed.netloc}"
+
+def fetch_maze_ids(api_url: str, grupo_id: str, timeout: float = 10.0) -> List[str]:
+    """Maze ids from 'Listar Labirintos por grupo' (GET {api_url}/labirintos/{grupo_id})"""
+    with urllib.request.urlopen(f"{api_url.rstrip('/')}/labirintos/{grupo_id}", timeout=timeout) as response:
+        listing = json.load(response)
+    ids = []
+    for entry in listing:
+        if isinstance(entry, dict):
+            entry = next((entry[key] for key in ("labirintoId", "LabirintoId", "labirinto_id", "id")
+                          if key in entry), None)
+        if entry is not None:
+            ids.append(str(entry))
+    return ids
+
+class MazeRunner:
+    """
+    Solves many mazes of one group concurrently.
+    Each maze gets its own WebSocketMazeSolver; an asyncio.Semaphore caps how many WebSockets are
+    open at once, so throughput grows with the limit while the server sees a bounded load.
+    """
+    def __init__(self,
+                 grupo_id: str,
+                 websocket_url: str,
+                 concurrency: int = 4,
+                 solver_kwargs: Optional[Dict[str, Any]] = None):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.grupo_id = grupo_id
+        self.websocket_url = websocket_url
+        self.concurrency = concurrency
+        self.solver_kwargs = {"visualize": False, "log_level": LogLevel.SILENT, **(solver_kwargs or {})}
+        self.open_connections = 0
+        self.peak_connections = 0
+
+    async def _solve_one(self, labirinto_id: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"labirinto_id": labirinto_id}
+        async with semaphore:
+            self.open_connections += 1
+            self.peak_connections = max(self.peak_connections, self.open_connections)
+            start = time.perf_counter()
+            solver = WebSocketMazeSolver(MazeConfig(self.grupo_id, labirinto_id, self.websocket_url),
+                                         **self.solver_kwargs)
+            try:
+                path, weight = await solver.explore()
+                result["status"] = "ok" if path else "no_path"
+            except Exception as e:
+                path, weight = [], 0.0
+                result.update(status="error", error=f"{type(e).__name__}: {e}")
+            finally:
+                self.open_connections -= 1
+            result["wall_time"] = time.perf_counter() - start
+
+        result.update(path=path, path_weight=weight)
+        labirinto = solver.labirinto
+        if labirinto is not None:
+            result.update(moves=labirinto.move_count, invalid_moves=labirinto.invalid_moves,
+                          traversed_weight=labirinto.total_weight, explored_vertices=len(labirinto.visited_states),
+                          budget_exhausted=solver.budget_exhausted)
+        elif result["status"] == "no_path":
+            result["status"] = "error"  # explore() swallowed a connection error
+        return result
+
+    async def run(self, labirinto_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Per-maze results, in the order the ids were given"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        return await asyncio.gather(*(self._solve_one(str(i), semaphore) for i in labirinto_ids))
+
+def summarize(results: List[Dict[str, Any]], wall_time: float) -> Dict[str, Any]:
+    """Aggregate figures over per-maze results"""
+    solved = [r for r in results if r["status"] == "ok"]
+    return {
+        "mazes": len(results),
+        "solved": len(solved),
+        "failed": len(results) - len(solved),
+        "total_moves": sum(r.get("moves", 0) for r in results),
+        "total_path_weight": sum(r["path_weight"] for r in solved),
+        "wall_time": wall_time,
+        "sum_maze_time": sum(r["wall_time"] for r in results),
+        "mazes_per_second": len(results) / wall_time if wall_time else None,
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Solve many mazes of a group concurrently")
+    parser.add_argument("ids", nargs="*", help="Maze ids or ranges (e.g. 1 4-9); omit to list them from the API")
+    parser.add_argument("--grupo", default=os.getenv('MAZE_GRUPO_ID'), help="Group id (default: MAZE_GRUPO_ID)")
+    parser.add_argument("--url", default=os.getenv('MAZE_WEBSOCKET_URL'),
+                        help="WebSocket base URL (default: MAZE_WEBSOCKET_URL)")
+    parser.add_argument("--api-url", help="HTTP API used to list the group's mazes (default: derived from --url)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum open WebSockets")
+    parser.add_argument("--planner", choices=WebSocketMazeSolver.PLANNERS, default="dfs")
+    parser.add_argument("--early-stop", action="store_true")
+    parser.add_argument("--pipeline", type=int, default=1)
+    parser.add_argument("--cache", nargs="?", const=os.path.join("results", "cache"),
+                        help="Reuse graphs explored in previous runs (cache directory, default results/cache)")
+    parser.add_argument("--checkpoint", action="store_true",
+                        help="Checkpoint each exploration to results/maze_{id}/checkpoint.json and resume from it")
+    parser.add_argument("--reconnects", type=int, default=3, help="Reconnect attempts after a dropped connection")
+    parser.add_argument("--metrics", action="store_true",
+                        help="Write per-maze metrics.json and metrics.prom to results/maze_{id}/")
+    parser.add_argument("--profile", action="store_true",
+                        help=f"Capture one cProfile of the whole run in {PROFILE_DIR}/profile.pstats")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help=f"Capture tracemalloc statistics of the whole run in {PROFILE_DIR}/memory.json")
+    parser.add_argument("--move-budget", type=int, help="Stop exploring after this many moves, keeping the best path so far")
+    parser.add_argument("--time-budget", type=float, help="Stop exploring after this many seconds, keeping the best path so far")
+    parser.add_argument("--output", help="Write per-maze results and the summary to this JSON file")
+    args = parser.parse_args(argv)
+
+    if not args.grupo or not args.url:
+        parser.error("--grupo and --url (or MAZE_GRUPO_ID and MAZE_WEBSOCKET_URL) are required")
+
+    ids = parse_maze_ids(args.ids) if args.ids else fetch_maze_ids(args.api_url or api_url_from_websocket(args.url),
+                                                                    args.grupo)
+    if not ids:
+        print("❌ No mazes to solve")
+        return 1
+
+    runner = MazeRunner(args.grupo, args.url, args.concurrency,
+                        solver_kwargs={"planner": args.planner, "early_stop": args.early_stop,
+                                       "pipeline": args.pipeline,
+                                       "cache": MazeCache(args.cache) if args.cache else None,
+                                       "checkpoint": args.checkpoint, "max_reconnects": args.reconnects,
+                                       "metrics": args.metrics, "move_budget": args.move_budget,
+                                       "time_budget": args.time_budget})
+    print(f"\n🌐 Solving {len(ids)} mazes of group {args.grupo} with up to {args.concurrency} connections")
+    profiler = SolverProfiler(cpu=args.profile, memory=args.trace_memory) if args.profile or args.trace_memory else None
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.start()
+    try:
+        results = asyncio.run(runner.run(ids))
+    finally:
+        if profiler is not None:
+            profiler.stop()
+    summary = summarize(results, time.perf_counter() - start)
+
+    for r in results:
+        print(f"{r['labirinto_id']:>24}: {r['status']:>7}  weight={r['path_weight']}  moves={r.get('moves')}  "
+              f"wall={r['wall_time']:.2f}s" + (f"  {r['error']}" if "error" in r else ""))
+    print(f"\n🏁 {summary['solved']}/{summary['mazes']} solved in {summary['wall_time']:.2f}s "
+          f"({summary['mazes_per_second']:.2f} mazes/s, {summary['sum_maze_time']:.2f}s of maze time)")
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"summary": summary, "results": results}, f, indent=2)
+        print(f"Results saved in: {args.output}")
+    if profiler is not None:
+        paths = profiler.write(PROFILE_DIR)
+        if profiler.memory_report is not None:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            paths.append(os.path.join(PROFILE_DIR, "memory.json"))
+            with open(paths[-1], 'w', encoding='utf-8') as f:
+                json.dump(profiler.memory_report, f, indent=2)
+        print(f"Profile saved in: {', '.join(paths)}")
+    return 0 if summary["failed"] == 0 else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
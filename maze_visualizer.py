@@ -1,7 +1,120 @@
 from colorama import Fore, Style, init
-from typing import List, Set, Dict, Tuple, Optional, TextIO
+from collections import Counter, deque
+from bisect import bisect_left
+from typing import Any, Iterable, Iterator, List, Set, Dict, Tuple, Optional, TextIO
+import json
 import os
 
+# generate_html(mode="auto") switches from the vis.js network to the static canvas export above this size
+STATIC_HTML_MIN_VERTICES = 1000
+
+# Console colors of the text rendering symbols (weights are white)
+_COLORS = {'E': Fore.RED, 'S': Fore.RED, '█': Fore.BLUE, 'Θ': Fore.BLUE}
+
+STATIC_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Maze Visualization</title>
+<style>
+  html, body { margin: 0; height: 100%; font-family: sans-serif; }
+  #info { position: absolute; top: 8px; left: 8px; background: rgba(255,255,255,0.85); padding: 4px 8px; }
+  canvas { display: block; width: 100%; height: 100%; cursor: grab; }
+</style>
+</head>
+<body>
+<div id="info"></div>
+<canvas id="maze"></canvas>
+<script>
+// nodes: ids, x, y, types ("0" normal, "1" entrance, "2" exit); edges: flat [a, b, weight a->b, weight b->a]
+// with node indices and null for a missing direction; path: node indices of the shortest path
+const G = GRAPH_DATA;
+const canvas = document.getElementById("maze");
+const ctx = canvas.getContext("2d");
+const n = G.ids.length, m = G.edges.length / 4;
+let minX = Infinity, minY = Infinity, maxX = -Infinity, maxY = -Infinity;
+for (let i = 0; i < n; i++) {
+  minX = Math.min(minX, G.x[i]); maxX = Math.max(maxX, G.x[i]);
+  minY = Math.min(minY, G.y[i]); maxY = Math.max(maxY, G.y[i]);
+}
+let scale = 1, offsetX = 0, offsetY = 0;
+function fit() {
+  canvas.width = canvas.clientWidth * devicePixelRatio;
+  canvas.height = canvas.clientHeight * devicePixelRatio;
+  scale = Math.min(canvas.width / (maxX - minX + 2), canvas.height / (maxY - minY + 2));
+  offsetX = (canvas.width - (maxX - minX) * scale) / 2 - minX * scale;
+  offsetY = (canvas.height - (maxY - minY) * scale) / 2 - minY * scale;
+}
+function sx(i) { return G.x[i] * scale + offsetX; }
+function sy(i) { return G.y[i] * scale + offsetY; }
+function strokeEdges(filter, color, width) {
+  ctx.beginPath();
+  for (let e = 0; e < m; e++) {
+    if (!filter(e)) continue;
+    const a = G.edges[4 * e], b = G.edges[4 * e + 1];
+    ctx.moveTo(sx(a), sy(a));
+    ctx.lineTo(sx(b), sy(b));
+  }
+  ctx.strokeStyle = color; ctx.lineWidth = width; ctx.stroke();
+}
+function draw() {
+  ctx.setTransform(1, 0, 0, 1, 0, 0);
+  ctx.fillStyle = "#fff"; ctx.fillRect(0, 0, canvas.width, canvas.height);
+  const width = Math.max(1, Math.min(4, scale / 4));
+  strokeEdges(e => G.edges[4 * e + 2] !== null && G.edges[4 * e + 3] !== null, "#97a8c2", width);
+  strokeEdges(e => G.edges[4 * e + 2] === null || G.edges[4 * e + 3] === null, "#e0a040", width);
+  if (G.path.length > 1) {
+    ctx.beginPath();
+    ctx.moveTo(sx(G.path[0]), sy(G.path[0]));
+    for (let k = 1; k < G.path.length; k++) ctx.lineTo(sx(G.path[k]), sy(G.path[k]));
+    ctx.strokeStyle = "#ff0000"; ctx.lineWidth = width * 2; ctx.stroke();
+  }
+  const radius = Math.max(3, scale / 3);
+  for (let i = 0; i < n; i++) {
+    if (G.types[i] === "0") continue;
+    ctx.beginPath(); ctx.arc(sx(i), sy(i), radius, 0, 2 * Math.PI);
+    ctx.fillStyle = G.types[i] === "1" ? "#ff8080" : "#40c040"; ctx.fill();
+  }
+  if (scale >= 24) labels();
+  document.getElementById("info").textContent =
+    n + " vertices, " + m + " edges, path " + Math.max(0, G.path.length - 1) + " moves (wheel: zoom, drag: pan)";
+}
+function visible(i) { const x = sx(i), y = sy(i); return x >= 0 && y >= 0 && x <= canvas.width && y <= canvas.height; }
+function labels() {
+  ctx.fillStyle = "#000"; ctx.font = Math.min(14, scale / 3) * devicePixelRatio + "px sans-serif";
+  ctx.textAlign = "center"; ctx.textBaseline = "middle";
+  for (let i = 0; i < n; i++) if (visible(i)) ctx.fillText(G.ids[i], sx(i), sy(i) - scale / 4);
+  ctx.fillStyle = "#555";
+  for (let e = 0; e < m; e++) {
+    const a = G.edges[4 * e], b = G.edges[4 * e + 1];
+    if (!visible(a) && !visible(b)) continue;
+    const w = [G.edges[4 * e + 2], G.edges[4 * e + 3]].filter(v => v !== null);
+    ctx.fillText(w[0] === w[w.length - 1] ? w[0] : w.join("/"), (sx(a) + sx(b)) / 2, (sy(a) + sy(b)) / 2);
+  }
+}
+let dragging = null, pending = false;
+function redraw() { if (!pending) { pending = true; requestAnimationFrame(() => { pending = false; draw(); }); } }
+canvas.addEventListener("wheel", ev => {
+  ev.preventDefault();
+  const factor = ev.deltaY < 0 ? 1.25 : 0.8, x = ev.offsetX * devicePixelRatio, y = ev.offsetY * devicePixelRatio;
+  offsetX = x - (x - offsetX) * factor; offsetY = y - (y - offsetY) * factor; scale *= factor;
+  redraw();
+}, { passive: false });
+canvas.addEventListener("mousedown", ev => { dragging = [ev.clientX, ev.clientY]; });
+window.addEventListener("mouseup", () => { dragging = null; });
+window.addEventListener("mousemove", ev => {
+  if (!dragging) return;
+  offsetX += (ev.clientX - dragging[0]) * devicePixelRatio; offsetY += (ev.clientY - dragging[1]) * devicePixelRatio;
+  dragging = [ev.clientX, ev.clientY];
+  redraw();
+});
+window.addEventListener("resize", () => { fit(); redraw(); });
+fit(); draw();
+</script>
+</body>
+</html>
+"""
+
 class WebSocketMazeVisualizer:
     """
     Creates a visual representation of the WebSocket maze.
@@ -11,6 +124,12 @@ class WebSocketMazeVisualizer:
         self.vertices = vertices
         self.entrada = entrada
         self.grid_size = self._calculate_grid_size()
+        # Sparse text rendering state: base glyph per vertex and vertex columns per row, built lazily
+        self._glyphs: Dict[int, str] = {}
+        self._rows: Optional[Dict[int, List[int]]] = None
+        self._row_keys: List[int] = []
+        self._indexed_vertices = -1
+        self._width: Optional[int] = None
         init(autoreset=True)
 
     def _calculate_grid_size(self) -> int:
@@ -30,10 +149,50 @@ class WebSocketMazeVisualizer:
             else:
                 print(line)
 
+    @property
+    def row_width(self) -> int:
+        """Columns per row of the text layout: the grid width when ids are cells, else grid_size"""
+        if self._width is None:
+            self._width = self.grid_width() or self.grid_size
+        return self._width
+
+    def _row_index(self) -> Dict[int, List[int]]:
+        """
+        Sorted columns of the existing vertices, per row. Rebuilt only when vertices were added,
+        so repeated renders (and tiles) only look at the rows they show.
+        """
+        if self._rows is None or self._indexed_vertices != len(self.vertices):
+            width = self.row_width
+            rows: Dict[int, List[int]] = {}
+            for vertex_id in self.vertices:
+                y, x = divmod(vertex_id, width)
+                rows.setdefault(y, []).append(x)
+            for columns in rows.values():
+                columns.sort()
+            self._rows = rows
+            self._row_keys = sorted(rows)
+            self._indexed_vertices = len(self.vertices)
+        return self._rows
+
+    def invalidate(self) -> None:
+        """Drops cached glyphs and the row index (needed only if known vertices changed in place)"""
+        self._glyphs.clear()
+        self._rows = None
+        self._width = None
+
+    def _glyph(self, vertex_id: int) -> str:
+        """Minimum edge weight of a vertex, computed once per vertex"""
+        glyph = self._glyphs.get(vertex_id)
+        if glyph is None:
+            weights = [int(w) for _, w in self.vertices[vertex_id][1]]
+            glyph = self._glyphs[vertex_id] = str(min(weights) if weights else 0)
+        return glyph
+
     def exibir_labirinto(self,
                         caminho_percorrido: List[int] = None,
                         menor_caminho: List[int] = None,
-                        arquivo: Optional[TextIO] = None) -> None:
+                        arquivo: Optional[TextIO] = None,
+                        viewport: Optional[Tuple[int, int, int, int]] = None) -> None:
         """
         Exibe o labirinto com a seguinte simbologia:
         - E: ponto de entrada
@@ -41,69 +200,195 @@ class WebSocketMazeVisualizer:
         - █: caminho mínimo
         - Θ: caminho percorrido
         - n: peso da aresta (número inteiro)
+
+        Só os vértices existentes são percorridos: linhas sem vértices são omitidas e só aparecem as
+        colunas que têm algum vértice. viewport=(x0, y0, x1, y1), com x1/y1 exclusivos, limita a saída a
+        um recorte do labirinto (veja render_tiles).
         """
         if arquivo is None:
             init(autoreset=True)
+        for linha in self.render_lines(caminho_percorrido, menor_caminho, colorido=arquivo is None,
+                                       viewport=viewport):
+            if arquivo:
+                arquivo.write(linha + '\n')
+            else:
+                print(linha)
 
+    def render_lines(self,
+                     caminho_percorrido: Iterable[int] = None,
+                     menor_caminho: Iterable[int] = None,
+                     colorido: bool = False,
+                     viewport: Optional[Tuple[int, int, int, int]] = None) -> List[str]:
+        """Lines of exibir_labirinto (column header first)"""
+        rows = self._row_index()
+        width = self.row_width
         conjunto_caminho_percorrido = set(caminho_percorrido) if caminho_percorrido else set()
         conjunto_menor_caminho = set(menor_caminho) if menor_caminho else set()
 
-        linhas_labirinto = []
-
-        # Índices das colunas
-        linha_indices = "  " + ''.join(f"{x:2}" for x in range(self.grid_size))
-        linhas_labirinto.append(linha_indices)
-
-        # Gera o labirinto
-        for y in range(self.grid_size):
-            linha = f"{y:2} "
-            for x in range(self.grid_size):
-                vertex_id = y * self.grid_size + x
-
-                if vertex_id not in self.vertices:
-                    linha += "  "
-                    continue
-
-                vertex_type, adjacents = self.vertices[vertex_id]
-
-                # Determina o símbolo
+        if viewport is None:
+            x0, y0, x1, y1 = 0, 0, width, (self._row_keys[-1] + 1 if self._row_keys else 0)
+        else:
+            x0, y0, x1, y1 = viewport
+        row_keys = self._row_keys[bisect_left(self._row_keys, y0):bisect_left(self._row_keys, y1)]
+
+        # Visible cells per row, and the columns that have at least one of them
+        visible: List[Tuple[int, List[int]]] = []
+        used_columns: Set[int] = set()
+        for y in row_keys:
+            columns = rows[y]
+            columns = columns[bisect_left(columns, x0):bisect_left(columns, x1)]
+            if columns:
+                visible.append((y, columns))
+                used_columns.update(columns)
+        if not visible:
+            return []
+
+        symbols: Dict[int, str] = {}
+        cell = 1
+        for y, columns in visible:
+            for x in columns:
+                vertex_id = y * width + x
                 if vertex_id == self.entrada:
                     simbolo = 'E'
-                    if arquivo is None:
-                        simbolo = f"{Fore.RED}E{Style.RESET_ALL}"
-                elif vertex_type == "2":  # Saída
+                elif self.vertices[vertex_id][0] == "2":  # Saída
                     simbolo = 'S'
-                    if arquivo is None:
-                        simbolo = f"{Fore.RED}S{Style.RESET_ALL}"
                 elif vertex_id in conjunto_menor_caminho:
                     simbolo = '█'
-                    if arquivo is None:
-                        simbolo = f"{Fore.BLUE}█{Style.RESET_ALL}"
                 elif vertex_id in conjunto_caminho_percorrido:
                     simbolo = 'Θ'
-                    if arquivo is None:
-                        simbolo = f"{Fore.BLUE}Θ{Style.RESET_ALL}"
                 else:
-                    # Get minimum weight for display
-                    weights = [int(w) for _, w in adjacents]
-                    min_weight = min(weights) if weights else 0
-                    simbolo = str(min_weight)
-                    if arquivo is None:
-                        simbolo = f"{Fore.WHITE}{min_weight}{Style.RESET_ALL}"
-
-                linha += f"{simbolo:2} "
-            linhas_labirinto.append(linha)
-
-        # Escreve as linhas
-        if arquivo:
-            for linha in linhas_labirinto:
-                arquivo.write(linha + '\n')
-        else:
-            for linha in linhas_labirinto:
-                print(linha)
+                    simbolo = self._glyph(vertex_id)
+                symbols[vertex_id] = simbolo
+                cell = max(cell, len(simbolo))
+
+        ordered_columns = sorted(used_columns)
+        position = {x: i for i, x in enumerate(ordered_columns)}
+        label = len(str(visible[-1][0]))
+        linhas = [" " * (label + 1) + "".join(f"{x % 10:<{cell}} " for x in ordered_columns).rstrip()]
+        blank = " " * (cell + 1)
+        for y, columns in visible:
+            parts = [blank] * len(ordered_columns)
+            for x in columns:
+                simbolo = symbols[y * width + x]
+                padding = " " * (cell + 1 - len(simbolo))
+                if colorido:
+                    simbolo = f"{_COLORS.get(simbolo, Fore.WHITE)}{simbolo}{Style.RESET_ALL}"
+                parts[position[x]] = simbolo + padding
+            linhas.append(f"{y:>{label}} " + "".join(parts[:position[columns[-1]] + 1]).rstrip())
+        return linhas
+
+    def render_tiles(self,
+                     tile_width: int = 80,
+                     tile_height: int = 40,
+                     **kwargs) -> Iterator[Tuple[Tuple[int, int, int, int], List[str]]]:
+        """
+        (viewport, lines) of every non-empty tile of the maze, row by row, for inspecting mazes that are
+        too big to print at once; kwargs go to render_lines.
+        """
+        self._row_index()
+        if not self._row_keys:
+            return
+        for y0 in range(self._row_keys[0] - self._row_keys[0] % tile_height, self._row_keys[-1] + 1, tile_height):
+            for x0 in range(0, self.row_width, tile_width):
+                viewport = (x0, y0, x0 + tile_width, y0 + tile_height)
+                lines = self.render_lines(viewport=viewport, **kwargs)
+                if lines:
+                    yield viewport, lines
+
+    def grid_width(self) -> Optional[int]:
+        """
+        Row width W when vertex ids are grid cells (id = y * W + x), i.e. every edge joins ids
+        1 or W apart, as in graphs built from a Labirinto; None otherwise.
+        """
+        gaps = Counter(abs(dest - vertex_id) for vertex_id, (_, adjacents) in self.vertices.items()
+                       for dest, _ in adjacents)
+        gaps.pop(1, None)
+        if not gaps:
+            return None
+        width, _ = gaps.most_common(1)[0]
+        return width if len(gaps) == 1 and width > 1 else None
+
+    def static_layout(self) -> Dict[int, Tuple[int, int]]:
+        """
+        (x, y) of every vertex, computed once in Python: grid cells when ids map to them, otherwise
+        vertices packed row by row in BFS order from the entrance, so neighbours stay close.
+        """
+        width = self.grid_width()
+        if width:
+            return {v: (v % width, v // width) for v in self.vertices}
+
+        order = []
+        seen = set()
+        for root in [self.entrada, *self.vertices]:
+            if root in seen or root not in self.vertices:
+                continue
+            seen.add(root)
+            queue = deque([root])
+            while queue:
+                vertex_id = queue.popleft()
+                order.append(vertex_id)
+                for dest, _ in self.vertices[vertex_id][1]:
+                    if dest not in seen and dest in self.vertices:
+                        seen.add(dest)
+                        queue.append(dest)
+        side = max(1, int(len(order) ** 0.5 + 0.999))
+        return {v: (i % side, i // side) for i, v in enumerate(order)}
+
+    def graph_data(self, menor_caminho: List[int] = None) -> Dict[str, Any]:
+        """
+        Compact JSON-ready form of the graph for the static HTML export: parallel node arrays and one
+        entry per undirected edge carrying the weight of each direction (None if it does not exist).
+        Edges to vertices that were never visited are left out, as they have no position.
+        """
+        layout = self.static_layout()
+        ids = list(self.vertices)
+        index = {v: i for i, v in enumerate(ids)}
+        types = "".join("1" if v == self.entrada else ("2" if self.vertices[v][0] == "2" else "0") for v in ids)
+
+        edges: Dict[Tuple[int, int], List[Optional[float]]] = {}
+        for vertex_id, (_, adjacents) in self.vertices.items():
+            for dest, weight in adjacents:
+                if dest not in index or dest == vertex_id:
+                    continue
+                a, b = index[vertex_id], index[dest]
+                key = (a, b) if a < b else (b, a)
+                weights = edges.setdefault(key, [None, None])
+                weights[0 if a < b else 1] = _compact_number(weight)
+
+        flat: List[Any] = []
+        for (a, b), (forward, backward) in edges.items():
+            flat.extend((a, b, forward, backward))
+        return {
+            "ids": ids,
+            "x": [layout[v][0] for v in ids],
+            "y": [layout[v][1] for v in ids],
+            "types": types,
+            "edges": flat,
+            "path": [index[v] for v in (menor_caminho or []) if v in index],
+        }
+
+    def generate_static_html(self, menor_caminho: List[int] = None) -> str:
+        """
+        Self-contained HTML (no CDN, works offline) drawing the graph on a canvas from compact JSON and
+        a layout precomputed in Python; opens in seconds for graphs with hundreds of thousands of vertices.
+        """
+        data = json.dumps(self.graph_data(menor_caminho), separators=(",", ":"))
+        # A "</script>" inside the data would end the script element
+        return STATIC_HTML_TEMPLATE.replace("GRAPH_DATA", data.replace("</", "<\\/"))
+
+    def generate_html(self, menor_caminho: List[int] = None, mode: str = "auto") -> str:
+        """
+        Generates HTML content for graph visualization.
+        mode: "interactive" (vis.js network with physics, needs the CDN), "static" (generate_static_html)
+        or "auto" (static from STATIC_HTML_MIN_VERTICES vertices on).
+        """
+        if mode == "auto":
+            mode = "static" if len(self.vertices) >= STATIC_HTML_MIN_VERTICES else "interactive"
+        if mode == "static":
+            return self.generate_static_html(menor_caminho)
+        if mode != "interactive":
+            raise ValueError(f"Unknown HTML mode: {mode}")
 
-    def generate_html(self, menor_caminho: List[int] = None) -> str:
-        """Generates HTML content for graph visualization"""
         html_template = """
         <!DOCTYPE html>
         <html>
@@ -247,6 +532,10 @@ class WebSocketMazeVisualizer:
 
         return html_content
 
+def _compact_number(value: float):
+    """Integral weights as ints, so the JSON says 3 instead of 3.0"""
+    return int(value) if float(value).is_integer() else value
+
 def create_visualizer(visited_states: Dict[int, Tuple[str, List[Tuple[int, float]]]],
                      entrada: int) -> WebSocketMazeVisualizer:
     """Creates a new WebSocketMazeVisualizer instance"""
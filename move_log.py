@@ -0,0 +1,127 @@
+import os
+import queue
+import sys
+import threading
+from collections import deque
+from enum import IntEnum
+from typing import Deque, List, Optional, TextIO, Tuple, Union
+
+class LogLevel(IntEnum):
+    SILENT = 0   # Nothing on the console
+    SUMMARY = 1  # Start, phase changes and results
+    MOVES = 2    # Every move with the server response (the old move_to output)
+
+    @classmethod
+    def from_value(cls, value: Union[str, int, "LogLevel"]) -> "LogLevel":
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, int) or str(value).strip().isdigit():
+            return cls(int(value))
+        name = str(value).strip().upper().replace("-", "_")
+        aliases = {"PER_MOVE": "MOVES", "MOVE": "MOVES", "DEBUG": "MOVES", "QUIET": "SILENT"}
+        try:
+            return cls[aliases.get(name, name)]
+        except KeyError:
+            raise ValueError(f"Invalid log level: {value}") from None
+
+def level_from_env(default: LogLevel = LogLevel.SUMMARY) -> LogLevel:
+    """Log level from MAZE_LOG_LEVEL (silent, summary, moves or 0-2)"""
+    value = os.getenv('MAZE_LOG_LEVEL')
+    return LogLevel.from_value(value) if value else default
+
+# (move number, origin, target, raw server response)
+MoveRecord = Tuple[int, int, int, str]
+
+class _FileFlusher:
+    """Appends lines to a file from a background thread, so the event loop never blocks on disk I/O"""
+    _STOP = None
+
+    def __init__(self, path: str):
+        self.path = path
+        self._queue: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="move-log-flusher", daemon=True)
+        self._thread.start()
+
+    def write(self, line: str) -> None:
+        self._queue.put(line)
+
+    def _run(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            while True:
+                line = self._queue.get()
+                batch = []
+                # Drain whatever piled up while waiting and write it in one call
+                while line is not self._STOP:
+                    batch.append(line)
+                    try:
+                        line = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                f.write("".join(batch))
+                f.flush()
+                if line is self._STOP:
+                    return
+
+    def close(self) -> None:
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+class MoveLog:
+    """
+    Leveled log of the solver.
+    Every move goes into a fixed-size ring buffer (a tuple append, no formatting) that can be dumped
+    after a failure; console output depends on the level, and a log file, when given, receives
+    every move through a background thread.
+    """
+    def __init__(self,
+                 level: Union[str, int, LogLevel, None] = None,
+                 buffer_size: int = 1000,
+                 path: Optional[str] = None,
+                 stream: Optional[TextIO] = None):
+        self.level = level_from_env() if level is None else LogLevel.from_value(level)
+        self.recent: Deque[MoveRecord] = deque(maxlen=buffer_size)
+        self.stream = stream
+        self._file = _FileFlusher(path) if path else None
+        self._moves = 0
+
+    def _print(self, message: str) -> None:
+        print(message, file=self.stream or sys.stdout)
+
+    @property
+    def moves_enabled(self) -> bool:
+        return self.level >= LogLevel.MOVES
+
+    def move(self, origin: int, target: int, response: str) -> None:
+        """Records one move and the server response"""
+        self._moves += 1
+        self.recent.append((self._moves, origin, target, response))
+        if self.level >= LogLevel.MOVES:
+            self._print(f"🔄 {origin} -> {target}\n📩 Server response: {response}")
+        if self._file is not None:
+            self._file.write(f"{self._moves}\t{origin}\t{target}\t{response}\n")
+
+    def summary(self, message: str) -> None:
+        if self.level >= LogLevel.SUMMARY:
+            self._print(message)
+        if self._file is not None:
+            self._file.write(f"# {message.strip()}\n")
+
+    def detail(self, message: str) -> None:
+        """Messages only worth showing together with every move"""
+        if self.level >= LogLevel.MOVES:
+            self._print(message)
+
+    def dump(self, stream: Optional[TextIO] = None, last: Optional[int] = None) -> List[MoveRecord]:
+        """Writes the most recent moves (post-mortem) and returns them"""
+        records = list(self.recent)[-last:] if last else list(self.recent)
+        out = stream or self.stream or sys.stdout
+        print(f"🗒️ Last {len(records)} moves:", file=out)
+        for number, origin, target, response in records:
+            print(f"  #{number} {origin} -> {target}: {response}", file=out)
+        return records
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
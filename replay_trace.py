@@ -0,0 +1,95 @@
+import argparse
+import base64
+import sys
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+from labirinto import Labirinto
+from step_trace import StepRecord, read_trace
+
+def labirinto_from_header(header: Dict[str, Any]) -> Labirinto:
+    """Rebuilds the traced Labirinto grid (only traces of Labirinto/LabirintoGrafo explorations have one)"""
+    if "celulas" not in header:
+        raise ValueError("Trace has no maze grid to draw (it was not recorded over a Labirinto)")
+    pesos = header.get("pesos")
+    return Labirinto.de_grade(header["largura"], header["altura"], base64.b64decode(header["celulas"]),
+                              header["entrada"], header["saida"],
+                              base64.b64decode(pesos) if pesos is not None else None)
+
+class TraceReplay:
+    """
+    Replays a step trace over its maze. The traversed cells are accumulated as steps advance,
+    so an animation touches each step once instead of rebuilding the path for every frame.
+    """
+    def __init__(self, header: Dict[str, Any], steps: List[StepRecord]):
+        self.labirinto = labirinto_from_header(header)
+        self.ids = header.get("vertices") == "ids"
+        self.steps = steps
+        self.position = 0  # Steps applied so far
+        self.traversed: Set[Tuple[int, int]] = set()
+        self.agent: Optional[Tuple[int, int]] = None
+
+    def _cell(self, vertex) -> Tuple[int, int]:
+        if self.ids:
+            return vertex % self.labirinto.largura, vertex // self.labirinto.largura
+        return vertex
+
+    def seek(self, step: int) -> None:
+        """Moves to the state right after step (1-based); going back restarts from the beginning"""
+        step = max(0, min(step, len(self.steps)))
+        if step < self.position:
+            self.position, self.traversed, self.agent = 0, set(), None
+        for _, _, target, _, _ in self.steps[self.position:step]:
+            self.agent = self._cell(target)
+            self.traversed.add(self.agent)
+        self.position = step
+
+    def render(self, path: Optional[List] = None, arquivo=None) -> None:
+        record = self.steps[self.position - 1] if self.position else None
+        line = f"Passo {self.position}/{len(self.steps)}"
+        if record is not None:
+            line += f" ({record[4]} {record[1]} -> {record[2]}, peso {record[3]})"
+        if arquivo is None:
+            print(line)
+        else:
+            arquivo.write(line + "\n")
+        self.labirinto.exibir_labirinto(caminho_percorrido=self.traversed,
+                                        menor_caminho=[self._cell(v) for v in path] if path else None,
+                                        agente_posicao=self.agent, arquivo=arquivo)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Render steps of an exploration trace (AgenteExplorador JSONL)")
+    parser.add_argument("trace", help="Trace file written with imprimir_passos_no_arquivo=True")
+    parser.add_argument("--step", type=int, help="Step to render (default: the last one)")
+    parser.add_argument("--animate", action="store_true", help="Play every --every-th step in the terminal")
+    parser.add_argument("--every", type=int, default=1, help="Steps between animation frames")
+    parser.add_argument("--delay", type=float, default=0.05, help="Seconds between animation frames")
+    parser.add_argument("--output", help="Write the frame(s) to this text file instead of the console")
+    args = parser.parse_args(argv)
+
+    header, steps, result = read_trace(args.trace)
+    replay = TraceReplay(header, steps)
+    last = args.step if args.step is not None else len(steps)
+    arquivo = open(args.output, 'w', encoding='utf-8') if args.output else None
+    try:
+        if args.animate:
+            for step in range(1, last + 1, max(1, args.every)):
+                replay.seek(step)
+                if arquivo is None:
+                    sys.stdout.write("\033[H\033[2J")
+                replay.render(arquivo=arquivo)
+                if arquivo is None:
+                    time.sleep(args.delay)
+        replay.seek(last)
+        path = result.get("path") if result and last == len(steps) else None
+        replay.render(path=path, arquivo=arquivo)
+    finally:
+        if arquivo is not None:
+            arquivo.close()
+
+    if result is not None and last == len(steps):
+        print(f"Exit found: {result.get('exit_found')}  path_weight={result.get('path_weight')}  "
+              f"traversed_weight={result.get('traversed_weight')}  moves={result.get('moves')}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
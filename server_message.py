@@ -0,0 +1,59 @@
+import re
+from math import isfinite
+from typing import Dict, List, Optional, Tuple
+from graph_store import GraphStore
+
+# Everything up to the opening bracket of the adjacency list; compiled once at import
+HEADER_PATTERN = re.compile(r"Vértice atual: (\d+), Tipo: (\d+|normal|saida|entrada), Adjacentes\(Vertice, Peso\): \[")
+
+_STRIP_PARENS = str.maketrans("", "", "()")
+
+def _unique_adjacents(body: str) -> Dict[int, float]:
+    if not body.strip():
+        return {}
+    fields = body.translate(_STRIP_PARENS).split(",")
+    if len(fields) % 2:
+        raise ValueError(f"Invalid adjacency list: [{body}]")
+    try:
+        dests = list(map(int, fields[0::2]))
+        weights = list(map(float, fields[1::2]))
+    except ValueError:
+        raise ValueError(f"Invalid adjacency list: [{body}]") from None
+    # float() also takes 'nan', 'inf' and signs; shortest paths need finite, non-negative weights
+    if not (0 <= min(weights) and isfinite(sum(weights))):
+        raise ValueError(f"Invalid edge weight in: [{body}]")
+
+    unique: Dict[int, float] = dict(zip(dests, weights))
+    if len(unique) != len(dests):
+        # Duplicates: dict(zip()) kept the last weight, redo keeping the lightest
+        unique = {}
+        for dest, weight in zip(dests, weights):
+            if dest not in unique or weight < unique[dest]:
+                unique[dest] = weight
+    return unique
+
+def parse_adjacents(body: str) -> List[Tuple[int, float]]:
+    """
+    Parses '(d, w), (d, w), ...' into [(d, w), ...], collapsing duplicate destinations in the same pass
+    (the lightest weight wins, order of first appearance is kept).
+    One translate + split and two C-level map() calls instead of a regex match per edge.
+    """
+    return list(_unique_adjacents(body).items())
+
+def parse_server_message(message: str, store: Optional[GraphStore] = None) -> Tuple[int, str, List[Tuple[int, float]]]:
+    """
+    Parses a 'Vértice atual: X, Tipo: T, Adjacentes(Vertice, Peso): [...]' message into
+    (vertex, type, adjacents) with duplicate edges already removed.
+    When a GraphStore is given the vertex is recorded in it as well.
+    """
+    header = HEADER_PATTERN.match(message)
+    end = message.find("]", header.end()) if header else -1
+    if end < 0:
+        raise ValueError(f"Invalid message format: {message}")
+
+    vertex = int(header.group(1))
+    vertex_type = header.group(2)
+    unique = _unique_adjacents(message[header.end():end])
+    if store is not None:
+        store.add_edges(vertex, vertex_type, unique.keys(), unique.values())
+    return vertex, vertex_type, list(unique.items())
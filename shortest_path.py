@@ -0,0 +1,189 @@
+import heapq
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from graph_store import FrozenGraph
+from maze_graph import MazeGraph
+from vertex_type import VertexType
+
+def exit_vertices(graph: MazeGraph) -> Set[int]:
+    """Exit vertices of a graph, converting each distinct type string only once"""
+    types: Dict[str, VertexType] = {}
+    exits = set()
+    for vertex_id, (tipo, _) in graph.items():
+        vertex_type = types.get(tipo)
+        if vertex_type is None:
+            vertex_type = types[tipo] = VertexType.from_value(tipo)
+        if vertex_type == VertexType.SAIDA:
+            exits.add(vertex_id)
+    return exits
+
+def _build_path(parents: Dict[int, int], target: int) -> List[int]:
+    path = [target]
+    vertex = target
+    while vertex in parents:
+        vertex = parents[vertex]
+        path.append(vertex)
+    path.reverse()
+    return path
+
+def dijkstra_to_exits(graph: MazeGraph, start: int, exits: Iterable[int]) -> Tuple[List[int], float]:
+    """
+    Shortest path from start to ANY exit. Binary heap of (distance, vertex) with parent pointers,
+    so no path is copied during the search. Returns ([], 0.0) when no exit is reachable.
+    """
+    exits = exits if isinstance(exits, (set, frozenset)) else set(exits)
+    if isinstance(graph, FrozenGraph):
+        return _dijkstra_csr(graph, start, exits)
+    distances: Dict[int, float] = {start: 0.0}
+    parents: Dict[int, int] = {}
+    heap = [(0.0, start)]
+
+    while heap:
+        distance, vertex = heapq.heappop(heap)
+        if distance > distances[vertex]:
+            continue
+        if vertex in exits:
+            return _build_path(parents, vertex), distance
+        state = graph.get(vertex)
+        if state is None:
+            # Known only as someone's adjacent: its own edges were never revealed
+            continue
+        for dest, weight in state[1]:
+            new_distance = distance + weight
+            if new_distance < distances.get(dest, float('infinity')):
+                distances[dest] = new_distance
+                parents[dest] = vertex
+                heapq.heappush(heap, (new_distance, dest))
+
+    return [], 0.0
+
+def _dijkstra_csr(graph: FrozenGraph, start: int, exits: Set[int]) -> Tuple[List[int], float]:
+    """dijkstra_to_exits over the CSR arrays of a FrozenGraph, like _dial_csr"""
+    dense_index = graph.dense_index
+    starts, degrees, targets, weights = graph.starts, graph.degrees, graph.targets, graph.weights
+    distances: Dict[int, float] = {start: 0.0}
+    parents: Dict[int, int] = {}
+    heap = [(0.0, start)]
+
+    while heap:
+        distance, vertex = heapq.heappop(heap)
+        if distance > distances[vertex]:
+            continue
+        if vertex in exits:
+            return _build_path(parents, vertex), distance
+        index = dense_index(vertex)
+        if index is None:
+            continue
+        start_edge = starts[index]
+        for edge in range(start_edge, start_edge + degrees[index]):
+            dest = targets[edge]
+            new_distance = distance + weights[edge]
+            if new_distance < distances.get(dest, float('infinity')):
+                distances[dest] = new_distance
+                parents[dest] = vertex
+                heapq.heappush(heap, (new_distance, dest))
+
+    return [], 0.0
+
+class _NonIntegerWeight(Exception):
+    pass
+
+def _dial(graph: MazeGraph, start: int, exits: Set[int]) -> Tuple[List[int], float]:
+    buckets: Dict[int, List[int]] = {0: [start]}
+    distances: Dict[int, int] = {start: 0}
+    parents: Dict[int, int] = {}
+    distance = 0
+
+    while buckets:
+        bucket = buckets.pop(distance, None)
+        while bucket:
+            vertex = bucket.pop()
+            if distances[vertex] != distance:
+                continue  # Stale entry, the vertex was settled with a smaller distance
+            if vertex in exits:
+                return _build_path(parents, vertex), float(distance)
+            state = graph.get(vertex)
+            if state is None:
+                continue
+            for dest, weight in state[1]:
+                step = int(weight)
+                if step != weight or step < 0:
+                    raise _NonIntegerWeight()
+                new_distance = distance + step
+                if new_distance < distances.get(dest, new_distance + 1):
+                    distances[dest] = new_distance
+                    parents[dest] = vertex
+                    if new_distance == distance:
+                        bucket.append(dest)
+                    else:
+                        buckets.setdefault(new_distance, []).append(dest)
+        distance += 1
+
+    return [], 0.0
+
+def _dial_csr(graph: FrozenGraph, start: int, exits: Set[int]) -> Tuple[List[int], float]:
+    """_dial over the CSR arrays of a FrozenGraph; no tuples are built per edge"""
+    dense_index = graph.dense_index
+    starts, degrees, targets, weights = graph.starts, graph.degrees, graph.targets, graph.weights
+    buckets: Dict[int, List[int]] = {0: [start]}
+    distances: Dict[int, int] = {start: 0}
+    parents: Dict[int, int] = {}
+    distance = 0
+
+    while buckets:
+        bucket = buckets.pop(distance, None)
+        while bucket:
+            vertex = bucket.pop()
+            if distances[vertex] != distance:
+                continue
+            if vertex in exits:
+                return _build_path(parents, vertex), float(distance)
+            index = dense_index(vertex)
+            if index is None:
+                continue
+            start_edge = starts[index]
+            for edge in range(start_edge, start_edge + degrees[index]):
+                weight = weights[edge]
+                step = int(weight)
+                if step != weight or step < 0:
+                    raise _NonIntegerWeight()
+                dest = targets[edge]
+                new_distance = distance + step
+                if new_distance < distances.get(dest, new_distance + 1):
+                    distances[dest] = new_distance
+                    parents[dest] = vertex
+                    if new_distance == distance:
+                        bucket.append(dest)
+                    else:
+                        buckets.setdefault(new_distance, []).append(dest)
+        distance += 1
+
+    return [], 0.0
+
+def dial_to_exits(graph: MazeGraph, start: int, exits: Iterable[int]) -> Tuple[List[int], float]:
+    """
+    Dial's algorithm: Dijkstra with one bucket per integer distance instead of a binary heap.
+    Server weights are small integers, so each push and pop is O(1) and the scan over empty
+    distances is bounded by the answer. Falls back to dijkstra_to_exits when a weight that is
+    not a non-negative integer shows up. A FrozenGraph is searched directly on its CSR arrays.
+    """
+    exits = exits if isinstance(exits, (set, frozenset)) else set(exits)
+    try:
+        if isinstance(graph, FrozenGraph):
+            return _dial_csr(graph, start, exits)
+        return _dial(graph, start, exits)
+    except _NonIntegerWeight:
+        return dijkstra_to_exits(graph, start, exits)
+
+def shortest_path_to_exit(graph: MazeGraph, start: int, exits: Optional[Iterable[int]] = None,
+                          method: str = "dial") -> Tuple[List[int], float]:
+    """
+    Shortest path from start to any exit, as (path, weight).
+    method: "dial" (bucket queue, default) or "dijkstra" (binary heap).
+    """
+    if exits is None:
+        exits = exit_vertices(graph)
+    if method == "dial":
+        return dial_to_exits(graph, start, exits)
+    if method == "dijkstra":
+        return dijkstra_to_exits(graph, start, exits)
+    raise ValueError(f"Unknown shortest path method: {method}")
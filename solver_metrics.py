@@ -0,0 +1,212 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Upper bounds (seconds) of the round-trip histogram buckets; the last one catches everything
+RTT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, float('inf'))
+
+def default_metrics_dir(labirinto_id: str) -> str:
+    """Same ./results/maze_{id}/ directory as the text and HTML output"""
+    return os.path.join(".", "results", f"maze_{labirinto_id}")
+
+class Histogram:
+    """Fixed-bucket histogram (Prometheus style): one bisect and two additions per observation"""
+    def __init__(self, buckets: Tuple[float, ...] = RTT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given quantile"""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.buckets[-1]
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+class SolverMetrics:
+    """
+    Instrumentation of a solver run: wall time per phase (network waits, parsing, planning, shortest
+    path, rendering...), a histogram of per-move round trips and counters. Recording is a couple of
+    perf_counter calls and dict updates, cheap enough to stay on for every run.
+    """
+    def __init__(self):
+        self.phases: Dict[str, List[float]] = {}  # name -> [seconds, calls]
+        self._network = self.phases["network"] = [0.0, 0]  # Updated on every move, kept at hand
+        self.rtt = Histogram()
+        self.counters: Dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        entry = self.phases.get(phase)
+        if entry is None:
+            self.phases[phase] = [seconds, 1]
+        else:
+            entry[0] += seconds
+            entry[1] += 1
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def round_trip(self, waited: float, rtt: float) -> None:
+        """One move answered: time blocked waiting for it (network phase) and its round trip"""
+        network = self._network
+        network[0] += waited
+        network[1] += 1
+        self.rtt.observe(rtt)
+
+    def count(self, name: str, amount: float = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "phases": {name: {"seconds": seconds, "calls": calls} for name, (seconds, calls) in self.phases.items()},
+            "counters": dict(self.counters),
+            "rtt": {
+                "count": self.rtt.count,
+                "sum": self.rtt.sum,
+                "mean": self.rtt.sum / self.rtt.count if self.rtt.count else None,
+                "p50": self.rtt.quantile(0.5),
+                "p90": self.rtt.quantile(0.9),
+                "p99": self.rtt.quantile(0.99),
+                "buckets": [["+Inf" if bound == float('inf') else bound, count]
+                            for bound, count in self.rtt.cumulative()],
+            },
+        }
+
+    def to_prometheus(self, labels: Optional[Dict[str, str]] = None) -> str:
+        """Prometheus text exposition format"""
+        base = ",".join(f'{key}="{_escape(value)}"' for key, value in (labels or {}).items())
+
+        def series(name: str, value: float, extra: str = "") -> str:
+            inner = ",".join(part for part in (base, extra) if part)
+            return f"{name}{{{inner}}} {value:.9g}" if inner else f"{name} {value:.9g}"
+
+        lines = [
+            "# HELP maze_solver_phase_seconds_total Wall time spent in each solver phase.",
+            "# TYPE maze_solver_phase_seconds_total counter",
+        ]
+        lines += [series("maze_solver_phase_seconds_total", seconds, f'phase="{_escape(name)}"')
+                  for name, (seconds, _) in self.phases.items()]
+        lines += [
+            "# HELP maze_solver_phase_calls_total Times each solver phase was entered.",
+            "# TYPE maze_solver_phase_calls_total counter",
+        ]
+        lines += [series("maze_solver_phase_calls_total", calls, f'phase="{_escape(name)}"')
+                  for name, (_, calls) in self.phases.items()]
+        for name, value in self.counters.items():
+            metric = f"maze_solver_{name}_total"
+            lines += [f"# TYPE {metric} counter", series(metric, value)]
+        lines += [
+            "# HELP maze_solver_rtt_seconds Round trip of each move command.",
+            "# TYPE maze_solver_rtt_seconds histogram",
+        ]
+        for bound, count in self.rtt.cumulative():
+            le = "+Inf" if bound == float('inf') else f"{bound:g}"
+            lines.append(series("maze_solver_rtt_seconds_bucket", count, f'le="{le}"'))
+        lines.append(series("maze_solver_rtt_seconds_sum", self.rtt.sum))
+        lines.append(series("maze_solver_rtt_seconds_count", self.rtt.count))
+        return "\n".join(lines) + "\n"
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+class SolverProfiler:
+    """
+    Opt-in cProfile and/or tracemalloc capture around a run. Both are process-wide in practice
+    (tracemalloc is global, cProfile profiles the whole thread), so use one profiler around
+    everything that runs concurrently, not one per solver.
+    """
+    def __init__(self, cpu: bool = False, memory: bool = False, top: int = 25):
+        self.cpu = cpu
+        self.memory = memory
+        self.top = top
+        self.profile: Optional[cProfile.Profile] = None
+        self.memory_report: Optional[Dict[str, Any]] = None
+        self._tracing = False  # Whether this profiler started tracemalloc (and so may stop it)
+
+    def start(self) -> None:
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        if self.cpu:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+
+    def stop(self) -> None:
+        if self.profile is not None:
+            self.profile.disable()
+        if self._tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            statistics = tracemalloc.take_snapshot().statistics("lineno")[:self.top]
+            tracemalloc.stop()
+            self._tracing = False
+            self.memory_report = {
+                "current_bytes": current,
+                "peak_bytes": peak,
+                "top": [{"where": str(stat.traceback), "bytes": stat.size, "blocks": stat.count} for stat in statistics],
+            }
+
+    def write(self, directory: str) -> List[str]:
+        """profile.pstats (for snakeviz/pstats) and a cumulative-time summary in profile.txt"""
+        if self.profile is None:
+            return []
+        os.makedirs(directory, exist_ok=True)
+        pstats_path = os.path.join(directory, "profile.pstats")
+        text_path = os.path.join(directory, "profile.txt")
+        self.profile.dump_stats(pstats_path)
+        out = io.StringIO()
+        pstats.Stats(self.profile, stream=out).sort_stats("cumulative").print_stats(self.top)
+        with open(text_path, 'w', encoding='utf-8') as f:
+            f.write(out.getvalue())
+        return [pstats_path, text_path]
+
+def write_report(directory: str,
+                 metrics: SolverMetrics,
+                 labels: Dict[str, str],
+                 extra: Optional[Dict[str, Any]] = None,
+                 profiler: Optional[SolverProfiler] = None) -> List[str]:
+    """Writes metrics.json and metrics.prom (plus the profiler output) to directory; returns the paths"""
+    os.makedirs(directory, exist_ok=True)
+    report = {**labels, **(extra or {}), **metrics.to_dict()}
+    if profiler is not None and profiler.memory_report is not None:
+        report["memory"] = profiler.memory_report
+    json_path = os.path.join(directory, "metrics.json")
+    prom_path = os.path.join(directory, "metrics.prom")
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    with open(prom_path, 'w', encoding='utf-8') as f:
+        f.write(metrics.to_prometheus(labels))
+    paths = [json_path, prom_path]
+    if profiler is not None:
+        paths += profiler.write(directory)
+    return paths
@@ -0,0 +1,87 @@
+import base64
+import json
+from typing import Any, Dict, List, Optional, TextIO, Tuple, Union
+
+# Bump when the record layout changes
+TRACE_VERSION = 1
+
+# Step kinds
+START = "start"
+MOVE = "move"
+BACK = "back"
+
+Vertex = Union[int, Tuple[int, int]]
+# (step, origin, target, weight, kind); origin is None for the start step
+StepRecord = Tuple[int, Optional[Vertex], Vertex, float, str]
+
+def maze_header(labirinto) -> Dict[str, Any]:
+    """
+    First line of a trace: what the replay needs to draw the maze.
+    Accepts a Labirinto (steps are (x, y) cells) or a LabirintoGrafo (steps are vertex ids);
+    other mazes (e.g. a WebSocketLabirinto) only record their entrance.
+    """
+    header: Dict[str, Any] = {"version": TRACE_VERSION}
+    grid = getattr(labirinto, "labirinto", labirinto)
+    if hasattr(grid, "grade"):
+        header.update(
+            vertices="ids" if grid is not labirinto else "cells",
+            largura=grid.largura,
+            altura=grid.altura,
+            entrada=list(grid.entrada),
+            saida=list(grid.saida),
+            celulas=base64.b64encode(bytes(grid.grade.celulas)).decode("ascii"),
+            pesos=base64.b64encode(bytes(grid.pesos)).decode("ascii") if grid.pesos is not None else None,
+        )
+    else:
+        header.update(vertices="ids", entrada=getattr(labirinto, "entrada", None))
+    return header
+
+class StepTrace:
+    """
+    Compact per-step trace of an exploration, streamed to a JSONL file.
+    One header line describing the maze, then one [step, origin, target, weight, kind] array per step
+    and a final result object. Writing a step costs the same whatever the maze size; replay_trace.py
+    renders any step (or an animation) from the file afterwards.
+    """
+    def __init__(self, path: str, labirinto=None):
+        self.path = path
+        self.steps = 0
+        self._file: Optional[TextIO] = open(path, 'w', encoding='utf-8')
+        self._write(maze_header(labirinto) if labirinto is not None else {"version": TRACE_VERSION})
+
+    def _write(self, record: Any) -> None:
+        self._file.write(json.dumps(record, separators=(",", ":")))
+        self._file.write("\n")
+
+    def step(self, origin: Optional[Vertex], target: Vertex, weight: float, kind: str) -> None:
+        self.steps += 1
+        self._write([self.steps, origin, target, weight, kind])
+
+    def result(self, **fields: Any) -> None:
+        """Final record (exit found, path, path_weight, traversed_weight, moves...)"""
+        self._write(fields)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+def _vertex(value: Any) -> Optional[Vertex]:
+    return tuple(value) if isinstance(value, list) else value
+
+def read_trace(path: str) -> Tuple[Dict[str, Any], List[StepRecord], Optional[Dict[str, Any]]]:
+    """(header, steps, result) of a trace file; result is None for an interrupted exploration"""
+    steps: List[StepRecord] = []
+    result = None
+    with open(path, 'r', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+        if header.get("version") != TRACE_VERSION:
+            raise ValueError(f"Unsupported trace version: {header.get('version')}")
+        for line in f:
+            record = json.loads(line)
+            if isinstance(record, dict):
+                result = dict(record, path=[_vertex(v) for v in record.get("path", [])])
+            else:
+                number, origin, target, weight, kind = record
+                steps.append((number, _vertex(origin), _vertex(target), weight, kind))
+    return header, steps, result
@@ -0,0 +1,22 @@
+import pytest
+from benchmark_solver import run_maze
+from maze_corpus import generate_maze_graph
+
+SEEDS = range(60)
+
+@pytest.mark.parametrize("planner", ["dfs", "weighted"])
+@pytest.mark.parametrize("one_way", [0.5, 1.0])
+def test_early_stop_on_one_way_mazes_is_optimal(one_way, planner):
+    """
+    With refused edges the exit bound can prune the only way back to a promising open edge; the
+    solver must reposition through pruned edges instead of stopping with a worse path.
+    run_maze measures the optimum with optimal_exit_path over the edges the server really accepts.
+    """
+    wrong = []
+    for seed in SEEDS:
+        result = run_maze(f"seed_{seed}", generate_maze_graph(100, seed=seed), in_process=True, one_way=one_way,
+                          timeout=60, solver_kwargs={"early_stop": True, "planner": planner})
+        assert result["status"] == "ok", f"seed {seed} timed out"
+        if result["path_weight"] != result["optimal_weight"]:
+            wrong.append((seed, result["path_weight"], result["optimal_weight"]))
+    assert not wrong, f"(seed, found, optimal) off the optimum: {wrong}"
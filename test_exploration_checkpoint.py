@@ -0,0 +1,72 @@
+import asyncio
+import json
+import random
+from typing import Tuple
+import pytest
+from exploration_checkpoint import CHECKPOINT_VERSION, load_checkpoint, remove_checkpoint, save_checkpoint
+from local_maze_server import LocalMazeConnection, one_way_edges
+from maze_corpus import generate_maze_graph
+from server_message import parse_server_message
+from websocket_maze_client import WebSocketLabirinto
+
+def _explore(seed: int, moves: int) -> Tuple[WebSocketLabirinto, LocalMazeConnection]:
+    """Random walk over a maze with refused edges, recorded the way the solver records it"""
+    rng = random.Random(seed)
+    # Plenty of loops, each refused in one direction; the spanning tree stays two-way
+    graph = generate_maze_graph(300, seed=seed, extra_edge_ratio=0.6)
+    connection = LocalMazeConnection(graph, blocked=one_way_edges(graph, 1.0, seed=seed))
+
+    async def walk():
+        labirinto = WebSocketLabirinto(connection, *parse_server_message(await connection.recv()))
+        for _ in range(moves):
+            origin = labirinto.current_vertex
+            dest, _ = rng.choice(labirinto.adjacents)
+            try:
+                await labirinto.move_to(dest)
+            except ValueError:
+                labirinto.reject_edge(origin, dest)
+        return labirinto, connection
+    return asyncio.run(walk())
+
+def _state(labirinto: WebSocketLabirinto):
+    snapshot = labirinto.snapshot()
+    for key in ("rejected", "confirmed"):
+        snapshot[key] = sorted(map(tuple, snapshot[key]))
+    frontier, shortest_paths = labirinto.frontier, labirinto.shortest_paths
+    return (snapshot, frontier.visited, frontier.frontier, frontier._open_count, shortest_paths.distances,
+            shortest_paths.best_cost, labirinto.rejected_edges)
+
+@pytest.mark.parametrize("seed", range(10))
+def test_checkpoint_round_trip_restores_the_exploration(tmp_path, seed):
+    labirinto, connection = _explore(seed, moves=400)
+    assert labirinto.rejected_edges, "the walk should have hit refused edges"
+    path = str(tmp_path / "checkpoint.json")
+    save_checkpoint(path, "grupo", "7", labirinto.snapshot())
+
+    restored = WebSocketLabirinto.from_snapshot(None, load_checkpoint(path, "grupo", "7"))
+    # Reconnecting where the connection dropped, as the server reports it
+    restored.rebind(None, *parse_server_message(connection.session.current_message()))
+    assert _state(restored) == _state(labirinto)
+    assert restored.shortest_paths.best_path()[1] == labirinto.shortest_paths.best_path()[1]
+
+def test_checkpoint_of_another_maze_or_version_is_ignored(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    save_checkpoint(path, "grupo", "7", _explore(0, moves=20)[0].snapshot())
+    assert load_checkpoint(path, "grupo", "8") is None
+    assert load_checkpoint(path, "outro", "7") is None
+
+    with open(path, encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    checkpoint["version"] = CHECKPOINT_VERSION + 1
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    assert load_checkpoint(path, "grupo", "7") is None
+
+def test_unreadable_or_missing_checkpoint_is_ignored(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    assert load_checkpoint(path, "grupo", "7") is None
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"version": 1, "grupo_id"')
+    assert load_checkpoint(path, "grupo", "7") is None
+    remove_checkpoint(path)
+    remove_checkpoint(path)
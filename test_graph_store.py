@@ -0,0 +1,104 @@
+import random
+import pytest
+from graph_store import DENSE_ID_LIMIT, GraphStore
+from maze_corpus import generate_maze_graph
+
+def _store(graph):
+    store = GraphStore()
+    for vertex, state in graph.items():
+        store[vertex] = state
+    return store
+
+def _check_mapping(view, graph):
+    assert len(view) == len(graph)
+    assert list(view) == list(graph)
+    assert dict(view.items()) == graph
+    for vertex, (_, adjacents) in graph.items():
+        assert vertex in view
+        assert list(view.edges(vertex)) == adjacents
+    missing = max(graph) + 1
+    assert missing not in view
+    with pytest.raises(KeyError):
+        view[missing]
+    with pytest.raises(KeyError):
+        view.edges(missing)
+
+@pytest.mark.parametrize("seed", range(5))
+def test_store_round_trips_a_graph(seed):
+    graph = generate_maze_graph(500, seed=seed)
+    store = _store(graph)
+    _check_mapping(store, graph)
+    assert store.edge_count == sum(len(adjacents) for _, adjacents in graph.values())
+    for vertex, (_, adjacents) in graph.items():
+        assert list(store.destinations(vertex)) == [dest for dest, _ in adjacents]
+
+def test_type_names_are_normalized():
+    store = GraphStore()
+    store.add_vertex(1, "entrada", [(2, 1.0)])
+    store.add_vertex(2, "saida", [])
+    store.add_vertex(3, "normal", [])
+    assert [store[vertex][0] for vertex in (1, 2, 3)] == ["1", "2", "0"]
+
+def test_sparse_ids_live_next_to_dense_ones():
+    graph = {-5: ("1", [(DENSE_ID_LIMIT + 7, 2.0)]), DENSE_ID_LIMIT + 7: ("0", [(-5, 3.0), (4, 1.0)]), 4: ("2", [])}
+    store = _store(graph)
+    _check_mapping(store, graph)
+    _check_mapping(store.freeze(), graph)
+
+def test_revisit_with_the_same_adjacency_changes_nothing():
+    store = _store({1: ("1", [(2, 1.0), (3, 2.0)]), 2: ("0", [(1, 1.0)])})
+    nbytes = store.nbytes
+    store.add_vertex(1, "1", [(2, 1.0), (3, 2.0)])
+    assert store.nbytes == nbytes
+    assert list(store) == [1, 2]
+
+def test_shrinking_rewrite_reuses_the_edge_range():
+    store = _store({1: ("1", [(2, 1.0), (3, 2.0), (4, 3.0)]), 2: ("0", [(1, 1.0)])})
+    nbytes = store.nbytes
+    store[1] = ("1", [(2, 1.0), (4, 3.0)])
+    assert store.nbytes == nbytes
+    assert store[1] == ("1", [(2, 1.0), (4, 3.0)])
+    assert store[2] == ("0", [(1, 1.0)])
+    assert store.edge_count == 3
+    assert list(store) == [1, 2]
+
+def test_growing_rewrite_moves_the_adjacency():
+    store = _store({1: ("1", [(2, 1.0)]), 2: ("0", [(1, 1.0)])})
+    store[1] = ("1", [(2, 1.0), (3, 5.0)])
+    assert store[1] == ("1", [(2, 1.0), (3, 5.0)])
+    assert store[2] == ("0", [(1, 1.0)])
+    assert store.edge_count == 3
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_rewrites_match_a_dict(seed):
+    rng = random.Random(seed)
+    graph = {}
+    store = GraphStore()
+    for _ in range(2000):
+        vertex = rng.randrange(300)
+        if vertex in graph and rng.random() < 0.5:
+            tipo, adjacents = graph[vertex]
+            adjacents = [edge for edge in adjacents if rng.random() < 0.6]  # Refused edges dropped
+        else:
+            tipo = rng.choice("012")
+            adjacents = list({rng.randrange(300): float(rng.randint(1, 20)) for _ in range(rng.randrange(6))}.items())
+        graph[vertex] = (tipo, adjacents)
+        store[vertex] = (tipo, adjacents)
+    _check_mapping(store, graph)
+    assert store.edge_count == sum(len(adjacents) for _, adjacents in graph.values())
+
+def test_freeze_is_an_independent_read_only_snapshot():
+    graph = generate_maze_graph(200, seed=1)
+    store = _store(graph)
+    frozen = store.freeze()
+    first = next(iter(graph))
+    store[first] = (graph[first][0], [])
+    store.add_vertex(10_000, "0", [(first, 1.0)])
+
+    _check_mapping(frozen, graph)
+    for vertex in graph:
+        index = frozen.dense_index(vertex)
+        start, degree = frozen.starts[index], frozen.degrees[index]
+        assert list(zip(frozen.targets[start:start + degree], frozen.weights[start:start + degree])) == graph[vertex][1]
+    with pytest.raises(TypeError):
+        frozen.weights[0] = 0.0
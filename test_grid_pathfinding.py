@@ -0,0 +1,88 @@
+import heapq
+import random
+from collections import deque
+import pytest
+from grid_pathfinding import NO_PATH, SOLVERS, astar, bidirectional_bfs, jump_point_search
+from labirinto import Labirinto
+from maze_grid import ABERTA, PAREDE
+
+def _bfs_moves(labirinto, inicio, fim):
+    """Fewest moves from inicio to fim, None if unreachable"""
+    depths = {inicio: 0}
+    queue = deque([inicio])
+    while queue:
+        cell = queue.popleft()
+        if cell == fim:
+            return depths[cell]
+        for vizinho in labirinto.obter_vizinhos(*cell):
+            if vizinho not in depths:
+                depths[vizinho] = depths[cell] + 1
+                queue.append(vizinho)
+    return None
+
+def _dijkstra_cost(labirinto, inicio, fim):
+    costs = {inicio: 0}
+    heap = [(0, inicio)]
+    while heap:
+        cost, cell = heapq.heappop(heap)
+        if cell == fim:
+            return cost
+        if cost > costs[cell]:
+            continue
+        for vizinho, peso in labirinto.obter_vizinhos_com_peso(cell):
+            if cost + peso < costs.get(vizinho, cost + peso + 1):
+                costs[vizinho] = cost + peso
+                heapq.heappush(heap, (cost + peso, vizinho))
+    return None
+
+def _open_grid(seed, largura, altura, paredes, pesos=False):
+    """Random cells instead of a carved maze: wide open areas, where jump points matter most"""
+    rng = random.Random(seed)
+    celulas = bytearray(PAREDE if rng.random() < paredes else ABERTA for _ in range(largura * altura))
+    abertas = [i for i, celula in enumerate(celulas) if celula == ABERTA]
+    entrada, saida = (divmod(i, largura)[::-1] for i in rng.sample(abertas, 2))
+    peso = bytes(rng.randint(1, 9) for _ in celulas) if pesos else None
+    return Labirinto.de_grade(largura, altura, celulas, entrada, saida, peso)
+
+def _random_grids():
+    for seed in range(8):
+        yield Labirinto(31, 21, seed=seed, braid=seed / 8)
+        yield Labirinto(25, 25, seed=seed, braid=0.5, peso_maximo=9)
+        yield _open_grid(seed, 30, 20, paredes=0.2 + seed / 40)
+        yield _open_grid(seed, 17, 33, paredes=0.3, pesos=True)
+
+def _check_path(labirinto, result, inicio, fim):
+    caminho = result.caminho
+    assert caminho[0] == inicio and caminho[-1] == fim
+    for cell, seguinte in zip(caminho, caminho[1:]):
+        assert seguinte in labirinto.obter_vizinhos(*cell)
+    assert result.custo == sum(labirinto.peso(cell) for cell in caminho[1:])
+
+GRIDS = list(_random_grids())
+
+@pytest.mark.parametrize("grid", range(len(GRIDS)))
+def test_solvers_match_bfs_and_dijkstra(grid):
+    labirinto = GRIDS[grid]
+    rng = random.Random(grid)
+    abertas = [(i % labirinto.largura, i // labirinto.largura)
+               for i, celula in enumerate(labirinto.grade.celulas) if celula == ABERTA]
+    pares = [(labirinto.entrada, labirinto.saida)] + [tuple(rng.sample(abertas, 2)) for _ in range(10)]
+    for inicio, fim in pares:
+        moves = _bfs_moves(labirinto, inicio, fim)
+        if moves is None:
+            for solver in SOLVERS.values():
+                assert solver(labirinto, inicio, fim) == NO_PATH
+            continue
+        for solver in (bidirectional_bfs, jump_point_search):
+            result = solver(labirinto, inicio, fim)
+            _check_path(labirinto, result, inicio, fim)
+            assert len(result.caminho) - 1 == moves, solver.__name__
+        result = astar(labirinto, inicio, fim)
+        _check_path(labirinto, result, inicio, fim)
+        assert result.custo == _dijkstra_cost(labirinto, inicio, fim)
+
+def test_start_at_the_goal():
+    labirinto = Labirinto(11, 11, seed=0)
+    for solver in SOLVERS.values():
+        result = solver(labirinto, labirinto.entrada, labirinto.entrada)
+        assert result.caminho == [labirinto.entrada] and result.custo == 0.0
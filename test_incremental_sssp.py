@@ -0,0 +1,76 @@
+import heapq
+import random
+import pytest
+from graph_store import GraphStore
+from incremental_sssp import IncrementalShortestPaths
+from maze_corpus import generate_maze_graph
+from maze_graph import find_entrance, find_exits
+
+def _scratch_distances(store, source):
+    """Dijkstra from scratch over the visited vertices, with tentative distances for their adjacents"""
+    distances = {source: 0.0}
+    heap = [(0.0, source)]
+    while heap:
+        distance, vertex = heapq.heappop(heap)
+        if distance > distances[vertex] or vertex not in store:
+            continue
+        for dest, weight in store.edges(vertex):
+            if distance + weight < distances.get(dest, float('infinity')):
+                distances[dest] = distance + weight
+                heapq.heappush(heap, (distance + weight, dest))
+    return distances
+
+def _check(shortest_paths, store, source, exits):
+    distances = _scratch_distances(store, source)
+    assert shortest_paths.distances == distances
+    for vertex, distance in distances.items():
+        path = shortest_paths.path_to(vertex)
+        assert path[0] == source and path[-1] == vertex
+        assert sum(dict(store.edges(origin))[dest] for origin, dest in zip(path, path[1:])) == distance
+
+    reachable = [distances[vertex] for vertex in exits if vertex in distances]
+    path, cost = shortest_paths.best_path()
+    if reachable:
+        assert cost == min(reachable) and path[-1] in exits
+    else:
+        assert (path, cost) == ([], 0.0)
+
+@pytest.mark.parametrize("seed", range(30))
+def test_visits_and_refused_edges_match_dijkstra_from_scratch(seed):
+    rng = random.Random(seed)
+    graph = generate_maze_graph(200, seed=seed, extra_edge_ratio=0.3, num_exits=3)
+    source = find_entrance(graph)
+    exits = find_exits(graph)
+    order = [vertex for vertex in graph if vertex != source]
+    rng.shuffle(order)  # Not only reachable vertices: some get visited before any edge leads to them
+
+    store = GraphStore()
+    shortest_paths = IncrementalShortestPaths(source, store.edges)
+    for vertex in [source] + order:
+        # Store first, then the shortest paths, as WebSocketLabirinto does
+        store[vertex] = graph[vertex]
+        shortest_paths.add_vertex(vertex, vertex in exits)
+        if rng.random() < 0.3:
+            origin = rng.choice(list(store))
+            tipo, adjacents = store[origin]
+            if adjacents:
+                dest, _ = rng.choice(adjacents)
+                store[origin] = (tipo, [edge for edge in adjacents if edge[0] != dest])
+                shortest_paths.remove_edge(origin, dest)
+        _check(shortest_paths, store, source, exits)
+
+def test_revisits_and_unknown_edges_change_nothing():
+    graph = generate_maze_graph(50, seed=0)
+    source = find_entrance(graph)
+    store = GraphStore()
+    shortest_paths = IncrementalShortestPaths(source, store.edges)
+    for vertex in graph:
+        store[vertex] = graph[vertex]
+        shortest_paths.add_vertex(vertex)
+    distances = dict(shortest_paths.distances)
+    relaxations = shortest_paths.relaxations
+
+    shortest_paths.add_vertex(source)
+    shortest_paths.remove_edge(max(graph) + 1, source)  # Origin never visited
+    assert shortest_paths.distances == distances
+    assert shortest_paths.relaxations == relaxations
@@ -0,0 +1,79 @@
+import json
+import os
+import time
+from graph_store import GraphStore
+from maze_cache import CACHE_VERSION, MazeCache, matches_initial_state
+from maze_corpus import generate_maze_graph
+from maze_graph import find_entrance, find_exits
+
+def _explored(seed: int):
+    graph = generate_maze_graph(300, seed=seed)
+    store = GraphStore()
+    for vertex, state in graph.items():
+        store[vertex] = state
+    return graph, store
+
+def _rewrite(path, **changes):
+    with open(path, encoding="utf-8") as f:
+        entry = json.load(f)
+    entry.update(changes)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+
+def test_cache_round_trip(tmp_path):
+    graph, store = _explored(0)
+    cache = MazeCache(str(tmp_path))
+    rejected = {(0, 1), (5, 4)}
+    cache.save("grupo/1", "7", store, find_entrance(graph), find_exits(graph), rejected)
+
+    cached = cache.load("grupo/1", "7")
+    assert (cached.grupo_id, cached.labirinto_id) == ("grupo/1", "7")
+    assert cached.graph == graph
+    assert list(cached.graph) == list(graph)
+    assert cached.entrada == find_entrance(graph)
+    assert cached.exits == find_exits(graph)
+    assert cached.rejected == rejected
+    assert cache.load("grupo/1", "8") is None
+
+def test_stale_or_broken_entries_are_dropped(tmp_path):
+    graph, store = _explored(1)
+    cache = MazeCache(str(tmp_path), max_age=3600)
+    for labirinto_id, changes in (("old_version", {"version": CACHE_VERSION + 1}),
+                                  ("expired", {"saved_at": time.time() - 7200})):
+        path = cache.save("grupo", labirinto_id, store, find_entrance(graph), find_exits(graph))
+        _rewrite(path, **changes)
+        assert cache.load("grupo", labirinto_id) is None
+        assert not os.path.exists(path)
+
+    path = cache.save("grupo", "truncated", store, find_entrance(graph), find_exits(graph))
+    with open(path, "r+", encoding="utf-8") as f:
+        f.truncate(100)
+    assert cache.load("grupo", "truncated") is None
+    assert not os.path.exists(path)
+
+def test_eviction_keeps_the_entry_just_saved(tmp_path):
+    graph, store = _explored(2)
+    cache = MazeCache(str(tmp_path), max_bytes=1)
+    first = cache.save("grupo", "1", store, find_entrance(graph), find_exits(graph))
+    second = cache.save("grupo", "2", store, find_entrance(graph), find_exits(graph))
+    assert not os.path.exists(first)
+    assert cache.load("grupo", "2").graph == graph
+    assert os.path.exists(second)
+
+def test_initial_state_check_ignores_refused_edges(tmp_path):
+    graph, store = _explored(3)
+    vertex = next(vertex for vertex, (_, adjacents) in graph.items() if len(adjacents) >= 2)
+    tipo, adjacents = graph[vertex]
+    refused = adjacents[0][0]
+    store[vertex] = (tipo, adjacents[1:])
+    cache = MazeCache(str(tmp_path))
+    cache.save("grupo", "7", store, find_entrance(graph), find_exits(graph), {(vertex, refused)})
+    cached = cache.load("grupo", "7")
+
+    # The server keeps advertising the refused edge
+    assert matches_initial_state(cached, vertex, tipo, adjacents)
+    assert matches_initial_state(cached, vertex, tipo, list(reversed(adjacents)))
+    assert not matches_initial_state(cached, vertex, "saida" if tipo != "2" else "0", adjacents)
+    assert not matches_initial_state(cached, vertex, tipo, [(dest, weight + 1) for dest, weight in adjacents])
+    assert not matches_initial_state(cached, vertex, tipo, adjacents[:1])
+    assert not matches_initial_state(cached, max(graph) + 1, tipo, adjacents)
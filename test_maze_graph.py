@@ -0,0 +1,50 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from agente_explorador import AgenteExplorador
+from benchmark_solver import run_maze
+from grid_pathfinding import astar
+from labirinto import Labirinto
+from maze_graph import LabirintoGrafo, find_entrance, graph_from_labirinto
+from shortest_path import shortest_path_to_exit
+
+LABIRINTOS = [(21, 15, 0.0, None), (31, 31, 0.3, None), (25, 41, 0.5, 9), (41, 21, 1.0, 20)]
+
+def _labirinto(seed, largura, altura, braid, peso_maximo):
+    return Labirinto(largura, altura, seed=seed, braid=braid, peso_maximo=peso_maximo)
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("largura, altura, braid, peso_maximo", LABIRINTOS)
+def test_neighbour_masks_build_the_same_graph_as_the_grid_scan(seed, largura, altura, braid, peso_maximo):
+    labirinto = _labirinto(seed, largura, altura, braid, peso_maximo)
+    # Without grade, graph_from_labirinto falls back to matriz + obter_vizinhos
+    sem_grade = SimpleNamespace(largura=largura, altura=altura, matriz=labirinto.matriz, entrada=labirinto.entrada,
+                                saida=labirinto.saida, obter_vizinhos=labirinto.obter_vizinhos, peso=labirinto.peso)
+    assert graph_from_labirinto(labirinto) == graph_from_labirinto(sem_grade)
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("largura, altura, braid, peso_maximo", LABIRINTOS)
+def test_websocket_solver_finds_the_grid_optimum(seed, largura, altura, braid, peso_maximo):
+    labirinto = _labirinto(seed, largura, altura, braid, peso_maximo)
+    grafo = LabirintoGrafo(labirinto).grafo
+    _, weight = shortest_path_to_exit(grafo, find_entrance(grafo))
+    assert weight == astar(labirinto).custo
+
+    result = run_maze(f"labirinto_{seed}", grafo, in_process=True, timeout=60)
+    assert result["status"] == "ok"
+    assert result["path_weight"] == result["optimal_weight"] == weight
+
+@pytest.mark.parametrize("estrategia", ["random", "tremaux", "frontier"])
+@pytest.mark.parametrize("largura, altura, braid, peso_maximo", LABIRINTOS)
+def test_agent_walks_the_same_graph(estrategia, largura, altura, braid, peso_maximo):
+    labirinto = _labirinto(1, largura, altura, braid, peso_maximo)
+    grafo = LabirintoGrafo(labirinto)
+    agente = AgenteExplorador(grafo, estrategia=estrategia, seed=1)
+    asyncio.run(agente.explorar())
+
+    assert agente.saida_encontrada and agente.saida == grafo.saida
+    for origem, destino, _ in agente.get_caminho_percorrido():
+        assert destino in dict(grafo.obter_vizinhos_com_peso(origem))
+    caminho, _ = agente.get_menor_caminho()
+    assert caminho[0] == grafo.entrada and caminho[-1] == grafo.saida
+    assert all(destino in dict(grafo.grafo[origem][1]) for origem, destino in zip(caminho, caminho[1:]))
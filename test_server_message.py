@@ -0,0 +1,49 @@
+import pytest
+from benchmark_parser import build_messages, legacy_parse_server_message
+from graph_store import GraphStore
+from server_message import parse_server_message
+
+HEADER = "Vértice atual: 7, Tipo: 0, Adjacentes(Vertice, Peso): "
+
+@pytest.mark.parametrize("degree", [0, 1, 4, 100])
+@pytest.mark.parametrize("duplicates", [0.0, 0.5])
+def test_parser_matches_the_legacy_regex(degree, duplicates):
+    for message in build_messages(200, degree, duplicates, seed=degree):
+        assert parse_server_message(message) == legacy_parse_server_message(message)
+
+@pytest.mark.parametrize("vertex_type", ["0", "1", "2", "normal", "entrada", "saida"])
+def test_parser_matches_the_legacy_regex_on_every_type(vertex_type):
+    message = f"Vértice atual: 12, Tipo: {vertex_type}, Adjacentes(Vertice, Peso): [(3, 1.5), (40,2)]"
+    assert parse_server_message(message) == legacy_parse_server_message(message) == (12, vertex_type, [(3, 1.5), (40, 2.0)])
+
+def test_duplicate_edges_keep_the_lightest_weight_in_first_appearance_order():
+    message = HEADER + "[(5, 9), (3, 4), (5, 2), (3, 6), (8, 1), (5, 7)]"
+    expected = (7, "0", [(5, 2.0), (3, 4.0), (8, 1.0)])
+    assert parse_server_message(message) == legacy_parse_server_message(message) == expected
+
+def test_store_receives_the_parsed_vertex():
+    store = GraphStore()
+    message = HEADER + "[(5, 9), (3, 4), (5, 2)]"
+    assert parse_server_message(message, store) == (7, "0", [(5, 2.0), (3, 4.0)])
+    assert store[7] == ("0", [(5, 2.0), (3, 4.0)])
+
+@pytest.mark.parametrize("message", [
+    "",
+    "Vértice atual: x, Tipo: 0, Adjacentes(Vertice, Peso): []",
+    "Vértice atual: 7, Tipo: parede, Adjacentes(Vertice, Peso): []",
+    HEADER + "[(1, 2)",
+])
+def test_malformed_messages_are_rejected_like_the_legacy_regex(message):
+    with pytest.raises(ValueError):
+        legacy_parse_server_message(message)
+    with pytest.raises(ValueError):
+        parse_server_message(message)
+
+@pytest.mark.parametrize("body", ["[(1, 2), (4)]", "[(1, a)]", "[(x, 2)]", "[(1, -2)]", "[(1, nan)]", "[(1, inf)]",
+                                  "[(1, 2), (3, -inf)]"])
+def test_malformed_adjacency_lists_are_rejected(body):
+    # The legacy regex silently skipped edges it could not match; the parser refuses the whole message
+    store = GraphStore()
+    with pytest.raises(ValueError):
+        parse_server_message(HEADER + body, store)
+    assert 7 not in store
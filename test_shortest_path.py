@@ -0,0 +1,59 @@
+import random
+import pytest
+from benchmark_shortest_path import legacy_find_shortest_path
+from graph_store import GraphStore
+from maze_corpus import generate_maze_graph
+from maze_graph import find_entrance
+from shortest_path import dial_to_exits, dijkstra_to_exits, exit_vertices
+
+ENGINES = {"dijkstra": dijkstra_to_exits, "dial": dial_to_exits}
+
+def _frozen(graph):
+    store = GraphStore()
+    for vertex, state in graph.items():
+        store[vertex] = state
+    return store.freeze()
+
+def _path_weight(graph, path):
+    return sum(dict(graph[origin][1])[dest] for origin, dest in zip(path, path[1:]))
+
+def _check(graph, start, exits, expected_weight):
+    for view in (graph, _frozen(graph)):
+        for name, engine in ENGINES.items():
+            path, weight = engine(view, start, exits)
+            assert weight == expected_weight, f"{name} on {type(view).__name__}"
+            if path:
+                assert path[0] == start and path[-1] in exits
+                assert _path_weight(graph, path) == weight
+
+@pytest.mark.parametrize("seed", range(20))
+def test_engines_match_the_legacy_search(seed):
+    graph = generate_maze_graph(400, seed=seed, num_exits=1 + seed % 3)
+    start = find_entrance(graph)
+    _, expected = legacy_find_shortest_path(graph, start)
+    _check(graph, start, exit_vertices(graph), expected)
+
+@pytest.mark.parametrize("seed", range(20))
+def test_engines_agree_on_partially_explored_graphs(seed):
+    # Vertices never visited are only known as adjacents, with no edges of their own
+    rng = random.Random(seed)
+    graph = generate_maze_graph(400, seed=seed, num_exits=3)
+    start = find_entrance(graph)
+    explored = {vertex: state for vertex, state in graph.items() if vertex == start or rng.random() < 0.7}
+    _, expected = dijkstra_to_exits(explored, start, exit_vertices(explored))
+    _check(explored, start, exit_vertices(explored), expected)
+
+@pytest.mark.parametrize("seed", range(5))
+def test_dial_falls_back_on_fractional_weights(seed):
+    rng = random.Random(seed)
+    graph = {vertex: (tipo, [(dest, weight + rng.choice([0.0, 0.5, 0.25])) for dest, weight in adjacents])
+             for vertex, (tipo, adjacents) in generate_maze_graph(300, seed=seed).items()}
+    start = find_entrance(graph)
+    _, expected = legacy_find_shortest_path(graph, start)
+    _check(graph, start, exit_vertices(graph), expected)
+
+def test_unreachable_exit_returns_empty_path():
+    graph = {0: ("1", [(1, 3.0)]), 1: ("0", [(0, 3.0)]), 2: ("2", [])}
+    for view in (graph, _frozen(graph)):
+        for engine in ENGINES.values():
+            assert engine(view, 0, {2}) == ([], 0.0)
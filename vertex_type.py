@@ -19,20 +19,20 @@ class VertexType(Enum):
         Creates a VertexType from a string value.
         Handles both numeric and string representations.
         """
-        # Map string representations to enum values
-        value_map = {
-            "0": cls.NORMAL,
-            "1": cls.ENTRADA,
-            "2": cls.SAIDA,
-            "normal": cls.NORMAL,
-            "entrada": cls.ENTRADA,
-            "saida": cls.SAIDA
-        }
-
         try:
-            return value_map[str(value).lower()]
+            return _VALUE_MAP[str(value).lower()]
         except KeyError:
             raise ValueError(f"Invalid vertex type: {value}")
 
     def __str__(self) -> str:
         return self.value
+
+# Map string representations to enum values (built once, from_value runs for every vertex)
+_VALUE_MAP = {
+    "0": VertexType.NORMAL,
+    "1": VertexType.ENTRADA,
+    "2": VertexType.SAIDA,
+    "normal": VertexType.NORMAL,
+    "entrada": VertexType.ENTRADA,
+    "saida": VertexType.SAIDA
+}
@@ -1,29 +1,117 @@
 import asyncio
+import time
 import websockets
-import re
-from typing import List, Tuple, Optional, Dict, Set
+from typing import List, Tuple, Optional, Dict, Set, Union
 from config import MazeConfig
 from vertex_type import VertexType
 from collections import defaultdict, deque
-import heapq
 from maze_visualizer import create_visualizer, print_full_maze_analysis
+from exploration_frontier import FrontierIndex
+from frontier_planner import WeightedFrontierPlanner
+from exit_bound import ExitPathBound
+from incremental_sssp import IncrementalShortestPaths
+from shortest_path import shortest_path_to_exit
+from graph_store import GraphStore
+from server_message import parse_server_message
+from move_log import MoveLog
+from maze_cache import MazeCache, matches_initial_state
+from exploration_checkpoint import default_checkpoint_path, load_checkpoint, remove_checkpoint, save_checkpoint
+from solver_metrics import SolverMetrics, SolverProfiler, default_metrics_dir, write_report
 import traceback
 
 class WebSocketLabirinto:
-    def __init__(self, websocket, current_vertex: int, vertex_type: str, adjacents: List[Tuple[int, float]]):
+    def __init__(self, websocket, current_vertex: int, vertex_type: str, adjacents: List[Tuple[int, float]],
+                 log: Optional[MoveLog] = None, metrics: Optional[SolverMetrics] = None):
         self.websocket = websocket
+        self.log = log if log is not None else MoveLog()
+        self.metrics = metrics if metrics is not None else SolverMetrics()
         self.current_vertex = current_vertex
         self.vertex_type = VertexType.from_value(vertex_type)
         self.entrada = current_vertex if self.vertex_type == VertexType.ENTRADA else None
+        # Advertised edges the server refused to walk, by origin. Edges are directed: only the edges a
+        # vertex advertises are planned over, and a refusal drops that edge rather than its target
+        self.rejected_edges: Dict[int, Set[int]] = {}
+        self.confirmed_edges: Set[Tuple[int, int]] = set()  # Edges actually walked
         self.adjacents = self._remove_duplicate_edges(adjacents)
-        self.visited_states: Dict[int, Tuple[str, List[Tuple[int, float]]]] = {
-            current_vertex: (vertex_type, self.adjacents)
-        }
+        # Mapping[int, Tuple[str, List[Tuple[int, float]]]] backed by compact arrays
+        self.visited_states = GraphStore()
+        self.visited_states[current_vertex] = (vertex_type, self.adjacents)
         self.steps_history = [current_vertex]  # Track all steps including duplicates
         self.complete_exploration = []  # Track unique vertices in order of first visit
+        self._explored: Set[int] = set()  # Same vertices as complete_exploration, for O(1) membership
         self.exits: Set[int] = set()
         if self.vertex_type == VertexType.SAIDA:
             self.exits.add(current_vertex)
+        self.move_count = 0  # Every move_to call, i.e. every round trip to the server
+        self.invalid_moves = 0
+        self.total_weight = 0.0  # Weight of every edge actually traversed
+        self.frontier = FrontierIndex(self.visited_states.destinations)
+        self.frontier.mark_visited(current_vertex)
+        # Shortest paths from the first vertex, updated on every move: the best exit path at any time
+        self.shortest_paths = IncrementalShortestPaths(current_vertex, self.visited_states.edges)
+        self.shortest_paths.add_vertex(current_vertex, self.vertex_type == VertexType.SAIDA)
+        self.pipeline_window = 1  # Commands in flight in follow_route; 1 = lock-step
+
+    def snapshot(self) -> Dict:
+        """JSON-serializable exploration state, for checkpoints"""
+        return {
+            "current_vertex": self.current_vertex,
+            "entrada": self.entrada,
+            "vertices": [[v, tipo, [[d, w] for d, w in adjacents]] for v, (tipo, adjacents) in self.visited_states.items()],
+            "rejected": [[origin, dest] for origin, dests in self.rejected_edges.items() for dest in sorted(dests)],
+            "confirmed": [list(edge) for edge in self.confirmed_edges],
+            "exits": sorted(self.exits),
+            "steps_history": self.steps_history,
+            "complete_exploration": self.complete_exploration,
+            "move_count": self.move_count,
+            "invalid_moves": self.invalid_moves,
+            "total_weight": self.total_weight,
+        }
+
+    @classmethod
+    def from_snapshot(cls, websocket, snapshot: Dict, log: Optional[MoveLog] = None,
+                      metrics: Optional[SolverMetrics] = None) -> "WebSocketLabirinto":
+        """Rebuilds a labirinto from snapshot(); call rebind() with the new connection's initial message next"""
+        vertices = snapshot["vertices"]
+        first, tipo, adjacents = vertices[0]
+        labirinto = cls(websocket, first, tipo, [(d, w) for d, w in adjacents], log=log, metrics=metrics)
+        # Replaying visits in their original order rebuilds the frontier index exactly
+        for vertex, tipo, adjacents in vertices[1:]:
+            adjacents = [(d, w) for d, w in adjacents]
+            labirinto.visited_states[vertex] = (tipo, adjacents)
+            labirinto.frontier.mark_visited(vertex)
+            labirinto.shortest_paths.add_vertex(vertex)
+        for origin, dest in snapshot["rejected"]:
+            labirinto.reject_edge(origin, dest)
+        labirinto.confirmed_edges = {(origin, dest) for origin, dest in snapshot["confirmed"]}
+        labirinto.entrada = snapshot["entrada"]
+        labirinto.exits = set(snapshot["exits"])
+        for vertex in labirinto.exits:
+            labirinto.shortest_paths.add_exit(vertex)
+        labirinto.steps_history = list(snapshot["steps_history"])
+        labirinto.complete_exploration = list(snapshot["complete_exploration"])
+        labirinto._explored = set(labirinto.complete_exploration)
+        labirinto.move_count = snapshot["move_count"]
+        labirinto.invalid_moves = snapshot["invalid_moves"]
+        labirinto.total_weight = snapshot["total_weight"]
+        return labirinto
+
+    def rebind(self, websocket, current_vertex: int, vertex_type: str, adjacents: List[Tuple[int, float]]) -> None:
+        """
+        Continues on a new connection. The server decides where we are after reconnecting, so its
+        initial message re-anchors the current vertex; everything learned so far is kept.
+        """
+        self.websocket = websocket
+        self.current_vertex = current_vertex
+        self.vertex_type = VertexType.from_value(vertex_type)
+        self.adjacents = self._walkable(current_vertex, self._remove_duplicate_edges(adjacents))
+        self.visited_states[current_vertex] = (vertex_type, self.adjacents)
+        self.frontier.mark_visited(current_vertex)
+        self.shortest_paths.add_vertex(current_vertex, self.vertex_type == VertexType.SAIDA)
+        if self.vertex_type == VertexType.ENTRADA and self.entrada is None:
+            self.entrada = current_vertex
+        if self.vertex_type == VertexType.SAIDA:
+            self.exits.add(current_vertex)
 
     def _remove_duplicate_edges(self, adjacents: List[Tuple[int, float]]) -> List[Tuple[int, float]]:
         """Remove duplicate edges keeping only one instance of each destination"""
@@ -33,56 +121,143 @@ class WebSocketLabirinto:
                 seen[dest] = weight
         return [(dest, weight) for dest, weight in seen.items()]
 
-    async def move_to(self, vertex_id: int) -> Tuple[int, str, List[Tuple[int, float]]]:
+    def _walkable(self, vertex: int, adjacents: List[Tuple[int, float]]) -> List[Tuple[int, float]]:
+        """adjacents advertised by vertex, without the edges already refused from it"""
+        rejected = self.rejected_edges.get(vertex)
+        if not rejected:
+            return adjacents
+        return [(dest, weight) for dest, weight in adjacents if dest not in rejected]
+
+    def _record_command(self, vertex_id: int) -> str:
+        """Bookkeeping done when a move command is sent; returns the command"""
         if vertex_id is None:
             raise ValueError("Cannot move to None vertex")
-
-        command = f"ir: {vertex_id}"
-
-        print(f"\n📍 Current State:")
-        print(f"Vértice atual: {self.current_vertex}, Tipo: {self.vertex_type}")
-        print(f"Adjacentes: {self.adjacents}")
-        print(f"🔄 Moving to vertex {vertex_id}")
-
+        if self.log.moves_enabled:
+            self.log.detail(f"\n📍 Vértice atual: {self.current_vertex}, Tipo: {self.vertex_type}, "
+                            f"Adjacentes: {self.adjacents}")
         self.steps_history.append(vertex_id)  # Add to full history
-        if vertex_id not in self.complete_exploration:  # Add to unique exploration
+        if vertex_id not in self._explored:  # Add to unique exploration
+            self._explored.add(vertex_id)
             self.complete_exploration.append(vertex_id)
+        self.move_count += 1
+        return f"ir: {vertex_id}"
 
-        await self.websocket.send(command)
-        response = await self.websocket.recv()
-        print(f"📩 Server response: {response}")
+    def _apply_response(self, vertex_id: int, response: str) -> Tuple[int, str, List[Tuple[int, float]]]:
+        """Updates the state from the server response to 'ir: vertex_id'; raises ValueError if it was refused"""
+        self.log.move(self.current_vertex, vertex_id, response)
 
         if "Comando inválido" in response or "Vértice inválido" in response:
+            self.invalid_moves += 1
             raise ValueError(f"Invalid movement: {response}")
 
-        current, vertex_type, adjacents = await self.parse_server_message(response)
+        self.total_weight += next((w for dest, w in self.adjacents if dest == vertex_id), 0.0)
+
+        # Parses, removes duplicate edges and records the vertex in visited_states in one pass; vertices
+        # with refused edges are recorded after dropping them, so the store never sees those edges again
+        start = time.perf_counter()
+        store = self.visited_states if vertex_id not in self.rejected_edges else None
+        current, vertex_type, adjacents = parse_server_message(response, store)
+        if current in self.rejected_edges:
+            adjacents = self._walkable(current, adjacents)
+            self.visited_states[current] = (vertex_type, adjacents)
+        elif store is None:
+            self.visited_states[current] = (vertex_type, adjacents)
+        self.metrics.add("parse", time.perf_counter() - start)
+        if current == vertex_id:
+            self.confirmed_edges.add((self.current_vertex, current))
         self.current_vertex = current
         self.vertex_type = VertexType.from_value(vertex_type)
-        self.adjacents = self._remove_duplicate_edges(adjacents)
-        self.visited_states[current] = (vertex_type, self.adjacents)
+        self.adjacents = adjacents
+        self.frontier.mark_visited(current)
+        is_exit = self.vertex_type == VertexType.SAIDA
+        self.shortest_paths.add_vertex(current, is_exit)
 
-        if self.vertex_type == VertexType.SAIDA:
+        if is_exit:
             self.exits.add(current)
 
         return current, vertex_type, self.adjacents
 
-    @staticmethod
-    async def parse_server_message(message: str) -> Tuple[int, str, List[Tuple[int, float]]]:
-        pattern = r"Vértice atual: (\d+), Tipo: (\d+|normal|saida|entrada), Adjacentes\(Vertice, Peso\): \[(.*?)\]"
-        match = re.match(pattern, message)
-        if not match:
-            raise ValueError(f"Invalid message format: {message}")
-
-        current_vertex = int(match.group(1))
-        vertex_type = match.group(2)
-        adjacents_str = match.group(3)
-
-        adjacents = []
-        if adjacents_str:
-            adj_pattern = r"\((\d+),\s*(\d+(?:\.\d+)?)\)"
-            adjacents = [(int(v), float(w)) for v, w in re.findall(adj_pattern, adjacents_str)]
+    async def move_to(self, vertex_id: int) -> Tuple[int, str, List[Tuple[int, float]]]:
+        command = self._record_command(vertex_id)
+        start = time.perf_counter()
+        await self.websocket.send(command)
+        response = await self.websocket.recv()
+        elapsed = time.perf_counter() - start
+        self.metrics.round_trip(elapsed, elapsed)
+        return self._apply_response(vertex_id, response)
+
+    async def follow_route(self, route: List[int], window: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        Moves along route (route[0] is the current vertex) and returns the (origin, target) moves the
+        server refused.
+        With window > 1 up to that many commands are in flight at once, so walking back over known
+        vertices costs about one round trip per window instead of one per hop. Responses are applied
+        in order as the authoritative state; after the first unexpected one (refused move or a
+        different vertex) no more commands are sent, the ones in flight are drained, and the caller
+        replans from current_vertex. A refused vertex is only reported when the server was where the
+        route expected at that point, since a command sent after a divergence was aimed from elsewhere.
+        window <= 1 is lock-step: one move_to per hop.
+        """
+        window = self.pipeline_window if window is None else window
+        targets = route[1:]
+        if window <= 1:
+            for node in targets:
+                origin = self.current_vertex
+                try:
+                    await self.move_to(node)
+                except ValueError:
+                    return [(origin, node)]
+            return []
+
+        refused = []
+        in_flight: deque = deque()  # (expected origin, target, send time) of commands sent but not answered
+        sent = 0
+        diverged = False
+        while in_flight or (sent < len(targets) and not diverged):
+            while not diverged and sent < len(targets) and len(in_flight) < window:
+                target = targets[sent]
+                await self.websocket.send(self._record_command(target))
+                in_flight.append((route[sent], target, time.perf_counter()))
+                sent += 1
+
+            expected_origin, target, sent_at = in_flight.popleft()
+            waiting_since = time.perf_counter()
+            response = await self.websocket.recv()
+            received_at = time.perf_counter()
+            self.metrics.round_trip(received_at - waiting_since, received_at - sent_at)
+            actual_origin = self.current_vertex
+            try:
+                current, _, _ = self._apply_response(target, response)
+            except ValueError:
+                if actual_origin == expected_origin:
+                    refused.append((actual_origin, target))
+                diverged = True
+                continue
+            if current != target:
+                diverged = True
+        return refused
 
-        return current_vertex, vertex_type, adjacents
+    @staticmethod
+    def parse_server_message(message: str) -> Tuple[int, str, List[Tuple[int, float]]]:
+        return parse_server_message(message)
+
+    def reject_edge(self, origin: int, dest: int) -> None:
+        """
+        Records that the server refused origin -> dest although origin advertised it. Only the edge is
+        dropped from the known graph (store, frontier and shortest paths); dest stays reachable through
+        any other edge into it.
+        """
+        rejected = self.rejected_edges.setdefault(origin, set())
+        if dest in rejected:
+            return
+        rejected.add(dest)
+        if origin in self.visited_states:
+            tipo, adjacents = self.visited_states[origin]
+            self.visited_states[origin] = (tipo, [(d, w) for d, w in adjacents if d != dest])
+        if origin == self.current_vertex:
+            self.adjacents = self._walkable(origin, self.adjacents)
+        self.frontier.mark_rejected(origin, dest)
+        self.shortest_paths.remove_edge(origin, dest)
 
     def eh_saida(self, vertex_id: int) -> bool:
         if vertex_id in self.visited_states:
@@ -91,186 +266,395 @@ class WebSocketLabirinto:
         return False
 
 class WebSocketMazeSolver:
-    def __init__(self, config: MazeConfig):
+    PLANNERS = ("dfs", "weighted")
+
+    def __init__(self, config: MazeConfig, visualize: bool = True, planner: str = "dfs", early_stop: bool = False,
+                 log_level=None, log_file: Optional[str] = None, pipeline: int = 1,
+                 cache: Optional[MazeCache] = None, checkpoint: Union[bool, str] = False,
+                 checkpoint_every: int = 1000, max_reconnects: int = 3, reconnect_delay: float = 0.5,
+                 connect=None, metrics: bool = False, profile: bool = False, trace_memory: bool = False,
+                 move_budget: Optional[int] = None, time_budget: Optional[float] = None,
+                 verify_path: Optional[bool] = None):
+        if planner not in self.PLANNERS:
+            raise ValueError(f"Unknown planner: {planner}")
         self.config = config
+        # log_level: silent, summary or moves (default: MAZE_LOG_LEVEL, else summary)
+        self.log = MoveLog(level=log_level, path=log_file)
+        self.pipeline = pipeline  # Moves in flight when following a route; 1 = lock-step
+        self.cache = cache  # Explored graphs of previous runs, keyed by (grupo_id, labirinto_id)
+        # Checkpoint file (True = results/maze_{id}/checkpoint.json), written every checkpoint_every moves
+        if checkpoint is True:
+            checkpoint = default_checkpoint_path(config.labirinto_id)
+        self.checkpoint_path: Optional[str] = checkpoint or None
+        self.checkpoint_every = checkpoint_every
+        self._checkpointed_at = 0
+        self.max_reconnects = max_reconnects  # Reconnect attempts after the connection drops
+        self.reconnect_delay = reconnect_delay  # First backoff delay in seconds, doubled on every attempt
+        self.reconnects = 0
+        # Opens the connection for a URL; local_maze_server.local_connector runs on a local maze instead
+        self.connect = connect or websockets.connect
+        # Phase timers, round-trip histogram and counters; with metrics=True they are written to
+        # results/maze_{id}/metrics.json and metrics.prom, and profile/trace_memory add cProfile/tracemalloc
+        self.metrics = SolverMetrics()
+        self.write_metrics = metrics
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.visualize = visualize  # Write results/maze_{id}/ files after solving
+        self.planner_mode = planner
+        self.planner = None
+        self.early_stop = early_stop  # Stop exploring once the best exit path is proven optimal
+        self.bound = None
+        # Stop exploring after this many moves / seconds and return the best exit path found so far
+        self.move_budget = move_budget
+        self.time_budget = time_budget
+        self.budget_exhausted = False
+        self._budget_origin: Optional[Tuple[int, float]] = None  # (move_count, perf_counter) at the first explore_maze
+        # Walk the hops of the final path that were only advertised, never walked: None = only once the
+        # server has refused an advertised edge, since until then every advertised edge can be trusted
+        self.verify_path = verify_path
         self.labirinto = None
+        self.path: List[int] = []
+        self.path_weight = 0.0
 
-    def find_nearest_node_with_unvisited_adjacent(self, start_vertex, visited):
-      from collections import deque
-
-      queue = deque()
-      queue.append((start_vertex, [start_vertex]))
-      visited_in_bfs = {start_vertex}
-
-      while queue:
-          current_vertex, path = queue.popleft()
-
-          # Get adjacents for current vertex
-          _, adjacents = self.labirinto.visited_states[current_vertex]
-
-          # Check if current vertex has unvisited adjacent nodes
-          unvisited_adjacents = [next_vertex for next_vertex, _ in adjacents if next_vertex not in visited]
-          if unvisited_adjacents:
-              # Found the nearest node with unvisited adjacent nodes
-              return current_vertex, path
-
-          # Enqueue adjacent nodes
-          for next_vertex, _ in adjacents:
-              if next_vertex not in visited_in_bfs:
-                  visited_in_bfs.add(next_vertex)
-                  queue.append((next_vertex, path + [next_vertex]))
+    def find_nearest_node_with_unvisited_adjacent(self, start_vertex):
+      """
+      Nearest visited vertex that still has unexplored adjacents, and the route to it.
+      Served by the labirinto's live FrontierIndex instead of a BFS over every visited state.
+      """
+      if self.bound is None:
+          return self.labirinto.frontier.nearest(start_vertex)
+      return self.labirinto.frontier.nearest(start_vertex, accept=lambda v: bool(self._open_adjacents(v)))
+
+    def _open_adjacents(self, vertex: int) -> List[int]:
+      """Unvisited adjacents of vertex, without those the exit bound has pruned"""
+      open_adjacents = self.labirinto.frontier.open_adjacents(vertex)
+      if self.bound is None or not open_adjacents:
+          return open_adjacents
+      weights = dict(self.labirinto.visited_states.edges(vertex))
+      return [dest for dest in open_adjacents if self.bound.is_promising(vertex, dest, weights[dest])]
+
+    def _next_route(self, current: int) -> List[int]:
+      """
+      Route from current to the next vertex to explore (its last vertex is unvisited).
+      Empty when the exploration is complete.
+      """
+      if self.planner is not None:
+          return self.planner.next_route(current)
+
+      # DFS: take the first unvisited adjacent, or backtrack to the nearest vertex that has one
+      unvisited_adjacents = self._open_adjacents(current)
+      if unvisited_adjacents:
+          return [current, unvisited_adjacents[0]]
+
+      target_node, path = self.find_nearest_node_with_unvisited_adjacent(current)
+      if target_node is None:
+          return []
+      return path + [self._open_adjacents(target_node)[0]]
+
+    def _unbounded_route(self, current: int) -> List[int]:
+      """_next_route as if there were no exit bound"""
+      bound, self.bound = self.bound, None
+      if self.planner is not None:
+          self.planner.bound = None
+      try:
+          return self._next_route(current)
+      finally:
+          self.bound = bound
+          if self.planner is not None:
+              self.planner.bound = bound
+
+    def best_path(self) -> Tuple[List[int], float]:
+      """Best exit path from the vertex the run started at over what is known right now, and its weight"""
+      if self.labirinto is None:
+          return [], 0.0
+      return self.labirinto.shortest_paths.best_path()
 
-      # No nodes with unvisited adjacents found
-      return None, []
+    def _moves_left(self) -> Optional[int]:
+      """Moves the budgets still allow (None = unlimited); 0 once either budget is spent"""
+      moves_at_start, started_at = self._budget_origin
+      if self.time_budget is not None and time.perf_counter() - started_at >= self.time_budget:
+          return 0
+      if self.move_budget is None:
+          return None
+      return max(0, self.move_budget - (self.labirinto.move_count - moves_at_start))
 
     async def explore_maze(self) -> None:
-      visited = set()
-      invalid_vertices = set()  # Track vertices that can't be visited
+      if self._budget_origin is None:
+          # Budgets cover the whole run, across reconnects
+          self._budget_origin = (self.labirinto.move_count, time.perf_counter())
+      if self.early_stop:
+          # Bounds are distances from where the run started (we may have moved already)
+          self.bound = ExitPathBound(self.labirinto, self.labirinto.steps_history[0])
+      if self.planner_mode == "weighted":
+          self.planner = WeightedFrontierPlanner(self.labirinto, bound=self.bound)
+
       current = self.labirinto.current_vertex
-      visited.add(current)
-      stack = [current]
 
       while True:
-          # Get adjacents for current vertex
-          _, adjacents = self.labirinto.visited_states[current]
-
-          # Find unvisited and valid adjacent nodes
-          unvisited_adjacents = [next_vertex for next_vertex, _ in adjacents
-                              if next_vertex not in visited and next_vertex not in invalid_vertices]
-
-          if unvisited_adjacents:
-              # Choose one unvisited adjacent node
-              next_vertex = unvisited_adjacents[0]
-
-              try:
-                  # Try to move to next_vertex
-                  await self.labirinto.move_to(next_vertex)
-
-                  # If successful, update state
-                  visited.add(next_vertex)
-                  stack.append(next_vertex)
-                  current = next_vertex
-              except ValueError as e:
-                  # If move fails, mark vertex as invalid and continue with next
-                  print(f"⚠️ Skipping invalid vertex {next_vertex}")
-                  invalid_vertices.add(next_vertex)
+          if self.bound is not None and self.bound.proven():
+              self.log.summary(f"\n✂️ Best exit path proven optimal (weight {self.bound.upper_bound}), stopping exploration")
+              break
+
+          moves_left = self._moves_left()
+          if moves_left == 0:
+              self.budget_exhausted = True
+              best, weight = self.best_path()
+              self.log.summary(f"\n⏱️ Exploration budget spent, best exit path so far: "
+                               f"{f'weight {weight}' if best else 'none'}")
+              break
+
+          planning_since = time.perf_counter()
+          route = self._next_route(current)
+          self.metrics.add("plan", time.perf_counter() - planning_since)
+          if not route and self.bound is not None:
+              if self.bound.refresh():
+                  # Pruning used stale distances; check again with fresh bounds
                   continue
-
+              if self.bound.lower_bound < self.bound.upper_bound:
+                  # Promising open edges are left, but only behind pruned ones (one-way edges can cut the
+                  # way back): explore the nearest pruned vertex just to get there, then prune again
+                  route = self._unbounded_route(current)
+                  self.metrics.count("repositions")
+          if not route:
+              # Exploration complete
+              break
+
+          # Move along the route; its last vertex is the unvisited target, the hops before it are known ground
+          self.metrics.count("backtrack_hops", max(0, len(route) - 2))
+          if moves_left is not None:
+              route = route[:moves_left + 1]
+          for origin, node in await self.labirinto.follow_route(route):
+              # A refused move drops that edge only; planning resumes from wherever we are
+              self.log.detail(f"⚠️ Edge {origin} -> {node} can't be walked, dropping it")
+              self.labirinto.reject_edge(origin, node)
+              self.metrics.count("rejected_edges")
+              if self.bound is not None:
+                  self.bound.invalidate()
+          current = self.labirinto.current_vertex
+
+          if self.checkpoint_path and self.labirinto.move_count - self._checkpointed_at >= self.checkpoint_every:
+              self.save_checkpoint()
+
+      self.log.summary(f"\n🧭 Exploration ({self.planner_mode}): {self.labirinto.move_count} moves, "
+            f"total weight {self.labirinto.total_weight}")
+
+    def save_checkpoint(self) -> None:
+      if self.checkpoint_path and self.labirinto is not None:
+          with self.metrics.phase("checkpoint"):
+              save_checkpoint(self.checkpoint_path, self.config.grupo_id, self.config.labirinto_id,
+                              self.labirinto.snapshot())
+          self._checkpointed_at = self.labirinto.move_count
+
+    def _attach(self, websocket, current: int, vertex_type: str, adjacents: List[Tuple[int, float]]) -> None:
+      """Sets up the labirinto for a new connection: fresh, resumed from a checkpoint, or re-anchored"""
+      if self.labirinto is None:
+          snapshot = None
+          if self.checkpoint_path:
+              snapshot = load_checkpoint(self.checkpoint_path, self.config.grupo_id, self.config.labirinto_id)
+          if snapshot is None:
+              self.labirinto = WebSocketLabirinto(websocket, current, vertex_type, adjacents, log=self.log,
+                                                  metrics=self.metrics)
           else:
-              # Find the nearest node with unvisited adjacents
-              target_node, path = self.find_nearest_node_with_unvisited_adjacent(current, visited | invalid_vertices)
-
-              if target_node is None:
-                  # Exploration complete
-                  break
-              else:
-                  # Move along the path to the target node
-                  valid_path = []
-                  for node in path[1:]:  # Skip current node
-                      try:
-                          await self.labirinto.move_to(node)
-                          valid_path.append(node)
-                      except ValueError:
-                          # If a node in path is invalid, stop here and mark it
-                          invalid_vertices.add(node)
-                          break
-
-                  if valid_path:
-                      # Update only if we successfully moved somewhere
-                      stack = path[:len(valid_path)+1]  # Include current node
-                      current = valid_path[-1]
+              self.labirinto = WebSocketLabirinto.from_snapshot(websocket, snapshot, log=self.log,
+                                                                metrics=self.metrics)
+              self.labirinto.rebind(websocket, current, vertex_type, adjacents)
+              self._checkpointed_at = self.labirinto.move_count
+              self.log.summary(f"\n💾 Resuming from checkpoint: {len(self.labirinto.visited_states)} vertices, "
+                               f"{self.labirinto.move_count} moves")
+      else:
+          self.labirinto.rebind(websocket, current, vertex_type, adjacents)
+          self.log.summary(f"\n🔌 Reconnected at vertex {current}, resuming exploration")
+      self.labirinto.pipeline_window = self.pipeline
+
+    async def _solve(self) -> Tuple[List[int], float]:
+      """Shortest path from the vertex the run started at, from the cache or by exploring"""
+      cached = await self.solve_from_cache() if self.cache is not None else None
+      if cached is not None:
+          return cached
 
-    async def find_shortest_path(self, start: int) -> Tuple[List[int], float]:
+      while True:
+          # First explore the entire maze
+          self.log.summary("\n🔍 Exploring entire maze...")
+          await self.explore_maze()
+          if self.budget_exhausted:
+              # Partial graph: the best path so far is already known, and it must not be cached as final
+              return self.best_path()
+
+          # Now find the shortest path using the complete maze information
+          self.log.summary("\n🔍 Finding shortest path...")
+          with self.metrics.phase("shortest_path"):
+              path, weight = await self.find_shortest_path(self.labirinto.steps_history[0])
+          verify = self.verify_path if self.verify_path is not None else bool(self.labirinto.rejected_edges)
+          if not (path and verify):
+              break
+          refused = sum(map(len, self.labirinto.rejected_edges.values()))
+          path, weight = await self.confirm_path(path, weight)
+          if self.bound is None or sum(map(len, self.labirinto.rejected_edges.values())) == refused:
+              break
+          # The early stop was proven with an edge that turned out not to exist: explore what it pruned
+      if path and self.cache is not None:
+          self.cache.save(self.config.grupo_id, self.config.labirinto_id, self.labirinto.visited_states,
+                          self.labirinto.entrada, self.labirinto.exits,
+                          [(origin, dest) for origin, dests in self.labirinto.rejected_edges.items()
+                           for dest in dests])
+      return path, weight
+
+    async def confirm_path(self, path: List[int], weight: float) -> Tuple[List[int], float]:
       """
-      Find shortest path to ANY exit using Dijkstra's algorithm
+      Makes sure every hop of path can be walked. The first hop never walked so far is tried (after
+      walking to its origin over known edges); a refusal drops the edge and the path is recomputed.
+      Ends with a path made of walked edges only, or [] if no exit is reachable over them.
       """
-      # Initialize distances
-      distances = {vertex: float('infinity') for vertex in self.labirinto.visited_states.keys()}
-      distances[start] = 0
-
-      # Priority queue: (distance, vertex, path_to_vertex)
-      pq = [(0, start, [start])]
-      visited = set()
-
-      # Track all paths to exits
-      exit_paths = []
-      min_exit_distance = float('infinity')
-
-      while pq:
-          current_distance, current_vertex, current_path = heapq.heappop(pq)
-
-          # Skip if we already found a better path
-          if current_distance > min_exit_distance:
-              continue
-
-          # Skip if already visited
-          if current_vertex in visited:
+      labirinto = self.labirinto
+      start = labirinto.steps_history[0]
+      while path:
+          edge = next(((a, b) for a, b in zip(path, path[1:]) if (a, b) not in labirinto.confirmed_edges), None)
+          if edge is None:
+              break
+          origin, dest = edge
+          known = len(labirinto.confirmed_edges) + sum(map(len, labirinto.rejected_edges.values()))
+          route, _ = shortest_path_to_exit(labirinto.visited_states.freeze(), labirinto.current_vertex, {origin})
+          if not route:
+              if self.bound is None or not labirinto.frontier.frontier:
+                  return [], 0.0
+              # The early stop left unexplored the only way back to origin: finish exploring without it
+              self.log.summary(f"\n🔍 Vertex {origin} is out of reach, exploring the rest of the maze")
+              self.early_stop, self.bound = False, None
+              await self.explore_maze()
               continue
+          self.metrics.count("path_checks")
+          for refused_origin, node in await labirinto.follow_route(route + [dest]):
+              labirinto.reject_edge(refused_origin, node)
+              self.metrics.count("rejected_edges")
+              if self.bound is not None:
+                  self.bound.invalidate()
+          if len(labirinto.confirmed_edges) + sum(map(len, labirinto.rejected_edges.values())) == known:
+              # Neither confirmed nor refused: the server took us elsewhere, so give up checking
+              self.log.summary(f"\n⚠️ Could not check edge {origin} -> {dest}, path left unverified")
+              break
+          with self.metrics.phase("shortest_path"):
+              path, weight = await self.find_shortest_path(start)
+      return path, weight
 
-          visited.add(current_vertex)
-
-          # If we found an exit
-          if self.labirinto.eh_saida(current_vertex):
-              exit_paths.append((current_path, current_distance))
-              min_exit_distance = min(min_exit_distance, current_distance)
-              continue  # Try other paths that might be shorter
-
-          # Get adjacents
-          _, adjacents = self.labirinto.visited_states[current_vertex]
-
-          # Explore each adjacent vertex
-          for next_vertex, weight in adjacents:
-              if next_vertex not in visited:
-                  new_distance = current_distance + weight
-
-                  # Skip if this path would be longer than best found
-                  if new_distance >= min_exit_distance:
-                      continue
-
-                  if new_distance < distances[next_vertex]:
-                      # Add this path to priority queue
-                      new_path = current_path + [next_vertex]
-                      distances[next_vertex] = new_distance
-                      heapq.heappush(pq, (new_distance, next_vertex, new_path))
-
-      # Return shortest path found (if any)
-      if exit_paths:
-          # Sort paths by distance and return the shortest
-          exit_paths.sort(key=lambda x: x[1])
-          return exit_paths[0]
+    async def find_shortest_path(self, start: int) -> Tuple[List[int], float]:
+      """
+      Find shortest path to ANY exit over the explored graph.
+      Parent-pointer Dijkstra, or Dial's bucket queue when all weights are small integers.
+      """
+      return shortest_path_to_exit(self.labirinto.visited_states.freeze(), start, self.labirinto.exits)
 
-      return [], 0.0
+    async def solve_from_cache(self) -> Optional[Tuple[List[int], float]]:
+      """
+      Walks only the shortest path of a cached graph of this maze, once the server's initial message
+      agrees with it. None when there is no usable entry or the server contradicts it on the way;
+      the entry is then dropped and the caller explores from wherever we are.
+      """
+      grupo_id, labirinto_id = self.config.grupo_id, self.config.labirinto_id
+      cached = self.cache.load(grupo_id, labirinto_id)
+      if cached is None:
+          return None
+
+      labirinto = self.labirinto
+      start = labirinto.current_vertex
+      if not matches_initial_state(cached, start, labirinto.vertex_type.value, labirinto.adjacents):
+          self.log.summary("\n🗃️ Cached graph does not match the server, exploring again")
+          self.cache.invalidate(grupo_id, labirinto_id)
+          return None
+
+      path, weight = shortest_path_to_exit(cached.graph, start, cached.exits)
+      if not path:
+          self.cache.invalidate(grupo_id, labirinto_id)
+          return None
+
+      self.log.summary(f"\n🗃️ Using cached graph ({len(cached.graph)} vertices), walking {len(path) - 1} moves")
+      refused = await labirinto.follow_route(path)
+      for origin, node in refused:
+          labirinto.reject_edge(origin, node)
+      if refused or labirinto.current_vertex != path[-1] or path[-1] not in labirinto.exits:
+          self.log.summary("\n🗃️ Server disagreed with the cached graph, exploring again")
+          self.cache.invalidate(grupo_id, labirinto_id)
+          return None
+      return path, weight
 
     async def explore(self) -> Tuple[List[int], float]:
+      profiler = None
+      if self.profile or self.trace_memory:
+          profiler = SolverProfiler(cpu=self.profile, memory=self.trace_memory)
+          profiler.start()
+      start = time.perf_counter()
+      try:
+          return await self._explore()
+      finally:
+          self.metrics.add("total", time.perf_counter() - start)
+          if profiler is not None:
+              profiler.stop()
+          if self.write_metrics or profiler is not None:
+              self.save_metrics(profiler)
+
+    def save_metrics(self, profiler: Optional[SolverProfiler] = None) -> List[str]:
+      """Writes metrics.json / metrics.prom (and any profile) next to the other results/maze_{id}/ files"""
+      labirinto = self.labirinto
+      if labirinto is not None:
+          self.metrics.counters.update(moves=labirinto.move_count, invalid_moves=labirinto.invalid_moves)
+      self.metrics.counters["reconnects"] = self.reconnects
+      extra = {"planner": self.planner_mode, "pipeline": self.pipeline, "path_weight": self.path_weight,
+               "traversed_weight": labirinto.total_weight if labirinto is not None else 0.0,
+               "explored_vertices": len(labirinto.visited_states) if labirinto is not None else 0}
+      paths = write_report(default_metrics_dir(self.config.labirinto_id), self.metrics,
+                           {"grupo": str(self.config.grupo_id), "labirinto": str(self.config.labirinto_id)},
+                           extra, profiler)
+      self.log.summary(f"📈 Metrics saved in: {', '.join(paths)}")
+      return paths
+
+    async def _explore(self) -> Tuple[List[int], float]:
       url = f"{self.config.websocket_url}{self.config.grupo_id}/{self.config.labirinto_id}"
 
-      print("\n🌐 Starting WebSocket Maze Solver")
-      print(f"📍 Connecting to: {url}")
+      self.log.summary("\n🌐 Starting WebSocket Maze Solver")
+      self.log.summary(f"📍 Connecting to: {url}")
 
       try:
-          async with websockets.connect(url) as websocket:
-              initial_message = await websocket.recv()
-              print(f"\n📩 Initial server message: {initial_message}")
-
-              current, vertex_type, adjacents = await WebSocketLabirinto.parse_server_message(initial_message)
-              self.labirinto = WebSocketLabirinto(websocket, current, vertex_type, adjacents)
-
-              # First explore the entire maze
-              print("\n🔍 Exploring entire maze...")
-              await self.explore_maze()
+          while True:
+              try:
+                  async with self.connect(url) as websocket:
+                      initial_message = await websocket.recv()
+                      self.log.summary(f"\n📩 Initial server message: {initial_message}")
+
+                      current, vertex_type, adjacents = WebSocketLabirinto.parse_server_message(initial_message)
+                      self._attach(websocket, current, vertex_type, adjacents)
+                      path, weight = await self._solve()
+                      break
+              except (websockets.exceptions.ConnectionClosed, OSError) as e:
+                  # A drop before the first initial message (e.g. unknown maze) is not worth retrying
+                  self.save_checkpoint()
+                  retryable = self.labirinto is not None or isinstance(e, OSError)
+                  if not retryable or self.reconnects >= self.max_reconnects:
+                      raise
+                  self.reconnects += 1
+                  delay = self.reconnect_delay * 2 ** (self.reconnects - 1)
+                  self.log.summary(f"\n🔌 Connection lost ({e}), reconnecting in {delay:.2f}s "
+                                   f"({self.reconnects}/{self.max_reconnects})")
+                  await asyncio.sleep(delay)
+
+          self.path, self.path_weight = path, weight
+          if self.checkpoint_path:
+              if self.budget_exhausted:
+                  # Keep what was explored so that a later run can carry on from it
+                  self.save_checkpoint()
+              else:
+                  remove_checkpoint(self.checkpoint_path)
 
-              # Now find the shortest path using the complete maze information
-              print("\n🔍 Finding shortest path...")
-              path, weight = await self.find_shortest_path(current)
+          if path:
+              self.log.summary("\n✨ Path found!")
+              self.log.summary(f"Path: {path}")
+              self.log.summary(f"Total weight: {weight}")
 
-              if path:
-                  print("\n✨ Path found!")
-                  print(f"Path: {path}")
-                  print(f"Total weight: {weight}")
+              if not self.visualize:
+                  return path, weight
 
-                  visualizer = create_visualizer(self.labirinto.visited_states, self.labirinto.entrada)
+              visualizer = create_visualizer(self.labirinto.visited_states, self.labirinto.entrada)
 
-                  # Use complete_exploration for the full path
+              # Use complete_exploration for the full path
+              with self.metrics.phase("render"):
                   print_full_maze_analysis(
                       visualizer,
                       caminho_percorrido=self.labirinto.complete_exploration,
@@ -278,18 +662,20 @@ class WebSocketMazeSolver:
                       maze_id=self.config.labirinto_id
                   )
 
-                  return path, weight
-              else:
-                  print("\n❌ No path found")
-                  return [], 0.0
+              return path, weight
+          else:
+              self.log.summary("\n❌ No path found")
+              return [], 0.0
 
       except websockets.exceptions.WebSocketException as e:
           print(f"❌ WebSocket error: {e}")
           return [], 0.0
       except Exception as e:
           print(f"❌ Unexpected error: {e}")
-          print(f"path {self.labirinto.steps_history}")
+          self.log.dump(last=50)
           raise
+      finally:
+          self.log.close()
 
 if __name__ == "__main__":
     async def main():